@@ -0,0 +1,314 @@
+import os
+import sys
+import json
+from graphqlclient import GraphQLClient
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "section_one"))
+from mutation_journal import MutationJournal, run_step
+
+# Metadata
+# File Name: manage_hhd_tasks_v1.4.py
+# Version: 1.4
+# Owner: Andrew John Holland
+# Purpose: Create and update tasks for Homelab Hardware Development (HHD) project on GitHub Project board using PMBOK 5 process groups, designed for Daily Checklist
+# Change Log (Last 4):
+#   - Version 1.4, 19-10-2026: A failed issue or item lookup stops the run instead of reading as an empty board; closed issues count as existing; issue titles are sent as variables
+#   - Version 1.3, 19-10-2026: Existing issues and board items are read across all pages, so journal recovery finds issues beyond the first 100
+#   - Version 1.2, 19-10-2026: Added write-ahead mutation journal so interrupted runs resume without duplicate or orphan issues
+#   - Version 1.1, 23-07-2025: Aligned tasks with HHD specifics, improved status mapping, configured PMBOK groups for checklist
+
+# Configuration
+GITHUB_API = "https://api.github.com/graphql"
+REPO_NAME = "silicastormsiam/homelab-hardware"
+PROJECT_ID = "PVT_kwHOCZq5ps4A-gXz"  # Verify this matches projects/4/views/1
+TOKEN = os.getenv("GITHUB_TOKEN")
+LOG_FILE = "project_log.txt"
+JOURNAL_FILE = "manage_hhd_tasks.journal.jsonl"  # Removed after a run completes; present only while work is unfinished
+
+# HHD-specific tasks mapped to PMBOK process groups
+tasks = [
+    {"title": "Project Initiation - Define Homelab Inventory Project", "pmbok_group": "Initiating"},
+    {"title": "Plan Inventory Management - Develop Homelab Inventory - Original", "pmbok_group": "Planning"},
+    {"title": "Plan Inventory Management - Develop Homelab Inventory - Skeleton", "pmbok_group": "Planning"},
+    {"title": "Implement Inventory - Update Homelab Inventory - Original", "pmbok_group": "Executing"},
+    {"title": "Implement Inventory - Update Homelab Inventory - Skeleton", "pmbok_group": "Executing"},
+    {"title": "Deploy Inventory to GitHub", "pmbok_group": "Executing"},
+    {"title": "Monitor Inventory Updates - Audit Security and Accuracy", "pmbok_group": "Monitoring and Controlling"},
+    {"title": "Control Changes - Track Inventory Revisions", "pmbok_group": "Monitoring and Controlling"},
+    {"title": "Close Inventory Project - Finalize and Document", "pmbok_group": "Closing"}
+]
+
+def get_repository_id(client, repo_name):
+    repo_query = """
+    query {
+      repository(owner: "%s", name: "%s") {
+        id
+      }
+    }
+    """ % (repo_name.split("/")[0], repo_name.split("/")[1])
+    repo_result = json.loads(client.execute(repo_query))
+    if "errors" in repo_result:
+        print(f"Error fetching repository ID: {repo_result['errors']}")
+        return None
+    return repo_result["data"]["repository"]["id"]
+
+def create_issue(client, repo_id, title, pmbok_group):
+    # Variables, so quotes or backslashes in a title cannot break the mutation
+    mutation = """
+    mutation($repositoryId: ID!, $title: String!, $body: String!) {
+      createIssue(input: {
+        repositoryId: $repositoryId,
+        title: $title,
+        body: $body
+      }) {
+        issue {
+          id
+          title
+        }
+      }
+    }
+    """
+    body = f"Task for Homelab Hardware Development (HHD) project, aligned with PMBOK {pmbok_group} process. Daily Checklist Item."
+    result = json.loads(client.execute(mutation, {"repositoryId": repo_id, "title": title, "body": body}))
+    if "errors" in result:
+        print(f"Error creating issue {title}: {result['errors']}")
+        return None
+    return result["data"]["createIssue"]["issue"]["id"]
+
+def add_issue_to_project(client, project_id, issue_id):
+    mutation = """
+    mutation {
+      addProjectV2ItemById(input: {
+        projectId: "%s",
+        contentId: "%s"
+      }) {
+        item {
+          id
+        }
+      }
+    }
+    """ % (project_id, issue_id)
+    result = json.loads(client.execute(mutation))
+    if "errors" in result:
+        print(f"Error adding issue to project: {result['errors']}")
+        return None
+    return result["data"]["addProjectV2ItemById"]["item"]["id"]
+
+def get_existing_issues(client, repo_name):
+    # Every page and closed issues too, so an issue an interrupted run created is found and never created twice.
+    # Returns None if any page fails, since a partial map would make existing tasks look missing.
+    query = """
+    query($after: String) {
+      repository(owner: "%s", name: "%s") {
+        issues(first: 100, after: $after) {
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+          nodes {
+            id
+            title
+          }
+        }
+      }
+    }
+    """ % (repo_name.split("/")[0], repo_name.split("/")[1])
+    issues = {}
+    after = None
+    while True:
+        result = json.loads(client.execute(query, {"after": after}))
+        if "errors" in result:
+            print(f"Error fetching issues: {result['errors']}")
+            return None
+        page = result["data"]["repository"]["issues"]
+        for issue in page["nodes"]:
+            issues[issue["title"]] = issue["id"]
+        if not page["pageInfo"]["hasNextPage"]:
+            return issues
+        after = page["pageInfo"]["endCursor"]
+
+def get_status_field_id(client, project_id):
+    query = """
+    query {
+      node(id: "%s") {
+        ... on ProjectV2 {
+          fields(first: 10) {
+            nodes {
+              ... on ProjectV2SingleSelectField {
+                id
+                name
+                options {
+                  id
+                  name
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    """ % project_id
+    result = json.loads(client.execute(query))
+    if "errors" in result:
+        print(f"Error fetching status field: {result['errors']}")
+        return None, None
+    fields = result.get("data", {}).get("node", {}).get("fields", {}).get("nodes", [])
+    for field in fields:
+        if field.get("name") == "Status":
+            return field["id"], {option["name"]: option["id"] for option in field["options"]}
+    print("Status field not found. Please ensure your board has a 'Status' field or adjust the script with your column names.")
+    return None, None
+
+def get_project_item_ids(client, project_id):
+    # Returns None if any page fails, like get_existing_issues
+    query = """
+    query($after: String) {
+      node(id: "%s") {
+        ... on ProjectV2 {
+          items(first: 100, after: $after) {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+            nodes {
+              id
+              content {
+                ... on Issue {
+                  title
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    """ % project_id
+    item_ids = {}
+    after = None
+    while True:
+        result = json.loads(client.execute(query, {"after": after}))
+        if "errors" in result:
+            print(f"Error fetching project items: {result['errors']}")
+            return None
+        page = result.get("data", {}).get("node", {}).get("items", {})
+        for item in page.get("nodes", []):
+            if "title" in item["content"]:
+                item_ids[item["content"]["title"]] = item["id"]
+        if not page.get("pageInfo", {}).get("hasNextPage"):
+            return item_ids
+        after = page["pageInfo"]["endCursor"]
+
+def update_task_status(client, project_id, item_id, status_field_id, status_option_id, title):
+    mutation = """
+    mutation {
+      updateProjectV2ItemFieldValue(input: {
+        projectId: "%s",
+        itemId: "%s",
+        fieldId: "%s",
+        value: { singleSelectOptionId: "%s" }
+      }) {
+        projectV2Item {
+          id
+        }
+      }
+    }
+    """ % (project_id, item_id, status_field_id, status_option_id)
+    result = json.loads(client.execute(mutation))
+    if "errors" in result:
+        print(f"Error updating status for {title}: {result['errors']}")
+        return False
+    print(f"Updated status for {title} to {status_option_id}")
+    return True
+
+def log_action(action, task_title, status=None):
+    with open(LOG_FILE, "a") as f:
+        f.write(f"{action}: {task_title} {'(Status: ' + status + ')' if status else ''} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+
+def main():
+    if not TOKEN:
+        print("Error: GITHUB_TOKEN environment variable not set. Set it with 'export GITHUB_TOKEN=your_token' before running for Daily Checklist.")
+        return
+    client = GraphQLClient(GITHUB_API)
+    client.inject_token(f"Bearer {TOKEN}")
+    journal = MutationJournal(JOURNAL_FILE)
+
+    # Fetch existing issues and board items so steps finished before a crash are recognised
+    existing_issues = get_existing_issues(client, REPO_NAME)
+    item_ids = get_project_item_ids(client, PROJECT_ID) if existing_issues is not None else None
+    if existing_issues is None or item_ids is None:
+        print("Cannot proceed: existing issues or board items could not be read, and creating tasks now could duplicate them. Run again later.")
+        journal.close()
+        return
+    print(f"Existing issues: {list(existing_issues)}")
+    print(f"Project item IDs: {item_ids}")
+    repo_id = None
+
+    # Create new issues and add to project
+    for task in tasks:
+        title = task["title"]
+        create_step = f"create_issue:{title}"
+        issue_id = journal.result(create_step) or existing_issues.get(title)
+        if issue_id and journal.was_interrupted(create_step):
+            # The issue was created but the run died before acknowledging it
+            print(f"Recovered issue created by interrupted run: {title}")
+            journal.ack(create_step, issue_id)
+        if not issue_id:
+            if not repo_id:
+                repo_id = get_repository_id(client, REPO_NAME)
+                if not repo_id:
+                    break
+            issue_id = run_step(journal, create_step, lambda: create_issue(client, repo_id, title, task["pmbok_group"]), title=title)
+            if not issue_id:
+                print(f"Failed to create issue: {title}")
+                continue
+        elif title in item_ids:
+            print(f"Skipping existing issue: {title}")
+            continue
+
+        item_id = item_ids.get(title) or run_step(journal, f"add_to_project:{title}", lambda: add_issue_to_project(client, PROJECT_ID, issue_id), issue_id=issue_id)
+        if item_id:
+            item_ids[title] = item_id
+            print(f"Created and added: {title} (PMBOK: {task['pmbok_group']})")
+            log_action("Created and added", title, task["pmbok_group"])
+        else:
+            print(f"Failed to add {title} to project")
+    journal.checkpoint()
+
+    # Update task statuses based on PMBOK group mapping
+    status_field_id, status_options = get_status_field_id(client, PROJECT_ID)
+    if not status_field_id or not status_options:
+        print("Cannot proceed: Status field ID or options not found. Please configure your board with PMBOK-compatible statuses or map them manually.")
+        journal.close()
+        return
+    print(f"Available status options: {status_options}")
+
+    # Map PMBOK groups to potential board statuses (adjust based on your board)
+    pmbok_to_board_status = {
+        "Initiating": next((k for k, v in status_options.items() if "To Do" in k), "To Do"),
+        "Planning": next((k for k, v in status_options.items() if "In Progress" in k), "In Progress"),
+        "Executing": next((k for k, v in status_options.items() if "In Progress" in k), "In Progress"),
+        "Monitoring and Controlling": next((k for k, v in status_options.items() if "In Review" in k), "In Review"),
+        "Closing": next((k for k, v in status_options.items() if "Done" in k), "Done")
+    }
+    print(f"PMBOK to board status mapping: {pmbok_to_board_status}")
+
+    for task in tasks:
+        item_id = item_ids.get(task["title"])
+        if item_id:
+            board_status = pmbok_to_board_status.get(task["pmbok_group"])
+            status_option_id = status_options.get(board_status)
+            if status_option_id:
+                status_step = f"update_status:{task['title']}:{status_option_id}"
+                if journal.result(status_step):
+                    print(f"Skipping status already updated before interruption: {task['title']}")
+                elif run_step(journal, status_step, lambda: update_task_status(client, PROJECT_ID, item_id, status_field_id, status_option_id, task["title"]), item_id=item_id):
+                    log_action("Updated status", task["title"], board_status)
+            else:
+                print(f"Status option {board_status} not found for {task['title']}")
+        else:
+            print(f"Item ID not found for {task['title']}")
+    journal.close(completed=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import os
+import json
+from graphqlclient import GraphQLClient
+from datetime import datetime
+
+# Metadata
+# File Name: assign_labels_v1.1.py
+# Version: 1.1
+# Owner: Andrew Holland
+# Purpose: Assign labels to existing issues in the GitHub repository
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Grouped labels per issue, skipped labels already applied, batched issues per aliased mutation
+#   - Version 1.0, 22-07-2025: Increased label query limit to 100 and added debug output
+
+# Configuration
+GITHUB_API = "https://api.github.com/graphql"
+REPO = "silicastormsiam/project-dashboards"
+TOKEN = os.getenv("GITHUB_TOKEN")
+log_file = "project_log.txt"
+BATCH_SIZE = 10  # Issues labelled per aliased addLabelsToLabelable request
+
+# Task definitions with labels
+tasks = [
+    {"title": "Install Python and dependencies on VPS", "label": "Section One"},
+    {"title": "Configure NGINX and SSL for cyberpunkmonk.com", "label": "Section One"},
+    {"title": "Set up cron job for sync_dashboard_v1.4.py", "label": "Section One"},
+    {"title": "Define dashboard requirements", "label": "Section Two"},
+    {"title": "Develop Plotly Dash dashboard code", "label": "Section Two"},
+    {"title": "Integrate GitHub API for data", "label": "Section Two"},
+    {"title": "Deploy dashboard on cyberpunkmonk.com", "label": "Section Two"},
+    {"title": "Define Section Three scope", "label": "Section Three"}
+]
+
+def get_label_ids():
+    if not TOKEN:
+        print("Error: GITHUB_TOKEN is not set")
+        return {}
+
+    client = GraphQLClient(GITHUB_API)
+    client.inject_token(f"Bearer {TOKEN}")
+
+    query = """
+    query {
+      repository(owner: "silicastormsiam", name: "project-dashboards") {
+        labels(first: 100) {
+          nodes {
+            id
+            name
+          }
+        }
+      }
+    }
+    """
+
+    try:
+        result = json.loads(client.execute(query))
+        if "errors" in result:
+            print(f"GraphQL errors fetching labels: {result['errors']}")
+            return {}
+        labels = result.get("data", {}).get("repository", {}).get("labels", {}).get("nodes", [])
+        label_dict = {label["name"]: label["id"] for label in labels}
+        print(f"Retrieved labels: {list(label_dict.keys())}")
+        return label_dict
+    except Exception as e:
+        print(f"Failed to fetch label IDs: {str(e)}")
+        return {}
+
+def get_issue_labels():
+    if not TOKEN:
+        print("Error: GITHUB_TOKEN is not set")
+        return {}
+
+    client = GraphQLClient(GITHUB_API)
+    client.inject_token(f"Bearer {TOKEN}")
+
+    query = """
+    query($after: String) {
+      repository(owner: "silicastormsiam", name: "project-dashboards") {
+        issues(first: 100, after: $after) {
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+          nodes {
+            id
+            title
+            labels(first: 100) {
+              nodes {
+                id
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+
+    issues = {}
+    after = None
+    try:
+        while True:
+            result = json.loads(client.execute(query, {"after": after}))
+            if "errors" in result:
+                print(f"GraphQL errors fetching issues: {result['errors']}")
+                return {}
+            page = result.get("data", {}).get("repository", {}).get("issues", {})
+            for issue in page.get("nodes", []):
+                issues[issue["title"]] = {
+                    "id": issue["id"],
+                    "label_ids": {label["id"] for label in issue.get("labels", {}).get("nodes", [])}
+                }
+            if not page.get("pageInfo", {}).get("hasNextPage"):
+                return issues
+            after = page["pageInfo"]["endCursor"]
+    except Exception as e:
+        print(f"Failed to fetch issue IDs: {str(e)}")
+        return {}
+
+def plan_label_assignments(issues, label_ids):
+    # Group every missing label per issue so each issue needs at most one mutation
+    plan = {}
+    for task in tasks:
+        issue = issues.get(task["title"])
+        label_id = label_ids.get(task["label"])
+        if not issue:
+            print(f"Issue not found: {task['title']}")
+            continue
+        if not label_id:
+            print(f"Label not found: {task['label']} for {task['title']}")
+            continue
+        if label_id in issue["label_ids"]:
+            print(f"Skipping label {task['label']} already on issue: {task['title']}")
+            continue
+        entry = plan.setdefault(issue["id"], {"title": task["title"], "label_ids": [], "labels": []})
+        if label_id not in entry["label_ids"]:
+            entry["label_ids"].append(label_id)
+            entry["labels"].append(task["label"])
+    return plan
+
+def assign_labels_batch(batch):
+    if not TOKEN:
+        print("Error: GITHUB_TOKEN is not set")
+        return []
+
+    client = GraphQLClient(GITHUB_API)
+    client.inject_token(f"Bearer {TOKEN}")
+
+    # One aliased addLabelsToLabelable per issue, all sent in a single request
+    definitions = []
+    selections = []
+    variables = {}
+    for index, (issue_id, entry) in enumerate(batch):
+        definitions.append(f"$input{index}: AddLabelsToLabelableInput!")
+        selections.append(f"i{index}: addLabelsToLabelable(input: $input{index}) {{ clientMutationId }}")
+        variables[f"input{index}"] = {"labelableId": issue_id, "labelIds": entry["label_ids"]}
+    mutation = "mutation(%s) {\n  %s\n}" % (", ".join(definitions), "\n  ".join(selections))
+
+    try:
+        result = json.loads(client.execute(mutation, variables))
+        failed = set()
+        for error in result.get("errors", []):
+            path = error.get("path") or []
+            if path:
+                failed.add(path[0])
+            print(f"GraphQL errors assigning labels: {error}")
+        data = result.get("data") or {}
+        assigned = []
+        for index, (issue_id, entry) in enumerate(batch):
+            alias = f"i{index}"
+            if alias in data and data[alias] is not None and alias not in failed:
+                print(f"Assigned labels {entry['labels']} to issue: {entry['title']}")
+                assigned.append(entry)
+        return assigned
+    except Exception as e:
+        print(f"Failed to assign labels to batch: {str(e)}")
+        return []
+
+def main():
+    label_ids = get_label_ids()
+    issues = get_issue_labels()
+    plan = list(plan_label_assignments(issues, label_ids).items())
+    if not plan:
+        print("All labels already assigned")
+        return
+
+    for start in range(0, len(plan), BATCH_SIZE):
+        for entry in assign_labels_batch(plan[start:start + BATCH_SIZE]):
+            with open(log_file, "a") as f:
+                f.write(f"Assigned labels {', '.join(entry['labels'])} to issue {entry['title']} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import os
+import json
+import threading
+from board_model import ItemTable, StringPool, CodeColumn, NumberColumn, COLUMN_TYPES, STATUS_FIELD
+from snapshot import header_schema
+
+try:
+    import pyarrow as pa
+except ImportError:
+    # Without pyarrow, dashboard workers load the gzip JSON Lines snapshot into their own ItemTable instead
+    pa = None
+
+# Metadata
+# File Name: board_arrow.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Arrow IPC copy of the board snapshot that every dashboard worker memory-maps read-only, so all processes share one physical copy of the board through the page cache
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Titles and timestamps are read through MappedStrings, decoding one value at a time from the mapped file instead of a new list per access; a file without schema metadata has no header
+#   - Version 1.0, 19-10-2026: Initial Arrow snapshot writer, MappedItemTable and hot-swapping shared_table
+
+# Configuration
+ARROW_SNAPSHOT_FILE = os.getenv("ARROW_SNAPSHOT_FILE", "board_snapshot.arrow")
+
+mapped_tables = {}  # path -> ((inode, mtime), MappedItemTable), so workers only remap after a sync publishes a new file
+mapped_lock = threading.Lock()
+
+def primitive_array(values, arrow_type):
+    # Wraps an array.array's memory without converting element by element
+    return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+
+def field_array(column):
+    if isinstance(column, CodeColumn):
+        return primitive_array(column.codes, pa.int16())
+    if isinstance(column, NumberColumn):
+        return primitive_array(column.values, pa.float64())
+    return pa.array(column.values, type=pa.string())
+
+def write_arrow_snapshot(table, header, path=ARROW_SNAPSHOT_FILE):
+    # Uncompressed, so readers map the columns instead of decoding them; written aside and renamed so a mapped reader keeps its old file intact
+    columns = {
+        "title": pa.array(table.titles, type=pa.string()),
+        "updated_at": pa.array(table.updated_at, type=pa.string()),
+        "status": primitive_array(table.status_codes, pa.uint16()),
+        # label_offsets is uint32 and list offsets int32; the bytes are the same below 2**31
+        "labels": pa.ListArray.from_arrays(primitive_array(table.label_offsets, pa.int32()), primitive_array(table.label_codes, pa.uint32()))
+    }
+    for field_id, column in table.fields.items():
+        columns[f"field:{field_id}"] = field_array(column)
+    metadata = {
+        "header": header,
+        "statuses": table.statuses.values,
+        "labels": table.labels.values,
+        # Options learned after the schema was read are only in the columns
+        "options": {field_id: column.names for field_id, column in table.fields.items() if isinstance(column, CodeColumn)}
+    }
+    batch = pa.record_batch(list(columns.values()), names=list(columns))
+    schema = batch.schema.with_metadata({key: json.dumps(value, separators=(",", ":")) for key, value in metadata.items()})
+    temp_path = f"{path}.tmp"
+    with pa.OSFile(temp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            writer.write_batch(batch)
+    os.replace(temp_path, path)
+
+def read_arrow_header(path=ARROW_SNAPSHOT_FILE):
+    try:
+        with pa.memory_map(path, "r") as source:
+            return json.loads(pa.ipc.open_file(source).schema.metadata[b"header"])
+    except (OSError, KeyError, TypeError, ValueError):
+        return None
+
+def buffer_view(array, format):
+    # The array's values as a memoryview into the mapped file; indexes and slices like the array.array it replaces
+    data = array.buffers()[1]
+    if data is None or len(array) == 0:
+        return memoryview(b"").cast(format)
+    return memoryview(data).cast(format)[array.offset:array.offset + len(array)]
+
+class MappedStrings:
+    # Read-only sequence over a mapped string column; each value is decoded from the file when read, so no worker keeps its own copy of the column
+    __slots__ = ("offsets", "data")
+
+    def __init__(self, array):
+        self.offsets = memoryview(array.buffers()[1]).cast("i")[array.offset:array.offset + len(array) + 1] if len(array) else memoryview(b"\0\0\0\0").cast("i")
+        data = array.buffers()[2]
+        self.data = memoryview(data) if data is not None else memoryview(b"")
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MappedStrings index out of range")
+        return str(self.data[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+
+    def __iter__(self):
+        offsets = self.offsets
+        data = self.data
+        for index in range(len(offsets) - 1):
+            yield str(data[offsets[index]:offsets[index + 1]], "utf-8")
+
+class MappedItemTable(ItemTable):
+    # Read-only ItemTable over a memory-mapped Arrow snapshot; titles and timestamps are decoded as they are read and never kept
+    __slots__ = ("batch", "header", "mapped_titles", "mapped_updated_at")
+
+    def __init__(self, path=ARROW_SNAPSHOT_FILE):
+        with pa.memory_map(path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            metadata = {key.decode(): json.loads(value) for key, value in reader.schema.metadata.items()}
+            self.batch = reader.get_batch(0)
+        self.header = metadata["header"]
+        self.mapped_titles = MappedStrings(self.batch.column("title"))
+        self.mapped_updated_at = MappedStrings(self.batch.column("updated_at"))
+        self.statuses = StringPool(metadata["statuses"])
+        self.status_codes = buffer_view(self.batch.column("status"), "H")
+        self.labels = StringPool(metadata["labels"])
+        labels = self.batch.column("labels")
+        self.label_offsets = buffer_view(labels.offsets, "I")
+        self.label_codes = buffer_view(labels.values, "I")
+        self.schema = header_schema(self.header)
+        self.fields = {}
+        if self.schema is not None:
+            self.fields = {field_id: COLUMN_TYPES[field["dataType"]](field) for field_id, field in self.schema.fields.items() if field["dataType"] in COLUMN_TYPES}
+        for field_id, column in self.fields.items():
+            values = self.batch.column(f"field:{field_id}")
+            if isinstance(column, CodeColumn):
+                column.codes = buffer_view(values, "h")
+                column.names = metadata["options"][field_id]
+            elif isinstance(column, NumberColumn):
+                column.values = buffer_view(values, "d")
+            else:
+                column.values = values.to_pylist()
+        status_id = self.schema.field_id(STATUS_FIELD) if self.schema is not None else None
+        self.status_column = self.fields.get(status_id) if isinstance(self.fields.get(status_id), CodeColumn) else None
+
+    @property
+    def titles(self):
+        return self.mapped_titles
+
+    @property
+    def updated_at(self):
+        return self.mapped_updated_at
+
+    def append(self, item):
+        raise TypeError("A mapped snapshot is read-only")
+
+    def __len__(self):
+        return self.batch.num_rows
+
+    def nbytes(self):
+        # Mapped bytes, shared with every other process mapping the same file
+        return self.batch.nbytes
+
+def shared_table(path=ARROW_SNAPSHOT_FILE):
+    # Remapped only when the sync job has published a new file; readers of the old one keep it until they let go
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (stat.st_ino, stat.st_mtime_ns)
+    with mapped_lock:
+        mapped = mapped_tables.get(path)
+        if mapped is None or mapped[0] != key:
+            mapped = mapped_tables[path] = (key, MappedItemTable(path))
+        return mapped[1]
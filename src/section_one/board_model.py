@@ -0,0 +1,275 @@
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+# Metadata
+# File Name: board_model.py
+# Version: 1.2
+# Owner: Andrew John Holland
+# Purpose: Compact column-oriented model of ProjectV2 items with dictionary-encoded statuses and labels, replacing per-item API dicts in the dashboard pipeline
+# Change Log (Last 4):
+#   - Version 1.2, 19-10-2026: rows_between raises TypeError for fields that are not numbers or dates
+#   - Version 1.1, 19-10-2026: Typed columns keyed by field ID for single-select, iteration, number, date and text fields, with lazy filter indexes; status read from the Status field
+#   - Version 1.0, 19-10-2026: Initial ItemTable and StringPool
+
+# Configuration
+STATUS_FIELD = "Status"
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+MISSING = float("nan")
+
+class StringPool:
+    # Dictionary encoding: each distinct string is stored once and rows hold its integer code
+    __slots__ = ("values", "codes")
+
+    def __init__(self, values=()):
+        self.values = []
+        self.codes = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        return code
+
+    def __getitem__(self, code):
+        return self.values[code]
+
+    def __len__(self):
+        return len(self.values)
+
+class FieldSchema:
+    # Field definitions of one project, as returned by graphql_queries.fields_query()
+    __slots__ = ("project_id", "fields", "ids")
+
+    def __init__(self, project_id, fields):
+        self.project_id = project_id
+        self.fields = {}
+        self.ids = {}
+        for field in fields:
+            if not field.get("id"):
+                continue
+            configuration = field.get("configuration") or {}
+            iterations = (configuration.get("iterations") or []) + (configuration.get("completedIterations") or [])
+            options = field.get("options") or [{"id": iteration["id"], "name": iteration["title"], "startDate": iteration.get("startDate")} for iteration in iterations]
+            self.fields[field["id"]] = {"id": field["id"], "name": field.get("name"), "dataType": field.get("dataType"), "options": options}
+            self.ids[field.get("name")] = field["id"]
+
+    def field_id(self, name):
+        # Accepts a field name or ID
+        return name if name in self.fields else self.ids.get(name)
+
+def parse_field_schema(result):
+    project = ((result.get("data") or {}).get("user") or {}).get("projectV2") or {}
+    return FieldSchema(project.get("id"), (project.get("fields") or {}).get("nodes") or [])
+
+def date_days(value):
+    return date.fromisoformat(value[:10]).toordinal() - EPOCH_ORDINAL
+
+class CodeColumn:
+    # Single-select and iteration values as option positions, -1 where the item has no value
+    __slots__ = ("key", "label", "names", "positions", "codes", "index")
+
+    def __init__(self, field):
+        self.key = "optionId" if field["dataType"] == "SINGLE_SELECT" else "iterationId"
+        self.label = "name" if field["dataType"] == "SINGLE_SELECT" else "title"
+        self.names = [option["name"] for option in field["options"]]
+        self.positions = {option["id"]: position for position, option in enumerate(field["options"])}
+        self.codes = array("h")
+        self.index = None
+
+    def append_missing(self):
+        self.codes.append(-1)
+        self.index = None
+
+    def set_last(self, value):
+        option_id = value.get(self.key)
+        if option_id is None:
+            return
+        position = self.positions.get(option_id)
+        if position is None:
+            # Option created after the schema was read
+            position = self.positions[option_id] = len(self.names)
+            self.names.append(value.get(self.label) or option_id)
+        self.codes[-1] = position
+
+    def value(self, row):
+        code = self.codes[row]
+        return self.names[code] if code >= 0 else None
+
+    def rows_equal(self, name):
+        if self.index is None:
+            index = {}
+            for row, code in enumerate(self.codes):
+                index.setdefault(code, array("I")).append(row)
+            self.index = index
+        position = self.names.index(name) if name in self.names else (-1 if name is None else None)
+        return self.index.get(position, array("I"))
+
+class NumberColumn:
+    # Numbers as floats and dates as days since 1970-01-01, NaN where the item has no value
+    __slots__ = ("is_date", "values", "order", "sorted_values")
+
+    def __init__(self, field):
+        self.is_date = field["dataType"] == "DATE"
+        self.values = array("d")
+        self.order = None
+        self.sorted_values = None
+
+    def append_missing(self):
+        self.values.append(MISSING)
+        self.order = None
+
+    def set_last(self, value):
+        raw = value.get("date") if self.is_date else value.get("number")
+        if raw is not None:
+            self.values[-1] = date_days(raw) if self.is_date else float(raw)
+
+    def convert(self, value):
+        return date_days(value) if self.is_date and isinstance(value, str) else value
+
+    def value(self, row):
+        number = self.values[row]
+        if number != number:
+            return None
+        return date.fromordinal(int(number) + EPOCH_ORDINAL).isoformat() if self.is_date else number
+
+    def rows_equal(self, value):
+        if value is None:
+            return array("I", (row for row, number in enumerate(self.values) if number != number))
+        return self.rows_between(value, value)
+
+    def rows_between(self, low=None, high=None):
+        # Inclusive range over a sorted index of rows with a value; None leaves that end open
+        if self.order is None:
+            values = self.values
+            self.order = array("I", sorted((row for row, number in enumerate(values) if number == number), key=values.__getitem__))
+            self.sorted_values = array("d", (values[row] for row in self.order))
+        start = 0 if low is None else bisect_left(self.sorted_values, self.convert(low))
+        end = len(self.order) if high is None else bisect_right(self.sorted_values, self.convert(high))
+        return self.order[start:end]
+
+class TextColumn:
+    __slots__ = ("values", "index")
+
+    def __init__(self, field):
+        self.values = []
+        self.index = None
+
+    def append_missing(self):
+        self.values.append(None)
+        self.index = None
+
+    def set_last(self, value):
+        if value.get("text") is not None:
+            self.values[-1] = value["text"]
+
+    def value(self, row):
+        return self.values[row]
+
+    def rows_equal(self, text):
+        if self.index is None:
+            index = {}
+            for row, value in enumerate(self.values):
+                index.setdefault(value, array("I")).append(row)
+            self.index = index
+        return self.index.get(text, array("I"))
+
+# Built-in fields (Title, Assignees, Labels, ...) have other data types and are read from the item content instead
+COLUMN_TYPES = {"SINGLE_SELECT": CodeColumn, "ITERATION": CodeColumn, "NUMBER": NumberColumn, "DATE": NumberColumn, "TEXT": TextColumn}
+
+class ItemTable:
+    # One entry per item in each column; labels are stored CSR-style, item i owning label_codes[label_offsets[i]:label_offsets[i + 1]]
+    __slots__ = ("titles", "updated_at", "statuses", "status_codes", "labels", "label_codes", "label_offsets", "schema", "fields", "status_column")
+
+    def __init__(self, schema=None):
+        self.titles = []
+        self.updated_at = []
+        self.statuses = StringPool([""])  # Code 0 is an item without a status
+        self.status_codes = array("H")
+        self.labels = StringPool()
+        self.label_codes = array("I")
+        self.label_offsets = array("I", [0])
+        # Without a schema, items carry the status query column and the first single-select name is taken as the status
+        self.schema = schema
+        self.fields = {}
+        if schema is not None:
+            self.fields = {field_id: COLUMN_TYPES[field["dataType"]](field) for field_id, field in schema.fields.items() if field["dataType"] in COLUMN_TYPES}
+        status_id = schema.field_id(STATUS_FIELD) if schema is not None else None
+        self.status_column = self.fields.get(status_id) if isinstance(self.fields.get(status_id), CodeColumn) else None
+
+    def append(self, item):
+        issue = item.get("content") or {}
+        self.titles.append(issue.get("title", ""))
+        self.updated_at.append(issue.get("updatedAt") or "")
+        if self.schema is None:
+            status = next((value["name"] for value in (item.get("fieldValues") or {}).get("nodes", []) if value.get("name")), "")
+        else:
+            fields = self.fields
+            for column in fields.values():
+                column.append_missing()
+            for value in (item.get("typedValues") or {}).get("nodes", []):
+                column = fields.get((value.get("field") or {}).get("id"))
+                if column is not None:
+                    column.set_last(value)
+            status = (self.status_column.value(-1) if self.status_column else None) or ""
+        self.status_codes.append(self.statuses.code(status))
+        for label in (issue.get("labels") or {}).get("nodes", []):
+            self.label_codes.append(self.labels.code(label["name"]))
+        self.label_offsets.append(len(self.label_codes))
+
+    def extend(self, items):
+        # Accepts any iterable, so streamed items are encoded and dropped one at a time
+        for item in items:
+            self.append(item)
+        return self
+
+    def __len__(self):
+        return len(self.titles)
+
+    def item_label_codes(self, index):
+        return self.label_codes[self.label_offsets[index]:self.label_offsets[index + 1]]
+
+    def item_labels(self, index):
+        return [self.labels[code] for code in self.item_label_codes(index)]
+
+    def status(self, index):
+        return self.statuses[self.status_codes[index]]
+
+    def column(self, field):
+        # Typed column for a field name or ID
+        column = self.fields.get(self.schema.field_id(field)) if self.schema is not None else None
+        if column is None:
+            raise KeyError(f"No typed column for field {field}")
+        return column
+
+    def field_value(self, index, field):
+        return self.column(field).value(index)
+
+    def rows_where(self, field, value):
+        # Rows whose field equals value (an option or iteration name, number, YYYY-MM-DD date or text); None matches items without a value
+        return self.column(field).rows_equal(value)
+
+    def rows_between(self, field, low=None, high=None):
+        # Only number and date fields are ordered
+        column = self.column(field)
+        if not isinstance(column, NumberColumn):
+            raise TypeError(f"Field {field} is not a number or date field, so it has no range filter")
+        return column.rows_between(low, high)
+
+    def nbytes(self):
+        # Approximate footprint of the columns, for comparing against the API dicts they replace
+        strings = sum(sys.getsizeof(value) for value in self.titles) + sum(sys.getsizeof(value) for value in self.updated_at)
+        pools = sum(sys.getsizeof(value) for value in self.statuses.values + self.labels.values)
+        lists = sys.getsizeof(self.titles) + sys.getsizeof(self.updated_at)
+        arrays = sum(column.itemsize * len(column) for column in (self.status_codes, self.label_codes, self.label_offsets))
+        for column in self.fields.values():
+            if isinstance(column, TextColumn):
+                arrays += sys.getsizeof(column.values) + sum(sys.getsizeof(value) for value in column.values if value is not None)
+            else:
+                data = column.codes if isinstance(column, CodeColumn) else column.values
+                arrays += data.itemsize * len(data)
+        return strings + pools + lists + arrays
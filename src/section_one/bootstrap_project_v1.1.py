@@ -0,0 +1,388 @@
+import sys
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from profiling import profile_main
+from graphql_transport import GraphQLTransport, TOKEN, RATE_LIMIT_FIELDS
+from project_workflows import PROJECTS, get_project_items, log_action
+
+# Metadata
+# File Name: bootstrap_project_v1.1.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Create or verify a project's GitHub repository, labels, project board, PMBOK Status field and seed tasks in one idempotent run, replacing the gh and script steps of setup_project_template_v1.6.sh
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Existing Status fields are never rewritten, since replacing their options clears every item's Status; exits 1 without a token or when a step fails
+#   - Version 1.0, 19-10-2026: Initial bootstrap with one discovery query, aliased mutation batches, concurrent independent steps and per-step timing
+
+# Configuration
+GITHUB_USER = "silicastormsiam"
+BATCH_SIZE = 20  # Aliased mutations per request; GitHub spaces requests, not the mutations inside them
+MAX_WORKERS = 4
+LABELS = [
+    {"name": "Section One", "color": "FF5733"},
+    {"name": "Section Two", "color": "33FF57"},
+    {"name": "Section Three", "color": "3357FF"}
+]
+PMBOK_OPTIONS = [
+    {"name": "Initiating", "color": "BLUE", "description": "Define project scope, create repo, set up board for dashboard."},
+    {"name": "Planning", "color": "PURPLE", "description": "Plan dashboard requirements, VPS setup, and task schedules."},
+    {"name": "Executing", "color": "YELLOW", "description": "Build VPS, code dashboard, integrate API, deploy to VPS."},
+    {"name": "Monitoring and Controlling", "color": "ORANGE", "description": "Track dashboard, verify API data, check VPS performance."},
+    {"name": "Closing", "color": "GREEN", "description": "Finalize dashboard, document, transition to andrewholland.com."}
+]
+# Section labels of the seed tasks, as assigned by assign_labels_v1.1.py
+TASK_LABELS = {
+    "Install Python and dependencies on VPS": "Section One",
+    "Configure NGINX and SSL for cyberpunkmonk.com": "Section One",
+    "Set up cron job for sync_dashboard_v1.4.py": "Section One",
+    "Define dashboard requirements": "Section Two",
+    "Develop Plotly Dash dashboard code": "Section Two",
+    "Integrate GitHub API for data": "Section Two",
+    "Deploy dashboard on cyberpunkmonk.com": "Section Two",
+    "Define Section Three scope": "Section Three"
+}
+
+STATUS_FIELD_SELECTION = """field(name: "Status") {
+          ... on ProjectV2SingleSelectField {
+            id
+            options {
+              id
+              name
+              color
+              description
+            }
+          }
+        }"""
+
+# Everything that may already exist, resolved in one request
+DISCOVERY_QUERY = """
+query($owner: String!, $name: String!) {
+  repositoryOwner(login: $owner) {
+    id
+    ... on ProjectV2Owner {
+      projectsV2(first: 100) {
+        nodes {
+          id
+          title
+          %s
+          repositories(first: 10) {
+            nodes {
+              id
+            }
+          }
+        }
+      }
+    }
+  }
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) {
+      nodes {
+        id
+        name
+      }
+    }
+  }
+%s}
+""" % (STATUS_FIELD_SELECTION, RATE_LIMIT_FIELDS)
+
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, states: OPEN, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        id
+        title
+        labels(first: 10) {
+          nodes {
+            name
+          }
+        }
+      }
+    }
+  }
+%s}
+""" % RATE_LIMIT_FIELDS
+
+CREATE_REPOSITORY_MUTATION = """
+mutation($input: CreateRepositoryInput!) {
+  createRepository(input: $input) {
+    repository {
+      id
+    }
+  }
+}
+"""
+
+CREATE_PROJECT_MUTATION = """
+mutation($input: CreateProjectV2Input!) {
+  createProjectV2(input: $input) {
+    projectV2 {
+      id
+      %s
+    }
+  }
+}
+""" % STATUS_FIELD_SELECTION
+
+LINK_PROJECT_MUTATION = """
+mutation($input: LinkProjectV2ToRepositoryInput!) {
+  linkProjectV2ToRepository(input: $input) {
+    repository {
+      id
+    }
+  }
+}
+"""
+
+FIELD_SELECTION = "{ projectV2Field { ... on ProjectV2SingleSelectField { id options { id name } } } }"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create or verify a GitHub repository and PMBOK project board with its labels and seed tasks")
+    parser.add_argument("repo", help=f"Repository as NAME or OWNER/NAME (owner defaults to {GITHUB_USER})")
+    parser.add_argument("title", help="Project board title")
+    parser.add_argument("--tasks", default="sss", choices=sorted(PROJECTS), help="Seed tasks to create on the board (default: sss)")
+    parser.add_argument("--public", action="store_true", help="Create the repository as public instead of private")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Steps run at the same time")
+    args = parser.parse_args()
+    if args.repo.count("/") > 1:
+        parser.error(f"invalid repository: {args.repo}")
+    return args
+
+def check_errors(result, action, allowed_paths=()):
+    errors = [error for error in result.get("errors", []) if tuple((error.get("path") or [])[:1]) not in allowed_paths]
+    if errors:
+        raise RuntimeError(f"{action} failed: {errors}")
+    return result.get("data") or {}
+
+def batch_mutation(transport, name, input_type, inputs, selection):
+    # One aliased mutation per input, BATCH_SIZE to a request; returns each payload, or None where GitHub rejected it
+    payloads = []
+    for start in range(0, len(inputs), BATCH_SIZE):
+        batch = inputs[start:start + BATCH_SIZE]
+        definitions = ", ".join(f"$input{index}: {input_type}!" for index in range(len(batch)))
+        selections = "\n  ".join(f"m{index}: {name}(input: $input{index}) {selection}" for index in range(len(batch)))
+        result = transport.execute("mutation(%s) {\n  %s\n}" % (definitions, selections), {f"input{index}": value for index, value in enumerate(batch)})
+        for error in result.get("errors", []):
+            print(f"GraphQL error in {name}: {error}")
+        data = result.get("data") or {}
+        payloads.extend(data.get(f"m{index}") for index in range(len(batch)))
+    return payloads
+
+def status_options(field):
+    return {option["name"]: option["id"] for option in field["options"]} if field else {}
+
+def discover(transport, state):
+    result = transport.execute(DISCOVERY_QUERY, {"owner": state["owner"], "name": state["name"]})
+    # A repository that does not exist yet is reported as an error on its own path
+    data = check_errors(result, "Discovery", allowed_paths={("repository",)})
+    owner = data.get("repositoryOwner")
+    if not owner:
+        raise RuntimeError(f"No user or organization named {state['owner']}")
+    state["owner_id"] = owner["id"]
+    repository = data.get("repository")
+    state["repo_id"] = repository["id"] if repository else None
+    state["labels"] = {label["name"].lower(): label["id"] for label in repository["labels"]["nodes"]} if repository else {}
+    project = next((project for project in owner["projectsV2"]["nodes"] if project["title"] == state["title"]), None)
+    state["project_id"] = project["id"] if project else None
+    state["status_field"] = project["field"] if project else None
+    state["linked"] = bool(project and repository and any(linked["id"] == repository["id"] for linked in project["repositories"]["nodes"]))
+    return f"repository {'found' if repository else 'missing'}, project {'found' if project else 'missing'}"
+
+def ensure_repository(transport, state):
+    if state["repo_id"]:
+        state["new_repository"] = False
+        return "exists"
+    result = transport.execute(CREATE_REPOSITORY_MUTATION, {"input": {"ownerId": state["owner_id"], "name": state["name"], "visibility": state["visibility"]}})
+    state["repo_id"] = check_errors(result, "createRepository")["createRepository"]["repository"]["id"]
+    state["new_repository"] = True
+    log_action(f"Created repository {state['owner']}/{state['name']}")
+    return f"created {state['visibility'].lower()}"
+
+def ensure_project(transport, state):
+    if state["project_id"]:
+        state["new_project"] = False
+        return "exists"
+    result = transport.execute(CREATE_PROJECT_MUTATION, {"input": {"ownerId": state["owner_id"], "title": state["title"]}})
+    project = check_errors(result, "createProjectV2")["createProjectV2"]["projectV2"]
+    state["project_id"] = project["id"]
+    state["status_field"] = project["field"]
+    state["new_project"] = True
+    log_action(f"Created project {state['title']}")
+    return "created"
+
+def ensure_labels(transport, state):
+    missing = [label for label in LABELS if label["name"].lower() not in state["labels"]]
+    inputs = [{"repositoryId": state["repo_id"], "name": label["name"], "color": label["color"]} for label in missing]
+    for label, payload in zip(missing, batch_mutation(transport, "createLabel", "CreateLabelInput", inputs, "{ label { id } }")):
+        if payload:
+            state["labels"][label["name"].lower()] = payload["label"]["id"]
+    failed = [label["name"] for label in LABELS if label["name"].lower() not in state["labels"]]
+    if failed:
+        raise RuntimeError(f"Labels not created: {', '.join(failed)}")
+    return f"{len(missing)} created, {len(LABELS) - len(missing)} existing"
+
+def ensure_status_field(transport, state):
+    field = state["status_field"]
+    current = status_options(field)
+    missing = [option for option in PMBOK_OPTIONS if option["name"] not in current]
+    if field and not missing:
+        return "PMBOK options present"
+    if field and not state["new_project"]:
+        # updateProjectV2Field replaces every option with a new ID, clearing the Status of every item on the board
+        raise RuntimeError(f"Status field is missing {', '.join(option['name'] for option in missing)}; add them under the project's Settings > Status and run again")
+    if field:
+        # A board created by this run has no items yet, so its default Todo, In Progress and Done options can be replaced
+        payload = batch_mutation(transport, "updateProjectV2Field", "UpdateProjectV2FieldInput", [{"fieldId": field["id"], "singleSelectOptions": PMBOK_OPTIONS}], FIELD_SELECTION)[0]
+        action = "PMBOK options set on new board"
+    else:
+        payload = batch_mutation(transport, "createProjectV2Field", "CreateProjectV2FieldInput", [{"projectId": state["project_id"], "dataType": "SINGLE_SELECT", "name": "Status", "singleSelectOptions": PMBOK_OPTIONS}], FIELD_SELECTION)[0]
+        action = "created"
+    if not payload:
+        raise RuntimeError("Status field not configured")
+    state["status_field"] = payload["projectV2Field"]
+    log_action(f"Configured PMBOK Status field on {state['title']}")
+    return action
+
+def link_project(transport, state):
+    if state["linked"]:
+        return "already linked"
+    result = transport.execute(LINK_PROJECT_MUTATION, {"input": {"projectId": state["project_id"], "repositoryId": state["repo_id"]}})
+    check_errors(result, "linkProjectV2ToRepository")
+    return "linked"
+
+def load_issues(transport, state):
+    state["issues"] = {}
+    if state["new_repository"]:
+        return "new repository"
+    after = None
+    while True:
+        result = transport.execute(ISSUES_QUERY, {"owner": state["owner"], "name": state["name"], "after": after})
+        page = check_errors(result, "Fetching issues")["repository"]["issues"]
+        for issue in page["nodes"]:
+            state["issues"][issue["title"]] = {"id": issue["id"], "labels": {label["name"].lower() for label in issue["labels"]["nodes"]}}
+        if not page["pageInfo"]["hasNextPage"]:
+            return f"{len(state['issues'])} open issues"
+        after = page["pageInfo"]["endCursor"]
+
+def load_items(transport, state):
+    state["items"] = {} if state["new_project"] else get_project_items(transport, state["project_id"])
+    return f"{len(state['items'])} board items"
+
+def ensure_tasks(transport, state):
+    tasks = state["tasks"]["tasks"]
+    body = state["tasks"]["issue_body"]
+    issues = state["issues"]
+    items = state["items"]
+    options = status_options(state["status_field"])
+    counts = {"created": 0, "labelled": 0, "added": 0, "updated": 0}
+
+    def label_ids(task):
+        label = TASK_LABELS.get(task["title"])
+        return [state["labels"][label.lower()]] if label else []
+
+    missing = [task for task in tasks if task["title"] not in issues]
+    inputs = [{"repositoryId": state["repo_id"], "title": task["title"], "body": body.format(status=task["status"]), "labelIds": label_ids(task)} for task in missing]
+    for task, payload in zip(missing, batch_mutation(transport, "createIssue", "CreateIssueInput", inputs, "{ issue { id } }")):
+        if payload:
+            issues[task["title"]] = {"id": payload["issue"]["id"], "labels": {TASK_LABELS[task["title"]].lower()} if task["title"] in TASK_LABELS else set()}
+            counts["created"] += 1
+            log_action(f"[bootstrap] Created issue: {task['title']}")
+
+    unlabelled = [task for task in tasks if task["title"] in issues and task["title"] in TASK_LABELS and TASK_LABELS[task["title"]].lower() not in issues[task["title"]]["labels"]]
+    inputs = [{"labelableId": issues[task["title"]]["id"], "labelIds": label_ids(task)} for task in unlabelled]
+    counts["labelled"] = sum(1 for payload in batch_mutation(transport, "addLabelsToLabelable", "AddLabelsToLabelableInput", inputs, "{ clientMutationId }") if payload)
+
+    unassigned = [task for task in tasks if task["title"] in issues and task["title"] not in items]
+    inputs = [{"projectId": state["project_id"], "contentId": issues[task["title"]]["id"]} for task in unassigned]
+    for task, payload in zip(unassigned, batch_mutation(transport, "addProjectV2ItemById", "AddProjectV2ItemByIdInput", inputs, "{ item { id } }")):
+        if payload:
+            items[task["title"]] = {"id": payload["item"]["id"], "option_id": None}
+            counts["added"] += 1
+
+    stale = [task for task in tasks if task["title"] in items and items[task["title"]]["option_id"] != options.get(task["status"])]
+    inputs = [{"projectId": state["project_id"], "itemId": items[task["title"]]["id"], "fieldId": state["status_field"]["id"], "value": {"singleSelectOptionId": options[task["status"]]}} for task in stale]
+    counts["updated"] = sum(1 for payload in batch_mutation(transport, "updateProjectV2ItemFieldValue", "UpdateProjectV2ItemFieldValueInput", inputs, "{ projectV2Item { id } }") if payload)
+
+    failed = len(missing) - counts["created"] + len(unlabelled) - counts["labelled"] + len(unassigned) - counts["added"] + len(stale) - counts["updated"]
+    summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+    if failed:
+        raise RuntimeError(f"{failed} task mutations failed ({summary}); run again to retry them")
+    return f"{summary}, {len(tasks) - len(missing)} existing"
+
+# Each step runs as soon as every step it depends on has succeeded
+STEPS = {
+    "discover": ((), discover),
+    "repository": (("discover",), ensure_repository),
+    "project": (("discover",), ensure_project),
+    "labels": (("repository",), ensure_labels),
+    "issues": (("repository",), load_issues),
+    "status_field": (("project",), ensure_status_field),
+    "board_items": (("project",), load_items),
+    "link": (("repository", "project"), link_project),
+    "tasks": (("labels", "issues", "status_field", "board_items"), ensure_tasks)
+}
+
+def timed_step(action, transport, state):
+    start = time.perf_counter()
+    try:
+        result = {"status": "done", "detail": action(transport, state)}
+    except Exception as e:
+        result = {"status": "failed", "detail": str(e)}
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def run_steps(transport, state, workers):
+    results = {}
+    running = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while len(results) < len(STEPS):
+            for name, (dependencies, action) in STEPS.items():
+                if name in results or name in running.values():
+                    continue
+                failed = [dependency for dependency in dependencies if dependency in results and results[dependency]["status"] != "done"]
+                if failed:
+                    results[name] = {"status": "skipped", "detail": f"needs {', '.join(failed)}", "seconds": 0.0}
+                elif all(dependency in results for dependency in dependencies):
+                    running[executor.submit(timed_step, action, transport, state)] = name
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    return results
+
+def print_summary(results, budget, elapsed):
+    print(f"{'Step':<14}{'Status':<9}{'Seconds':>9}  Detail")
+    for name in STEPS:
+        result = results[name]
+        print(f"{name:<14}{result['status']:<9}{result['seconds']:>9.2f}  {result['detail']}")
+    print(f"Total wall time: {elapsed:.2f}s, GraphQL requests: {budget.requests}, points used: {budget.points_used}, points remaining: {budget.remaining}")
+
+@profile_main("bootstrap_project")
+def main():
+    args = parse_args()
+    if not TOKEN:
+        print("Error: GITHUB_TOKEN is not set")
+        sys.exit(1)
+    owner, name = args.repo.split("/") if "/" in args.repo else (GITHUB_USER, args.repo)
+    transport = GraphQLTransport()
+    state = {"owner": owner, "name": name, "title": args.title, "tasks": PROJECTS[args.tasks], "visibility": "PUBLIC" if args.public else "PRIVATE"}
+
+    start = time.perf_counter()
+    results = run_steps(transport, state, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print_summary(results, transport.budget, elapsed)
+    failed = [name for name, result in results.items() if result["status"] != "done"]
+    log_action(f"bootstrap_project_v1.1.py executed for {owner}/{name} and {args.title} in {elapsed:.2f}s" + (f", incomplete: {', '.join(failed)}" if failed else ""))
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
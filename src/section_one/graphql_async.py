@@ -0,0 +1,173 @@
+import os
+import json
+import time
+import asyncio
+import threading
+from urllib.request import Request, urlopen
+import metrics
+
+try:
+    import httpx
+except ImportError:
+    # Without httpx, requests run on urllib in worker threads: the same deadlines, hedging and breaker, over HTTP/1.1
+    httpx = None
+
+try:
+    import h2
+except ImportError:
+    # httpx speaks HTTP/2 only with h2 installed; otherwise it keeps HTTP/1.1 connections alive
+    h2 = None
+
+# Metadata
+# File Name: graphql_async.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Asyncio GitHub GraphQL client over HTTP/2 with per-request deadlines, hedged queries and a circuit breaker, plus a synchronous facade with the graphqlclient interface
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial async client, circuit breaker and SyncGraphQLClient facade
+
+# Configuration
+GITHUB_API = os.getenv("GITHUB_API", "https://api.github.com/graphql")
+REQUEST_DEADLINE = float(os.getenv("GITHUB_TIMEOUT", "30"))  # Seconds a call may take, hedges included
+HEDGE_DELAY = float(os.getenv("GITHUB_HEDGE_DELAY", "0"))  # Seconds before a slow query is raced against a duplicate; 0 disables, as each hedge costs rate-limit points
+MAX_HEDGES = 1
+BREAKER_FAILURES = 5  # Consecutive failures that open the circuit
+BREAKER_RESET = 30.0  # Seconds the circuit stays open before one trial request is let through
+
+loop_lock = threading.Lock()
+shared_loop = None  # (pid, loop) running every SyncGraphQLClient call in this process
+http_clients = {}  # event loop -> httpx.AsyncClient, so every client on a loop shares its HTTP/2 connections
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+def server_fault(error):
+    # Timeouts, connection errors, 5xx and 429 mean GitHub is struggling; other 4xx mean the request itself was wrong
+    status = getattr(getattr(error, "response", None), "status_code", None) or getattr(error, "code", None)
+    return not isinstance(status, int) or status >= 500 or status == 429
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=BREAKER_FAILURES, reset_timeout=BREAKER_RESET):
+        self.lock = threading.Lock()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if remaining <= 0 and not self.probing:
+                self.probing = True
+                return
+        metrics.graphql_circuit_rejections.inc()
+        raise CircuitOpenError(f"GitHub API circuit open after {self.failures} consecutive failures; next attempt in {max(remaining, 0):.0f}s")
+
+    def record(self, error=None):
+        with self.lock:
+            self.probing = False
+            if error is None or not server_fault(error):
+                self.failures = 0
+                self.opened_at = None
+                return
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+# GitHub's health is the same for every client in a process
+github_breaker = CircuitBreaker()
+
+class AsyncGraphQLClient:
+    def __init__(self, api=GITHUB_API, deadline=REQUEST_DEADLINE, hedge_delay=HEDGE_DELAY, breaker=None):
+        self.api = api
+        self.deadline = deadline
+        self.hedge_delay = hedge_delay
+        self.breaker = breaker or github_breaker
+        self.headers = {"Accept": "application/json", "Content-Type": "application/json"}
+
+    def inject_token(self, token, headername="Authorization"):
+        self.headers[headername] = token
+
+    def send_blocking(self, body):
+        with urlopen(Request(self.api, body, self.headers), timeout=self.deadline) as response:
+            return response.read().decode("utf-8")
+
+    async def send(self, body):
+        if httpx is None:
+            return await asyncio.to_thread(self.send_blocking, body)
+        # An httpx client belongs to the loop it was created on, e.g. not to a forked worker's new loop
+        loop = asyncio.get_running_loop()
+        http = http_clients.get(loop)
+        if http is None:
+            http = http_clients[loop] = httpx.AsyncClient(http2=h2 is not None)
+        response = await http.post(self.api, content=body, headers=self.headers, timeout=self.deadline)
+        response.raise_for_status()
+        return response.text
+
+    async def hedged(self, body):
+        # Queries are idempotent, so a slow or failed attempt is raced against a duplicate; the first answer wins
+        pending = {asyncio.ensure_future(self.send(body))}
+        hedges = 0
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, timeout=self.hedge_delay if hedges < MAX_HEDGES else None, return_when=asyncio.FIRST_COMPLETED)
+                error = None
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                if error is not None and not server_fault(error):
+                    raise error
+                if pending and done:
+                    continue
+                if hedges >= MAX_HEDGES:
+                    raise error
+                hedges += 1
+                metrics.graphql_hedges.inc()
+                pending.add(asyncio.ensure_future(self.send(body)))
+        finally:
+            # Losing attempts are cancelled, and their errors collected so asyncio does not report them as unhandled
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    async def execute_async(self, query, variables=None):
+        # Returns the response body as text, like graphqlclient
+        self.breaker.allow()
+        body = json.dumps({"query": query, "variables": variables}).encode()
+        hedge = self.hedge_delay > 0 and not query.lstrip().startswith("mutation")
+        try:
+            text = await asyncio.wait_for(self.hedged(body) if hedge else self.send(body), self.deadline)
+        except asyncio.TimeoutError:
+            error = TimeoutError(f"GitHub did not answer within {self.deadline:g}s")
+            self.breaker.record(error)
+            raise error from None
+        except Exception as e:
+            self.breaker.record(e)
+            raise
+        self.breaker.record()
+        return text
+
+def background_loop():
+    # Calls from every thread run on one loop, so they share connections; a forked worker starts its own
+    global shared_loop
+    with loop_lock:
+        if shared_loop is None or shared_loop[0] != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="graphql-async", daemon=True).start()
+            shared_loop = (os.getpid(), loop)
+        return shared_loop[1]
+
+class SyncGraphQLClient:
+    # Same interface as graphqlclient.GraphQLClient, so a script adopts it by changing the import
+    def __init__(self, endpoint=GITHUB_API, deadline=REQUEST_DEADLINE, hedge_delay=HEDGE_DELAY, breaker=None):
+        self.client = AsyncGraphQLClient(endpoint, deadline, hedge_delay, breaker)
+
+    def inject_token(self, token, headername="Authorization"):
+        self.client.inject_token(token, headername)
+
+    def execute(self, query, variables=None):
+        return asyncio.run_coroutine_threadsafe(self.client.execute_async(query, variables), background_loop()).result()
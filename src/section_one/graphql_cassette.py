@@ -0,0 +1,149 @@
+import os
+import re
+import gzip
+import json
+import time
+import atexit
+import zlib
+import hashlib
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    # Without flock (Windows), appends from one process are still whole; processes recording to one path should use their own
+    fcntl = None
+
+# Metadata
+# File Name: graphql_cassette.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Record GitHub GraphQL request/response pairs to gzipped cassette files and replay them offline, so performance changes can be measured without network access
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Each exchange is appended as its own gzip member under a file lock, so processes recording to one path keep each other's exchanges and a killed recorder's cassette still replays
+#   - Version 1.0, 19-10-2026: Initial recorder and player with token scrubbing and scaled replay latency
+
+# Configuration
+CASSETTE_MODE = os.getenv("GRAPHQL_CASSETTE_MODE", "")  # "record", "replay" or empty for live traffic
+CASSETTE_PATH = os.getenv("GRAPHQL_CASSETTE", "graphql_cassette.jsonl.gz")
+LATENCY_SCALE = float(os.getenv("GRAPHQL_CASSETTE_LATENCY_SCALE", "1.0"))  # 0 replays as fast as possible
+TOKEN_PATTERN = re.compile(r"\b(gh[pousr]_[A-Za-z0-9]{20,}|github_pat_[A-Za-z0-9_]{20,})\b")
+SCRUBBED = "[SCRUBBED]"
+open_cassettes = {}
+open_lock = threading.Lock()
+
+class CassetteMiss(RuntimeError):
+    pass
+
+def request_key(query, variables):
+    # Whitespace differences between script versions should not break replay
+    normalized = " ".join(query.split())
+    return hashlib.sha256(f"{normalized}\n{json.dumps(variables or {}, sort_keys=True)}".encode()).hexdigest()
+
+def scrub(text, token=None):
+    if token:
+        text = text.replace(token, SCRUBBED)
+    return TOKEN_PATTERN.sub(SCRUBBED, text)
+
+class CassetteWriter:
+    def __init__(self, path=CASSETTE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        # Appended rather than truncated, so every process recording to the same path keeps its exchanges; remove the file to start a new recording
+        self.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self.count = 0
+        print(f"Recording GraphQL traffic to {path}")
+        atexit.register(self.close)
+
+    def write(self, line):
+        # A complete gzip member per exchange: a killed process leaves every earlier exchange readable and at most one cut-off member
+        member = memoryview(gzip.compress((line + "\n").encode("utf-8")))
+        with self.lock:
+            if fcntl:
+                fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                while member:
+                    member = member[os.write(self.fd, member):]
+            finally:
+                if fcntl:
+                    fcntl.flock(self.fd, fcntl.LOCK_UN)
+            self.count += 1
+
+    def close(self):
+        with self.lock:
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+                print(f"Recorded {self.count} GraphQL exchanges to {self.path}")
+
+class CassetteRecorder:
+    def __init__(self, client, writer, token=None):
+        self.client = client
+        self.writer = writer
+        self.token = token
+
+    def execute(self, query, variables=None):
+        start = time.perf_counter()
+        raw = self.client.execute(query, variables)
+        latency = time.perf_counter() - start
+        record = {
+            "key": request_key(query, variables),
+            "query": query,
+            "variables": variables,
+            "latency": round(latency, 6),
+            "response": raw
+        }
+        self.writer.write(scrub(json.dumps(record), self.token))
+        return raw
+
+class CassettePlayer:
+    def __init__(self, path=CASSETTE_PATH, latency_scale=LATENCY_SCALE):
+        self.path = path
+        self.latency_scale = latency_scale
+        self.lock = threading.Lock()
+        self.exchanges = {}
+        self.served = {}
+        count = 0
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    record = json.loads(line)
+                    self.exchanges.setdefault(record["key"], []).append(record)
+                    count += 1
+            except (EOFError, zlib.error, gzip.BadGzipFile) as e:
+                # A recorder killed mid-write cuts off only the exchange it was writing
+                print(f"Cassette {path} ends in an incomplete exchange, replaying the {count} complete ones: {str(e)}")
+        print(f"Replaying GraphQL traffic from {path}")
+
+    def inject_token(self, token):
+        pass
+
+    def execute(self, query, variables=None):
+        key = request_key(query, variables)
+        with self.lock:
+            records = self.exchanges.get(key)
+            if not records:
+                raise CassetteMiss(f"No recorded response in {self.path} for query {' '.join(query.split())[:80]!r} with variables {variables}")
+            # Repeated identical requests are served in recorded order, so reads before and after a mutation differ; the last one repeats
+            index = self.served.get(key, 0)
+            self.served[key] = index + 1
+            record = records[min(index, len(records) - 1)]
+        if self.latency_scale > 0:
+            time.sleep(record["latency"] * self.latency_scale)
+        return record["response"]
+
+def shared_cassette(path, factory):
+    # Scripts create several transports per run; they must share one file and one replay position
+    with open_lock:
+        if path not in open_cassettes:
+            open_cassettes[path] = factory(path)
+        return open_cassettes[path]
+
+def cassette_client(client, token=None, mode=CASSETTE_MODE, path=CASSETTE_PATH):
+    if mode == "record":
+        return CassetteRecorder(client, shared_cassette(path, CassetteWriter), token)
+    if mode == "replay":
+        return shared_cassette(path, CassettePlayer)
+    return client
@@ -0,0 +1,152 @@
+import threading
+
+# Metadata
+# File Name: graphql_queries.py
+# Version: 1.2
+# Owner: Andrew John Holland
+# Purpose: Build ProjectV2 item queries that select only the columns a consumer declares, and keep every compiled document in a registry for reuse
+# Change Log (Last 4):
+#   - Version 1.2, 19-10-2026: Added nodes_query to fetch columns for a batch of item IDs, e.g. bodies of changed items only
+#   - Version 1.1, 19-10-2026: Added the fields column with typed values keyed by field ID, and fields_query for discovering a project's field schema
+#   - Version 1.0, 19-10-2026: Initial column-driven items query builder with a persisted query registry
+
+# Configuration
+LABELS_PER_ITEM = 10
+FIELD_VALUES_PER_ITEM = 10
+FIELDS_PER_PROJECT = 50  # GitHub's limit on fields in one project, so every value of an item fits in one page
+FIELD_ID_SELECTION = {"field": {"... on ProjectV2FieldCommon": {"id": None}}}
+
+# Each column maps to the smallest selection tree that provides it; trees of the requested columns are merged
+COLUMN_SELECTIONS = {
+    "id": {"id": None},
+    "title": {"content": {"... on Issue": {"title": None}}},
+    "body": {"content": {"... on Issue": {"body": None}}},
+    "labels": {"content": {"... on Issue": {f"labels(first: {LABELS_PER_ITEM})": {"nodes": {"name": None}}}}},
+    "updatedAt": {"content": {"... on Issue": {"updatedAt": None}}},
+    "status": {f"fieldValues(first: {FIELD_VALUES_PER_ITEM})": {"nodes": {"... on ProjectV2ItemFieldSingleSelectValue": {"name": None}}}},
+    # Aliased so it can be selected alongside status; names and titles cover options added after the schema was read
+    "fields": {f"typedValues: fieldValues(first: {FIELDS_PER_PROJECT})": {"nodes": {
+        "... on ProjectV2ItemFieldSingleSelectValue": {"optionId": None, "name": None, **FIELD_ID_SELECTION},
+        "... on ProjectV2ItemFieldIterationValue": {"iterationId": None, "title": None, **FIELD_ID_SELECTION},
+        "... on ProjectV2ItemFieldNumberValue": {"number": None, **FIELD_ID_SELECTION},
+        "... on ProjectV2ItemFieldDateValue": {"date": None, **FIELD_ID_SELECTION},
+        "... on ProjectV2ItemFieldTextValue": {"text": None, **FIELD_ID_SELECTION}
+    }}}
+}
+
+RATE_LIMIT_SELECTION = {"rateLimit": {"cost": None, "remaining": None, "resetAt": None}}
+
+ITERATION_SELECTION = {"id": None, "title": None, "startDate": None}
+FIELDS_SELECTION = {
+    "... on ProjectV2FieldCommon": {"id": None, "name": None, "dataType": None},
+    "... on ProjectV2SingleSelectField": {"options": {"id": None, "name": None}},
+    "... on ProjectV2IterationField": {"configuration": {"iterations": ITERATION_SELECTION, "completedIterations": ITERATION_SELECTION}}
+}
+
+# pageInfo goes before nodes so readers can take the cursor from the head of the raw response
+ITEMS_TEMPLATE = """query %s($login: String!, $number: Int!, $first: Int!, $after: String) {
+  user(login: $login) {
+    projectV2(number: $number) {
+      items(first: $first, after: $after) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+%s
+        }
+      }
+    }
+  }
+%s}
+"""
+
+NODES_TEMPLATE = """query %s($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on ProjectV2Item {
+%s
+    }
+  }
+%s}
+"""
+
+FIELDS_TEMPLATE = """query ProjectFields($login: String!, $number: Int!) {
+  user(login: $login) {
+    projectV2(number: $number) {
+      id
+      fields(first: %d) {
+        nodes {
+%s
+        }
+      }
+    }
+  }
+}
+"""
+
+registry = {}
+registry_lock = threading.Lock()
+
+def merge_selections(target, source):
+    for key, child in source.items():
+        if child is None:
+            target.setdefault(key, None)
+        else:
+            merge_selections(target.setdefault(key, {}), child)
+    return target
+
+def render_selections(selections, indent):
+    lines = []
+    for key, child in selections.items():
+        if child is None:
+            lines.append(f"{' ' * indent}{key}")
+        else:
+            lines.append(f"{' ' * indent}{key} {{")
+            lines.extend(render_selections(child, indent + 2))
+            lines.append(f"{' ' * indent}}}")
+    return lines
+
+def build_query(template, prefix, columns, rate_limit, indent):
+    unknown = [column for column in columns if column not in COLUMN_SELECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown item columns: {', '.join(unknown)}")
+    selections = {}
+    for column in columns:
+        merge_selections(selections, COLUMN_SELECTIONS[column])
+    name = prefix + "_".join(columns)
+    nodes = "\n".join(render_selections(selections, indent))
+    extra = "\n".join(render_selections(RATE_LIMIT_SELECTION, 2)) + "\n" if rate_limit else ""
+    return template % (name, nodes, extra)
+
+def build_items_query(columns, rate_limit=False):
+    return build_query(ITEMS_TEMPLATE, "ProjectItems_", columns, rate_limit, 10)
+
+def items_query(columns, rate_limit=False):
+    # Compiled once per column set and process; callers pass values as variables, never by formatting
+    key = ("items", tuple(sorted(columns)), rate_limit)
+    document = registry.get(key)
+    if document is None:
+        with registry_lock:
+            document = registry.setdefault(key, build_items_query(sorted(columns), rate_limit))
+    return document
+
+def nodes_query(columns, rate_limit=False):
+    key = ("nodes", tuple(sorted(columns)), rate_limit)
+    document = registry.get(key)
+    if document is None:
+        with registry_lock:
+            document = registry.setdefault(key, build_query(NODES_TEMPLATE, "ProjectItemNodes_", sorted(columns), rate_limit, 6))
+    return document
+
+def items_variables(login, number, first=100, after=None):
+    return {"login": login, "number": int(number), "first": first, "after": after}
+
+def fields_query():
+    document = registry.get(("fields",))
+    if document is None:
+        with registry_lock:
+            document = registry.setdefault(("fields",), FIELDS_TEMPLATE % (FIELDS_PER_PROJECT, "\n".join(render_selections(FIELDS_SELECTION, 10))))
+    return document
+
+def fields_variables(login, number):
+    return {"login": login, "number": int(number)}
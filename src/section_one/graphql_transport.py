@@ -0,0 +1,319 @@
+import io
+import os
+import json
+import time
+import hashlib
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from urllib.request import Request, urlopen
+from graphql_async import SyncGraphQLClient, github_breaker
+from single_flight import SingleFlight
+import metrics
+from graphql_cassette import cassette_client, CASSETTE_MODE, LATENCY_SCALE
+
+try:
+    import ijson
+except ImportError:
+    # Without ijson, streamed responses are decoded with one json.load per page
+    ijson = None
+
+# Metadata
+# File Name: graphql_transport.py
+# Version: 1.9
+# Owner: Andrew John Holland
+# Purpose: Shared GitHub GraphQL transport, ID cache and rate-limit budget for scripts that manage several project boards in one process
+# Change Log (Last 4):
+#   - Version 1.9, 19-10-2026: Streamed queries are charged to the budget and cost metric from the rateLimit NodeStream reads, like execute()
+#   - Version 1.8, 19-10-2026: A shared stream() is decoded from the socket by its leader while the callers sharing it wait for a copy, so coalescing no longer buffers the leader's page
+#   - Version 1.7, 19-10-2026: Shared queries go through the async client and are handed to waiting threads in memory instead of a spool file
+#   - Version 1.6, 19-10-2026: Identical concurrent queries share one request across threads and processes through single_flight.py
+
+# Configuration
+GITHUB_API = os.getenv("GITHUB_API", "https://api.github.com/graphql")
+TOKEN = os.getenv("GITHUB_TOKEN")
+MAX_CONCURRENT_REQUESTS = 4  # GitHub secondary limits punish wide fan-out
+MIN_REMAINING_POINTS = 100  # Pause until reset once the hourly budget drops below this
+MUTATION_INTERVAL = 1.0  # Seconds between mutations, as recommended by GitHub
+REQUEST_TIMEOUT = float(os.getenv("GITHUB_TIMEOUT", "30"))  # Seconds without data before a streamed request fails
+COALESCE_QUERIES = os.getenv("GRAPHQL_COALESCE", "1") != "0"  # Share identical in-flight queries; mutations never are
+if CASSETTE_MODE == "replay":
+    # No GitHub limits apply to a replay, so mutation spacing scales like the replayed latency
+    MUTATION_INTERVAL *= LATENCY_SCALE
+
+single_flight = SingleFlight()  # Shared by every transport in the process
+
+RATE_LIMIT_FIELDS = """
+      rateLimit {
+        cost
+        remaining
+        resetAt
+      }
+"""
+
+class RateLimitBudget:
+    def __init__(self, max_concurrent=MAX_CONCURRENT_REQUESTS, min_remaining=MIN_REMAINING_POINTS, mutation_interval=MUTATION_INTERVAL):
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.lock = threading.Lock()
+        self.min_remaining = min_remaining
+        self.mutation_interval = mutation_interval
+        self.remaining = None
+        self.reset_at = None
+        self.points_used = 0
+        self.requests = 0
+        self.next_mutation_at = 0.0
+
+    def acquire(self, mutation=False):
+        self.slots.acquire()
+        with self.lock:
+            wait = 0.0
+            if self.remaining is not None and self.remaining < self.min_remaining and self.reset_at:
+                wait = max(0.0, self.reset_at - time.time())
+            if mutation:
+                now = time.monotonic()
+                start = max(now + wait, self.next_mutation_at)
+                self.next_mutation_at = start + self.mutation_interval
+                wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def release(self):
+        self.slots.release()
+
+    def record(self, rate_limit):
+        with self.lock:
+            self.requests += 1
+            if not rate_limit:
+                return
+            self.points_used += rate_limit.get("cost") or 0
+            if rate_limit.get("remaining") is not None:
+                self.remaining = rate_limit["remaining"]
+            if rate_limit.get("resetAt"):
+                self.reset_at = datetime.strptime(rate_limit["resetAt"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+
+class IdCache:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+        self.loading = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key, loader):
+        with self.lock:
+            if key in self.values:
+                self.hits += 1
+                metrics.record_cache("id", True)
+                return self.values[key]
+            key_lock = self.loading.setdefault(key, threading.Lock())
+        # Only one thread resolves a given key; the others wait and reuse its answer
+        with key_lock:
+            with self.lock:
+                if key in self.values:
+                    self.hits += 1
+                    metrics.record_cache("id", True)
+                    return self.values[key]
+                self.misses += 1
+                metrics.record_cache("id", False)
+            value = loader()
+            if value is not None:
+                with self.lock:
+                    self.values[key] = value
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.values[key] = value
+
+    def invalidate(self, key):
+        with self.lock:
+            self.values.pop(key, None)
+
+class CountingReader:
+    def __init__(self, body):
+        self.body = body
+        self.bytes = 0
+
+    def read(self, size=-1):
+        data = self.body.read(size)
+        self.bytes += len(data)
+        return data
+
+def build_object(events, event, value):
+    # Rebuilds one JSON value from ijson events, leaving the event stream positioned right after it
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1
+    for _, event, value in events:
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return builder.value
+
+class StreamBody:
+    # The response stream() hands out; NodeStream fills in rate_limit, which the transport records once the caller is done
+    def __init__(self, body):
+        self.body = body
+        self.rate_limit = None
+
+    def read(self, size=-1):
+        return self.body.read(size)
+
+class NodeStream:
+    # Iterates the nodes of the connection at path (e.g. "data.user.projectV2.items"); pageInfo, errors and rateLimit are filled in as they are read
+    def __init__(self, body, path):
+        self.body = body
+        self.path = path
+        self.page_info = {}
+        self.errors = []
+        self.rate_limit = None
+
+    def __iter__(self):
+        return self.iter_events() if ijson else self.iter_loaded()
+
+    def iter_loaded(self):
+        result = json.load(self.body)
+        self.errors = result.get("errors") or []
+        connection = result
+        for key in self.path.split("."):
+            connection = (connection or {}).get(key)
+        connection = connection or {}
+        self.page_info = connection.get("pageInfo") or {}
+        self.keep_rate_limit((result.get("data") or {}).get("rateLimit"))
+        yield from connection.get("nodes") or []
+
+    def iter_events(self):
+        page_prefix = f"{self.path}.pageInfo."
+        nodes_prefix = f"{self.path}.nodes.item"
+        events = ijson.parse(self.body, use_float=True)
+        for prefix, event, value in events:
+            if prefix == nodes_prefix and event == "start_map":
+                yield build_object(events, event, value)
+            elif prefix.startswith(page_prefix) and event not in ("start_map", "map_key", "end_map"):
+                self.page_info[prefix[len(page_prefix):]] = value
+            elif prefix == "errors.item" and event == "start_map":
+                self.errors.append(build_object(events, event, value))
+            elif prefix == "data.rateLimit" and event == "start_map":
+                self.keep_rate_limit(build_object(events, event, value))
+
+    def keep_rate_limit(self, rate_limit):
+        self.rate_limit = rate_limit
+        if isinstance(self.body, StreamBody):
+            self.body.rate_limit = rate_limit
+
+class GraphQLTransport:
+    def __init__(self, token=TOKEN, api=GITHUB_API, budget=None, timeout=REQUEST_TIMEOUT):
+        self.api = api
+        self.token = token
+        self.timeout = timeout
+        client = SyncGraphQLClient(api, deadline=timeout)
+        client.inject_token(f"Bearer {token}")
+        self.client = cassette_client(client, token)
+        self.budget = budget or RateLimitBudget()
+
+    def coalesced(self, query, variables):
+        # Replays and mutations always go out on their own
+        return COALESCE_QUERIES and not CASSETTE_MODE and not query.lstrip().startswith("mutation")
+
+    def request_key(self, query, variables):
+        # Same query up to whitespace, same variables and same token; results are never shared between tokens
+        normalized = json.dumps([" ".join(query.split()), variables, self.token], sort_keys=True)
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def execute_raw(self, query, variables=None):
+        # Returns the undecoded body for callers that decode in their own stage
+        return self.request(query, variables)[0]
+
+    def request(self, query, variables=None):
+        # Returns (body, shared), where shared means another caller's request produced the body
+        if self.coalesced(query, variables):
+            body, shared = single_flight.run(self.request_key(query, variables), lambda: self.send(query, variables).encode())
+            return body.decode("utf-8"), shared
+        return self.send(query, variables), False
+
+    def send(self, query, variables=None):
+        operation = "mutation" if query.lstrip().startswith("mutation") else "query"
+        self.budget.acquire(mutation=operation == "mutation")
+        start = time.perf_counter()
+        try:
+            raw = self.client.execute(query, variables)
+        except Exception:
+            metrics.graphql_errors.inc(operation=operation)
+            raise
+        finally:
+            metrics.graphql_latency.observe(time.perf_counter() - start, operation=operation)
+            self.budget.release()
+        metrics.graphql_response_bytes.observe(len(raw), operation=operation)
+        return raw
+
+    @contextmanager
+    def stream(self, query, variables=None):
+        # Yields a file-like response body that is read while it arrives instead of as one string
+        operation = "mutation" if query.lstrip().startswith("mutation") else "query"
+        if not self.coalesced(query, variables):
+            with self.direct_stream(query, variables) as body:
+                body = StreamBody(body)
+                yield body
+            self.record_rate_limit(operation, body.rate_limit)
+            return
+        # The leader decodes the response as it arrives; callers sharing the request read the copy it leaves behind
+        with single_flight.stream(self.request_key(query, variables), lambda: self.direct_stream(query, variables)) as (body, shared):
+            body = StreamBody(body)
+            yield body
+        if not shared:
+            # The points were charged to the caller that sent the request
+            self.record_rate_limit(operation, body.rate_limit)
+
+    @contextmanager
+    def direct_stream(self, query, variables=None):
+        operation = "mutation" if query.lstrip().startswith("mutation") else "query"
+        self.budget.acquire(mutation=operation == "mutation")
+        start = time.perf_counter()
+        response = None
+        try:
+            if CASSETTE_MODE:
+                body = CountingReader(io.BytesIO(self.client.execute(query, variables).encode()))
+            else:
+                github_breaker.allow()
+                request = Request(self.api, json.dumps({"query": query, "variables": variables}).encode(), {
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.token}"
+                })
+                try:
+                    response = urlopen(request, timeout=self.timeout)
+                except Exception as e:
+                    github_breaker.record(e)
+                    raise
+                github_breaker.record()
+                body = CountingReader(response)
+            yield body
+        except Exception:
+            metrics.graphql_errors.inc(operation=operation)
+            raise
+        finally:
+            if response is not None:
+                response.close()
+            metrics.graphql_latency.observe(time.perf_counter() - start, operation=operation)
+            self.budget.release()
+        metrics.graphql_response_bytes.observe(body.bytes, operation=operation)
+
+    def execute(self, query, variables=None):
+        operation = "mutation" if query.lstrip().startswith("mutation") else "query"
+        raw, shared = self.request(query, variables)
+        result = json.loads(raw)
+        if "errors" in result:
+            metrics.graphql_errors.inc(operation=operation)
+        rate_limit = (result.get("data") or {}).get("rateLimit")
+        if not shared:
+            # Otherwise the points were charged to the caller that sent the request
+            self.record_rate_limit(operation, rate_limit)
+        return result
+
+    def record_rate_limit(self, operation, rate_limit):
+        if rate_limit and rate_limit.get("cost") is not None:
+            metrics.graphql_cost.observe(rate_limit["cost"], operation=operation)
+        self.budget.record(rate_limit)
@@ -0,0 +1,198 @@
+import os
+import json
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+
+# Metadata
+# File Name: metrics.py
+# Version: 1.3
+# Owner: Andrew John Holland
+# Purpose: Prometheus-style counters, gauges and histograms shared by the dashboard /metrics endpoint and the CLI scripts' metrics files
+# Change Log (Last 4):
+#   - Version 1.3, 19-10-2026: Added a gauge of the dashboard's warm start duration
+#   - Version 1.2, 19-10-2026: Added a counter of GitHub requests answered by another caller's in-flight request
+#   - Version 1.1, 19-10-2026: Added hedged request and circuit breaker rejection counters
+#   - Version 1.0, 19-10-2026: Initial registry with text exposition, atexit metrics files and sync status tracking
+
+# Configuration
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+BYTES_BUCKETS = [1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216]
+COST_BUCKETS = [1, 2, 5, 10, 25, 50, 100, 250, 500]
+LAG_BUCKETS = [60, 300, 900, 1800, 3600, 7200, 21600, 43200, 86400, 172800]
+SYNC_STATUS_FILE = os.getenv("SYNC_STATUS_FILE", "sync_status.json")
+
+def format_labels(names, values, extra=None):
+    pairs = list(zip(names, values)) + (extra or [])
+    if not pairs:
+        return ""
+    escaped = ",".join(f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for name, value in pairs)
+    return "{" + escaped + "}"
+
+def format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self.lock = threading.Lock()
+        self.series = {}
+
+    def key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        with self.lock:
+            self.series[key] = self.series.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self.lock:
+            return self.series.get(self.key(labels), 0)
+
+    def render(self):
+        with self.lock:
+            return self.header() + [f"{self.name}{format_labels(self.label_names, key)} {format_value(value)}" for key, value in sorted(self.series.items())]
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels=(), function=None):
+        super().__init__(name, help_text, labels)
+        self.function = function
+
+    def set(self, value, **labels):
+        with self.lock:
+            self.series[self.key(labels)] = value
+
+    def render(self):
+        with self.lock:
+            series = dict(self.series)
+        if self.function:
+            # Computed at scrape time, e.g. lag since the last sync
+            series.update(self.function() or {})
+        return self.header() + [f"{self.name}{format_labels(self.label_names, key)} {format_value(value)}" for key, value in sorted(series.items())]
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = list(buckets) + [float("inf")]
+
+    def observe(self, value, **labels):
+        key = self.key(labels)
+        with self.lock:
+            counts, total = self.series.get(key, ([0] * len(self.buckets), 0.0))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self.series[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self):
+        lines = self.header()
+        with self.lock:
+            for key, (counts, total) in sorted(self.series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{format_labels(self.label_names, key, [('le', format_value(bound))])} {cumulative}")
+                lines.append(f"{self.name}_sum{format_labels(self.label_names, key)} {format_value(total)}")
+                lines.append(f"{self.name}_count{format_labels(self.label_names, key)} {cumulative}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+def read_sync_status(path=SYNC_STATUS_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_sync_status(status, path=SYNC_STATUS_FILE):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(status, f)
+    os.replace(temp_path, path)
+
+def current_sync_lag():
+    last_success = read_sync_status().get("last_success")
+    return {(): time.time() - last_success} if last_success else {}
+
+def current_cache_hit_ratios():
+    ratios = {}
+    with cache_requests.lock:
+        series = dict(cache_requests.series)
+    for cache in {key[0] for key in series}:
+        hits = series.get((cache, "hit"), 0)
+        total = hits + series.get((cache, "miss"), 0)
+        if total:
+            ratios[(cache,)] = hits / total
+    return ratios
+
+REGISTRY = Registry()
+callback_latency = REGISTRY.register(Histogram("dashboard_callback_seconds", "Dash callback latency", ["callback"]))
+warm_start_seconds = REGISTRY.register(Gauge("dashboard_warm_start_seconds", "Time this dashboard worker spent preloading board data and caches before serving"))
+graphql_latency = REGISTRY.register(Histogram("graphql_request_seconds", "GitHub GraphQL request latency", ["operation"]))
+graphql_response_bytes = REGISTRY.register(Histogram("graphql_response_bytes", "GitHub GraphQL response body size", ["operation"], BYTES_BUCKETS))
+graphql_cost = REGISTRY.register(Histogram("graphql_point_cost", "GitHub GraphQL rate-limit points charged per request", ["operation"], COST_BUCKETS))
+graphql_errors = REGISTRY.register(Counter("graphql_errors_total", "GitHub GraphQL requests that failed or returned errors", ["operation"]))
+graphql_hedges = REGISTRY.register(Counter("graphql_hedged_requests_total", "Duplicate GitHub queries sent because the first was slow or failed"))
+graphql_circuit_rejections = REGISTRY.register(Counter("graphql_circuit_rejections_total", "GitHub requests refused while the circuit breaker was open"))
+graphql_coalesced = REGISTRY.register(Counter("graphql_coalesced_requests_total", "GitHub queries answered by an identical in-flight request from another thread or process", ["scope"]))
+cache_requests = REGISTRY.register(Counter("cache_requests_total", "Cache lookups by cache and result", ["cache", "result"]))
+cache_hit_ratio = REGISTRY.register(Gauge("cache_hit_ratio", "Share of cache lookups served from the cache", ["cache"], current_cache_hit_ratios))
+sync_lag = REGISTRY.register(Histogram("sync_lag_seconds", "Time between consecutive successful board syncs", [], LAG_BUCKETS))
+sync_lag_current = REGISTRY.register(Gauge("sync_lag_current_seconds", "Seconds since the last successful board sync", [], current_sync_lag))
+
+def record_cache(cache, hit):
+    cache_requests.inc(cache=cache, result="hit" if hit else "miss")
+
+def render():
+    return REGISTRY.render()
+
+def write_metrics_file(path):
+    # Atomic so a node_exporter textfile collector never reads a half-written file
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(render())
+    os.replace(temp_path, path)
+
+def enable_metrics_file(path):
+    if path:
+        atexit.register(write_metrics_file, path)
@@ -0,0 +1,1188 @@
+import re
+import json
+import time
+import base64
+import random
+import argparse
+import textwrap
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from synthetic_board import read_items
+
+# Metadata
+# File Name: mock_github_graphql.py
+# Version: 1.5
+# Owner: Andrew John Holland
+# Purpose: Local mock of the GitHub GraphQL API subset used by the project board scripts and dashboard, for offline testing and benchmarking
+# Change Log (Last 4):
+#   - Version 1.5, 19-10-2026: add_user registers a User node only for a new login
+#   - Version 1.4, 19-10-2026: updateProjectV2Field replaces single-select options with new IDs and clears item values on the field, as GitHub does
+#   - Version 1.3, 19-10-2026: Added repositoryOwner, project repositories and the repository, label, project, field and link mutations used by bootstrap_project_v1.0.py
+#   - Version 1.2, 19-10-2026: Seeded Priority, Estimate, Target Date, Sprint and Notes fields on project 5 and added iteration configuration, title and startDate
+
+# Configuration
+HOST = "127.0.0.1"
+PORT = 8765
+USERNAME = "silicastormsiam"
+POINTS_PER_HOUR = 5000
+MAX_PAGE_SIZE = 100
+PMBOK_STATUSES = ["Initiating", "Planning", "Executing", "Monitoring and Controlling", "Closing"]
+BOARD_STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+NEW_PROJECT_STATUSES = ["Todo", "In Progress", "Done"]  # Status options GitHub gives every new project
+SECTION_LABELS = ["Section One", "Section Two", "Section Three"]
+
+# Seeded boards mirror the IDs hard-coded in the scripts so they run unmodified against the mock
+SEED_REPOSITORIES = ["project-dashboards", "rats", "homelab-hardware"]
+SEED_PROJECTS = [
+    {"number": 2, "id": "PVT_kwHOCZq5ps4A-gWw", "title": "SSS-Project Dashboard", "repo": "project-dashboards", "statuses": PMBOK_STATUSES},
+    {"number": 3, "id": "PVT_kwHOCZq5ps4A-gXy", "title": "PMBOK Task Board", "repo": "rats", "statuses": PMBOK_STATUSES},
+    {"number": 4, "id": "PVT_kwHOCZq5ps4A-gXz", "title": "Homelab Hardware Development", "repo": "homelab-hardware", "statuses": BOARD_STATUSES},
+    {"number": 5, "id": "PVT_kwHOCZq5ps4A-gX5", "title": "Project Dashboards on GitHub", "repo": "project-dashboards", "statuses": PMBOK_STATUSES}
+]
+# Custom fields on project 5, so typed ingestion sees every ProjectV2 field type; options are the iteration starts for ITERATION
+SEED_FIELDS = [
+    ("Priority", "SINGLE_SELECT", ["P0", "P1", "P2"]),
+    ("Estimate", "NUMBER", None),
+    ("Target Date", "DATE", None),
+    ("Sprint", "ITERATION", [{"name": f"Sprint {index + 1}", "startDate": (datetime(2025, 7, 21) + timedelta(days=14 * index)).strftime("%Y-%m-%d"), "duration": 14} for index in range(6)]),
+    ("Notes", "TEXT", None)
+]
+SEED_FIELD_RATE = 0.7  # Chance of a seeded item having a value in each custom field
+SEED_TITLES = [
+    ("Install Python and dependencies on VPS", "Section One"),
+    ("Configure NGINX and SSL for cyberpunkmonk.com", "Section One"),
+    ("Set up cron job for sync_dashboard_v1.4.py", "Section One"),
+    ("Configure Hostinger VPS firewall", "Section One"),
+    ("Define dashboard requirements", "Section Two"),
+    ("Develop Plotly Dash dashboard code", "Section Two"),
+    ("Integrate GitHub API for data", "Section Two"),
+    ("Deploy dashboard on cyberpunkmonk.com", "Section Two"),
+    ("Define Section Three scope", "Section Three")
+]
+
+class GraphQLError(Exception):
+    def __init__(self, message, error_type=None, path=None):
+        super().__init__(message)
+        self.message = message
+        self.error_type = error_type
+        self.path = path
+
+    def to_dict(self):
+        error = {"message": self.message}
+        if self.error_type:
+            error["type"] = self.error_type
+        if self.path:
+            error["path"] = self.path
+        return error
+
+# --- GraphQL document parsing -------------------------------------------------
+
+TOKEN_PATTERN = re.compile(r'''
+    (?P<ignored>[\s,\ufeff]+|\#[^\n]*)
+  | (?P<spread>\.\.\.)
+  | (?P<block>"""(?:\\"""|(?!""")[\s\S])*""")
+  | (?P<string>"(?:\\.|[^"\\\n])*")
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+  | (?P<punct>[!$&()\:=@\[\]{|}])
+''', re.VERBOSE)
+
+class EnumValue(str):
+    pass
+
+class Variable:
+    def __init__(self, name):
+        self.name = name
+
+def tokenize(source):
+    tokens = []
+    position = 0
+    while position < len(source):
+        match = TOKEN_PATTERN.match(source, position)
+        if not match:
+            raise GraphQLError(f"Parse error on \"{source[position:position + 10]}\" at offset {position}", "PARSE_ERROR")
+        position = match.end()
+        kind = match.lastgroup
+        if kind != "ignored":
+            tokens.append((kind, match.group()))
+    tokens.append(("eof", None))
+    return tokens
+
+class Parser:
+    def __init__(self, source):
+        self.tokens = tokenize(source)
+        self.position = 0
+
+    def peek(self, kind, value=None):
+        token_kind, token_value = self.tokens[self.position]
+        return token_kind == kind and (value is None or token_value == value)
+
+    def expect(self, kind, value=None):
+        if not self.peek(kind, value):
+            found = self.tokens[self.position][1]
+            raise GraphQLError(f"Parse error on \"{found}\": expected {value or kind}", "PARSE_ERROR")
+        token_value = self.tokens[self.position][1]
+        self.position += 1
+        return token_value
+
+    def accept(self, kind, value=None):
+        if self.peek(kind, value):
+            return self.expect(kind, value)
+        return None
+
+    def parse_document(self):
+        operations = []
+        fragments = {}
+        while not self.peek("eof"):
+            if self.peek("punct", "{"):
+                operations.append({"type": "query", "name": None, "variables": [], "selections": self.parse_selection_set()})
+            elif self.peek("name", "fragment"):
+                self.expect("name")
+                name = self.expect("name")
+                self.expect("name", "on")
+                type_condition = self.expect("name")
+                self.parse_directives()
+                fragments[name] = {"type": type_condition, "selections": self.parse_selection_set()}
+            else:
+                operation_type = self.expect("name")
+                if operation_type not in ("query", "mutation"):
+                    raise GraphQLError(f"Unsupported operation type \"{operation_type}\"", "PARSE_ERROR")
+                name = self.accept("name")
+                variables = self.parse_variable_definitions() if self.peek("punct", "(") else []
+                self.parse_directives()
+                operations.append({"type": operation_type, "name": name, "variables": variables, "selections": self.parse_selection_set()})
+        return operations, fragments
+
+    def parse_variable_definitions(self):
+        definitions = []
+        self.expect("punct", "(")
+        while not self.accept("punct", ")"):
+            self.expect("punct", "$")
+            name = self.expect("name")
+            self.expect("punct", ":")
+            type_name = self.parse_type()
+            default = self.parse_value() if self.accept("punct", "=") else None
+            definitions.append({"name": name, "type": type_name, "default": default})
+        return definitions
+
+    def parse_type(self):
+        if self.accept("punct", "["):
+            type_name = f"[{self.parse_type()}]"
+            self.expect("punct", "]")
+        else:
+            type_name = self.expect("name")
+        if self.accept("punct", "!"):
+            type_name += "!"
+        return type_name
+
+    def parse_directives(self):
+        directives = []
+        while self.accept("punct", "@"):
+            name = self.expect("name")
+            arguments = self.parse_arguments() if self.peek("punct", "(") else {}
+            directives.append((name, arguments))
+        return directives
+
+    def parse_selection_set(self):
+        selections = []
+        self.expect("punct", "{")
+        while not self.accept("punct", "}"):
+            selections.append(self.parse_selection())
+        return selections
+
+    def parse_selection(self):
+        if self.accept("spread"):
+            if self.accept("name", "on"):
+                type_condition = self.expect("name")
+                directives = self.parse_directives()
+                return {"kind": "inline", "type": type_condition, "directives": directives, "selections": self.parse_selection_set()}
+            if self.peek("punct", "{") or self.peek("punct", "@"):
+                directives = self.parse_directives()
+                return {"kind": "inline", "type": None, "directives": directives, "selections": self.parse_selection_set()}
+            name = self.expect("name")
+            return {"kind": "spread", "name": name, "directives": self.parse_directives()}
+        alias = name = self.expect("name")
+        if self.accept("punct", ":"):
+            name = self.expect("name")
+        arguments = self.parse_arguments() if self.peek("punct", "(") else {}
+        directives = self.parse_directives()
+        selections = self.parse_selection_set() if self.peek("punct", "{") else None
+        return {"kind": "field", "alias": alias, "name": name, "arguments": arguments, "directives": directives, "selections": selections}
+
+    def parse_arguments(self):
+        arguments = {}
+        self.expect("punct", "(")
+        while not self.accept("punct", ")"):
+            name = self.expect("name")
+            self.expect("punct", ":")
+            arguments[name] = self.parse_value()
+        return arguments
+
+    def parse_value(self):
+        if self.accept("punct", "$"):
+            return Variable(self.expect("name"))
+        if self.peek("number"):
+            text = self.expect("number")
+            return float(text) if any(c in text for c in ".eE") else int(text)
+        if self.peek("string"):
+            return json.loads(self.expect("string"))
+        if self.peek("block"):
+            return textwrap.dedent(self.expect("block")[3:-3].replace('\\"""', '"""')).strip("\n")
+        if self.accept("punct", "["):
+            values = []
+            while not self.accept("punct", "]"):
+                values.append(self.parse_value())
+            return values
+        if self.accept("punct", "{"):
+            values = {}
+            while not self.accept("punct", "}"):
+                name = self.expect("name")
+                self.expect("punct", ":")
+                values[name] = self.parse_value()
+            return values
+        name = self.expect("name")
+        if name in ("true", "false"):
+            return name == "true"
+        if name == "null":
+            return None
+        return EnumValue(name)
+
+def substitute(value, variables):
+    if isinstance(value, Variable):
+        return variables.get(value.name)
+    if isinstance(value, list):
+        return [substitute(item, variables) for item in value]
+    if isinstance(value, dict):
+        return {key: substitute(item, variables) for key, item in value.items()}
+    return value
+
+# --- Object model -------------------------------------------------------------
+
+def encode_cursor(index):
+    return base64.b64encode(f"cursor:v2:{index}".encode()).decode()
+
+def decode_cursor(cursor):
+    try:
+        return int(base64.b64decode(cursor).decode().rsplit(":", 1)[1])
+    except Exception:
+        raise GraphQLError(f"`{cursor}` does not appear to be a valid cursor.", "INVALID_CURSOR_ARGUMENTS")
+
+class MockObject:
+    typename = None
+    interfaces = ()
+
+    def resolve(self, name, arguments, context):
+        resolver = getattr(self, f"field_{name}", None)
+        if resolver is None:
+            raise GraphQLError(f"Field '{name}' doesn't exist on type '{self.typename}'", "undefinedField")
+        return resolver(arguments, context)
+
+    def matches(self, type_condition):
+        return type_condition is None or type_condition == self.typename or type_condition in self.interfaces
+
+class Connection(MockObject):
+    def __init__(self, typename, nodes, arguments, field_name):
+        self.typename = typename
+        first = arguments.get("first")
+        last = arguments.get("last")
+        if first is None and last is None:
+            raise GraphQLError(f"You must provide a `first` or `last` value to properly paginate the `{field_name}` connection.", "MISSING_PAGINATION_BOUNDARIES")
+        for value, label in ((first, "first"), (last, "last")):
+            if value is not None and value > MAX_PAGE_SIZE:
+                raise GraphQLError(f"Requesting {value} records on the `{field_name}` connection exceeds the `{label}` limit of {MAX_PAGE_SIZE} records.", "EXCESSIVE_PAGINATION")
+        start = decode_cursor(arguments["after"]) + 1 if arguments.get("after") else 0
+        end = decode_cursor(arguments["before"]) if arguments.get("before") else len(nodes)
+        if first is not None:
+            end = min(end, start + first)
+        if last is not None:
+            start = max(start, end - last)
+        self.total = len(nodes)
+        self.start = start
+        self.end = end
+        self.page = nodes[start:end]
+
+    def field_nodes(self, arguments, context):
+        return self.page
+
+    def field_edges(self, arguments, context):
+        return [Edge(node, encode_cursor(self.start + offset)) for offset, node in enumerate(self.page)]
+
+    def field_totalCount(self, arguments, context):
+        return self.total
+
+    def field_pageInfo(self, arguments, context):
+        return PageInfo(self)
+
+class Edge(MockObject):
+    typename = "Edge"
+
+    def __init__(self, node, cursor):
+        self.node = node
+        self.cursor = cursor
+
+    def field_node(self, arguments, context):
+        return self.node
+
+    def field_cursor(self, arguments, context):
+        return self.cursor
+
+class PageInfo(MockObject):
+    typename = "PageInfo"
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def field_hasNextPage(self, arguments, context):
+        return self.connection.end < self.connection.total
+
+    def field_hasPreviousPage(self, arguments, context):
+        return self.connection.start > 0
+
+    def field_endCursor(self, arguments, context):
+        return encode_cursor(self.connection.end - 1) if self.connection.page else None
+
+    def field_startCursor(self, arguments, context):
+        return encode_cursor(self.connection.start) if self.connection.page else None
+
+class Node(MockObject):
+    interfaces = ("Node",)
+
+    def field_id(self, arguments, context):
+        return self.id
+
+class Label(Node):
+    typename = "Label"
+
+    def __init__(self, node_id, name, color):
+        self.id = node_id
+        self.name = name
+        self.color = color
+
+    def field_name(self, arguments, context):
+        return self.name
+
+    def field_color(self, arguments, context):
+        return self.color
+
+class Issue(Node):
+    typename = "Issue"
+    interfaces = ("Node", "Labelable", "Closable", "UniformResourceLocatable")
+
+    def __init__(self, node_id, repository, number, title, body, updated_at):
+        self.id = node_id
+        self.repository = repository
+        self.number = number
+        self.title = title
+        self.body = body
+        self.state = "OPEN"
+        self.created_at = updated_at
+        self.updated_at = updated_at
+        self.labels = []
+
+    def field_number(self, arguments, context):
+        return self.number
+
+    def field_title(self, arguments, context):
+        return self.title
+
+    def field_body(self, arguments, context):
+        return self.body
+
+    def field_state(self, arguments, context):
+        return self.state
+
+    def field_createdAt(self, arguments, context):
+        return self.created_at
+
+    def field_updatedAt(self, arguments, context):
+        return self.updated_at
+
+    def field_url(self, arguments, context):
+        return f"https://github.com/{self.repository.owner}/{self.repository.name}/issues/{self.number}"
+
+    def field_repository(self, arguments, context):
+        return self.repository
+
+    def field_labels(self, arguments, context):
+        return Connection("LabelConnection", self.labels, arguments, "labels")
+
+class Repository(Node):
+    typename = "Repository"
+
+    def __init__(self, node_id, owner, name):
+        self.id = node_id
+        self.owner = owner
+        self.name = name
+        self.issues = []
+        self.labels = []
+
+    def field_name(self, arguments, context):
+        return self.name
+
+    def field_nameWithOwner(self, arguments, context):
+        return f"{self.owner}/{self.name}"
+
+    def field_issues(self, arguments, context):
+        issues = self.issues
+        if arguments.get("states"):
+            # GraphQL coerces a single enum into a one-element list
+            states = arguments["states"] if isinstance(arguments["states"], list) else [arguments["states"]]
+            states = set(states)
+            issues = [issue for issue in issues if issue.state in states]
+        return Connection("IssueConnection", issues, arguments, "issues")
+
+    def field_issue(self, arguments, context):
+        return next((issue for issue in self.issues if issue.number == arguments.get("number")), None)
+
+    def field_labels(self, arguments, context):
+        return Connection("LabelConnection", self.labels, arguments, "labels")
+
+    def field_label(self, arguments, context):
+        return next((label for label in self.labels if label.name == arguments.get("name")), None)
+
+class ProjectField(Node):
+    interfaces = ("Node", "ProjectV2FieldCommon")
+
+    def __init__(self, node_id, name, data_type, options=None):
+        self.id = node_id
+        self.name = name
+        self.data_type = data_type
+        self.options = options or []
+        self.typename = {"SINGLE_SELECT": "ProjectV2SingleSelectField", "ITERATION": "ProjectV2IterationField"}.get(data_type, "ProjectV2Field")
+
+    def field_name(self, arguments, context):
+        return self.name
+
+    def field_dataType(self, arguments, context):
+        return EnumValue(self.data_type)
+
+    def field_options(self, arguments, context):
+        if self.data_type != "SINGLE_SELECT":
+            raise GraphQLError(f"Field 'options' doesn't exist on type '{self.typename}'", "undefinedField")
+        return [Option(option) for option in self.options]
+
+    def field_configuration(self, arguments, context):
+        if self.data_type != "ITERATION":
+            raise GraphQLError(f"Field 'configuration' doesn't exist on type '{self.typename}'", "undefinedField")
+        iterations = [Payload("ProjectV2IterationFieldIteration", id=option["id"], title=option["name"], startDate=option["startDate"], duration=option["duration"])
+                      for option in self.options]
+        return Payload("ProjectV2IterationFieldConfiguration", iterations=iterations, completedIterations=[], duration=14, startDay=1)
+
+class Option(MockObject):
+    typename = "ProjectV2SingleSelectFieldOption"
+
+    def __init__(self, option):
+        self.option = option
+
+    def field_id(self, arguments, context):
+        return self.option["id"]
+
+    def field_name(self, arguments, context):
+        return self.option["name"]
+
+    def field_color(self, arguments, context):
+        return EnumValue(self.option.get("color", "GRAY"))
+
+    def field_description(self, arguments, context):
+        return self.option.get("description", "")
+
+class FieldValue(MockObject):
+    interfaces = ("ProjectV2ItemFieldValueCommon",)
+    typenames = {
+        "TITLE": "ProjectV2ItemFieldTextValue",
+        "TEXT": "ProjectV2ItemFieldTextValue",
+        "NUMBER": "ProjectV2ItemFieldNumberValue",
+        "DATE": "ProjectV2ItemFieldDateValue",
+        "SINGLE_SELECT": "ProjectV2ItemFieldSingleSelectValue",
+        "ITERATION": "ProjectV2ItemFieldIterationValue"
+    }
+
+    def __init__(self, field, value, updated_at):
+        self.field = field
+        self.value = value
+        self.updated_at = updated_at
+        self.typename = self.typenames.get(field.data_type, "ProjectV2ItemFieldTextValue")
+
+    def field_field(self, arguments, context):
+        return self.field
+
+    def field_updatedAt(self, arguments, context):
+        return self.updated_at
+
+    def field_text(self, arguments, context):
+        return self.value if self.field.data_type in ("TEXT", "TITLE") else self.resolve_missing("text")
+
+    def field_number(self, arguments, context):
+        return self.value if self.field.data_type == "NUMBER" else self.resolve_missing("number")
+
+    def field_date(self, arguments, context):
+        return self.value if self.field.data_type == "DATE" else self.resolve_missing("date")
+
+    def field_optionId(self, arguments, context):
+        return self.value if self.field.data_type == "SINGLE_SELECT" else self.resolve_missing("optionId")
+
+    def field_name(self, arguments, context):
+        if self.field.data_type != "SINGLE_SELECT":
+            return self.resolve_missing("name")
+        return next((option["name"] for option in self.field.options if option["id"] == self.value), None)
+
+    def field_iterationId(self, arguments, context):
+        return self.value if self.field.data_type == "ITERATION" else self.resolve_missing("iterationId")
+
+    def iteration(self, name):
+        if self.field.data_type != "ITERATION":
+            return self.resolve_missing(name)
+        return next((option for option in self.field.options if option["id"] == self.value), {})
+
+    def field_title(self, arguments, context):
+        return self.iteration("title").get("name")
+
+    def field_startDate(self, arguments, context):
+        return self.iteration("startDate").get("startDate")
+
+    def field_duration(self, arguments, context):
+        return self.iteration("duration").get("duration")
+
+    def resolve_missing(self, name):
+        raise GraphQLError(f"Field '{name}' doesn't exist on type '{self.typename}'", "undefinedField")
+
+class ProjectItem(Node):
+    typename = "ProjectV2Item"
+
+    def __init__(self, node_id, project, content):
+        self.id = node_id
+        self.project = project
+        self.content = content
+        self.values = {}
+        self.updated_at = content.updated_at
+
+    def field_type(self, arguments, context):
+        return EnumValue("ISSUE")
+
+    def field_content(self, arguments, context):
+        return self.content
+
+    def field_project(self, arguments, context):
+        return self.project
+
+    def field_updatedAt(self, arguments, context):
+        return self.updated_at
+
+    def current_values(self):
+        # GitHub always reports the Title field first, then every field that has a value
+        values = [FieldValue(self.project.fields[0], self.content.title, self.updated_at)]
+        for field in self.project.fields[1:]:
+            if field.id in self.values:
+                values.append(FieldValue(field, self.values[field.id], self.updated_at))
+        return values
+
+    def field_fieldValues(self, arguments, context):
+        return Connection("ProjectV2ItemFieldValueConnection", self.current_values(), arguments, "fieldValues")
+
+    def field_fieldValueByName(self, arguments, context):
+        return next((value for value in self.current_values() if value.field.name == arguments.get("name")), None)
+
+class Project(Node):
+    typename = "ProjectV2"
+
+    def __init__(self, node_id, owner, number, title):
+        self.id = node_id
+        self.owner = owner
+        self.number = number
+        self.title = title
+        self.fields = []
+        self.items = []
+        self.items_by_content = {}
+        self.repositories = []
+
+    def field_number(self, arguments, context):
+        return self.number
+
+    def field_title(self, arguments, context):
+        return self.title
+
+    def field_url(self, arguments, context):
+        return f"https://github.com/users/{self.owner.login}/projects/{self.number}"
+
+    def field_fields(self, arguments, context):
+        return Connection("ProjectV2FieldConfigurationConnection", self.fields, arguments, "fields")
+
+    def field_field(self, arguments, context):
+        return next((field for field in self.fields if field.name == arguments.get("name")), None)
+
+    def field_items(self, arguments, context):
+        return Connection("ProjectV2ItemConnection", self.items, arguments, "items")
+
+    def field_repositories(self, arguments, context):
+        return Connection("RepositoryConnection", self.repositories, arguments, "repositories")
+
+class User(Node):
+    typename = "User"
+    interfaces = ("Node", "RepositoryOwner", "ProjectV2Owner")
+
+    def __init__(self, node_id, login):
+        self.id = node_id
+        self.login = login
+        self.projects = []
+
+    def field_login(self, arguments, context):
+        return self.login
+
+    def field_projectV2(self, arguments, context):
+        project = next((project for project in self.projects if project.number == arguments.get("number")), None)
+        if project is None:
+            raise GraphQLError(f"Could not resolve to a ProjectV2 with the number {arguments.get('number')}.", "NOT_FOUND")
+        return project
+
+    def field_projectsV2(self, arguments, context):
+        return Connection("ProjectV2Connection", self.projects, arguments, "projectsV2")
+
+class RateLimit(MockObject):
+    typename = "RateLimit"
+
+    def __init__(self, store, cost):
+        self.store = store
+        self.cost = cost
+
+    def field_cost(self, arguments, context):
+        return self.cost
+
+    def field_limit(self, arguments, context):
+        return self.store.points_per_hour
+
+    def field_remaining(self, arguments, context):
+        return self.store.remaining
+
+    def field_used(self, arguments, context):
+        return self.store.points_per_hour - self.store.remaining
+
+    def field_resetAt(self, arguments, context):
+        return datetime.fromtimestamp(self.store.reset_at, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+class Payload(MockObject):
+    def __init__(self, typename, **values):
+        self.typename = typename
+        self.values = values
+
+    def resolve(self, name, arguments, context):
+        if name not in self.values:
+            raise GraphQLError(f"Field '{name}' doesn't exist on type '{self.typename}'", "undefinedField")
+        return self.values[name]
+
+# --- Store, queries and mutations ---------------------------------------------
+
+class MockGitHub:
+    def __init__(self, points_per_hour=POINTS_PER_HOUR):
+        self.lock = threading.RLock()
+        self.nodes = {}
+        self.users = {}
+        self.repositories = {}
+        self.counter = 0
+        self.rng = random.Random(0)
+        self.points_per_hour = points_per_hour
+        self.remaining = points_per_hour
+        self.reset_at = time.time() + 3600
+
+    def new_id(self, prefix):
+        self.counter += 1
+        return f"{prefix}_kwMock{self.counter:08d}"
+
+    def register(self, node):
+        self.nodes[node.id] = node
+        return node
+
+    def now(self):
+        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def add_user(self, login):
+        if login not in self.users:
+            self.users[login] = self.register(User(self.new_id("U"), login))
+        return self.users[login]
+
+    def add_repository(self, owner, name):
+        self.add_user(owner)
+        key = f"{owner}/{name}"
+        if key not in self.repositories:
+            self.repositories[key] = self.register(Repository(self.new_id("R"), owner, name))
+        return self.repositories[key]
+
+    def add_label(self, repository, name, color="ededed"):
+        label = self.register(Label(self.new_id("LA"), name, color))
+        repository.labels.append(label)
+        return label
+
+    def add_project(self, owner, number, title, statuses, node_id=None):
+        user = self.add_user(owner)
+        project = self.register(Project(node_id or self.new_id("PVT"), user, number, title))
+        self.add_field(project, "Title", "TITLE")
+        self.add_field(project, "Status", "SINGLE_SELECT", statuses)
+        user.projects.append(project)
+        return project
+
+    def add_field(self, project, name, data_type, options=None):
+        field_prefix = {"SINGLE_SELECT": "PVTSSF", "ITERATION": "PVTIF"}.get(data_type, "PVTF")
+        options = [{"id": f"{self.rng.getrandbits(32):08x}", **(option if isinstance(option, dict) else {"name": option})} for option in options or []]
+        field = self.register(ProjectField(self.new_id(field_prefix), name, data_type, options))
+        project.fields.append(field)
+        return field
+
+    def add_issue(self, repository, title, body="", labels=(), updated_at=None):
+        issue = self.register(Issue(self.new_id("I"), repository, len(repository.issues) + 1, title, body, updated_at or self.now()))
+        names = set(labels)
+        issue.labels = [label for label in repository.labels if label.name in names]
+        repository.issues.append(issue)
+        return issue
+
+    def add_item(self, project, issue):
+        if issue.id in project.items_by_content:
+            return project.items_by_content[issue.id]
+        item = self.register(ProjectItem(self.new_id("PVTI"), project, issue))
+        project.items.append(item)
+        project.items_by_content[issue.id] = item
+        return item
+
+    def set_value(self, item, field, value):
+        item.values[field.id] = value
+        item.updated_at = item.content.updated_at = self.now()
+
+    def node(self, node_id, expected=None):
+        node = self.nodes.get(node_id)
+        if node is None or (expected and not node.matches(expected)):
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{node_id}'", "NOT_FOUND")
+        return node
+
+    def charge(self, cost):
+        with self.lock:
+            if time.time() >= self.reset_at:
+                self.remaining = self.points_per_hour
+                self.reset_at = time.time() + 3600
+            if self.remaining < cost:
+                return False
+            self.remaining -= cost
+            return True
+
+class QueryRoot(MockObject):
+    typename = "Query"
+
+    def __init__(self, store, cost):
+        self.store = store
+        self.cost = cost
+
+    def field_user(self, arguments, context):
+        user = self.store.users.get(arguments.get("login"))
+        if user is None:
+            raise GraphQLError(f"Could not resolve to a User with the login of '{arguments.get('login')}'.", "NOT_FOUND")
+        return user
+
+    def field_viewer(self, arguments, context):
+        return self.store.users.get(USERNAME) or next(iter(self.store.users.values()))
+
+    def field_repositoryOwner(self, arguments, context):
+        return self.store.users.get(arguments.get("login"))
+
+    def field_repository(self, arguments, context):
+        repository = self.store.repositories.get(f"{arguments.get('owner')}/{arguments.get('name')}")
+        if repository is None:
+            raise GraphQLError(f"Could not resolve to a Repository with the name '{arguments.get('owner')}/{arguments.get('name')}'.", "NOT_FOUND")
+        return repository
+
+    def field_node(self, arguments, context):
+        return self.store.node(arguments.get("id"))
+
+    def field_nodes(self, arguments, context):
+        return [self.store.nodes.get(node_id) for node_id in arguments.get("ids") or []]
+
+    def field_rateLimit(self, arguments, context):
+        return RateLimit(self.store, self.cost)
+
+class MutationRoot(MockObject):
+    typename = "Mutation"
+
+    def __init__(self, store):
+        self.store = store
+
+    def field_createIssue(self, arguments, context):
+        values = arguments.get("input") or {}
+        repository = self.store.node(values.get("repositoryId"), "Repository")
+        if not values.get("title"):
+            raise GraphQLError("Title can't be blank", "UNPROCESSABLE")
+        issue = self.store.add_issue(repository, values["title"], values.get("body") or "")
+        label_ids = set(values.get("labelIds") or [])
+        issue.labels = [label for label in repository.labels if label.id in label_ids]
+        return Payload("CreateIssuePayload", issue=issue, clientMutationId=values.get("clientMutationId"))
+
+    def field_addProjectV2ItemById(self, arguments, context):
+        values = arguments.get("input") or {}
+        project = self.store.node(values.get("projectId"), "ProjectV2")
+        content = self.store.node(values.get("contentId"), "Issue")
+        item = self.store.add_item(project, content)
+        return Payload("AddProjectV2ItemByIdPayload", item=item, clientMutationId=values.get("clientMutationId"))
+
+    def field_updateProjectV2ItemFieldValue(self, arguments, context):
+        values = arguments.get("input") or {}
+        project = self.store.node(values.get("projectId"), "ProjectV2")
+        item = self.store.node(values.get("itemId"), "ProjectV2Item")
+        field = self.store.node(values.get("fieldId"), "ProjectV2FieldCommon")
+        if item.project is not project or field not in project.fields:
+            raise GraphQLError("The item or field does not belong to the project.", "UNPROCESSABLE")
+        value = values.get("value") or {}
+        key = {"SINGLE_SELECT": "singleSelectOptionId", "TEXT": "text", "NUMBER": "number", "DATE": "date", "ITERATION": "iterationId"}.get(field.data_type)
+        if key is None or key not in value:
+            raise GraphQLError(f"The field of type {field.data_type} requires a {key} value.", "UNPROCESSABLE")
+        if field.data_type == "SINGLE_SELECT" and value[key] not in {option["id"] for option in field.options}:
+            raise GraphQLError("The single select option Id does not belong to the field", "UNPROCESSABLE")
+        self.store.set_value(item, field, value[key])
+        return Payload("UpdateProjectV2ItemFieldValuePayload", projectV2Item=item, clientMutationId=values.get("clientMutationId"))
+
+    def field_addLabelsToLabelable(self, arguments, context):
+        values = arguments.get("input") or {}
+        labelable = self.store.node(values.get("labelableId"), "Labelable")
+        present = {label.id for label in labelable.labels}
+        for label_id in values.get("labelIds") or []:
+            label = self.store.node(label_id, "Label")
+            if label.id not in present:
+                labelable.labels.append(label)
+                present.add(label.id)
+        labelable.updated_at = self.store.now()
+        return Payload("AddLabelsToLabelablePayload", labelable=labelable, clientMutationId=values.get("clientMutationId"))
+
+    def field_createRepository(self, arguments, context):
+        values = arguments.get("input") or {}
+        owner = self.store.node(values.get("ownerId"), "RepositoryOwner") if values.get("ownerId") else self.store.users[USERNAME]
+        if f"{owner.login}/{values.get('name')}" in self.store.repositories:
+            raise GraphQLError("Name already exists on this account", "UNPROCESSABLE")
+        repository = self.store.add_repository(owner.login, values.get("name"))
+        return Payload("CreateRepositoryPayload", repository=repository, clientMutationId=values.get("clientMutationId"))
+
+    def field_createLabel(self, arguments, context):
+        values = arguments.get("input") or {}
+        repository = self.store.node(values.get("repositoryId"), "Repository")
+        if any(label.name.lower() == (values.get("name") or "").lower() for label in repository.labels):
+            raise GraphQLError("Name has already been taken", "UNPROCESSABLE")
+        label = self.store.add_label(repository, values.get("name"), values.get("color") or "ededed")
+        return Payload("CreateLabelPayload", label=label, clientMutationId=values.get("clientMutationId"))
+
+    def field_createProjectV2(self, arguments, context):
+        values = arguments.get("input") or {}
+        owner = self.store.node(values.get("ownerId"), "ProjectV2Owner")
+        number = max((project.number for project in owner.projects), default=0) + 1
+        project = self.store.add_project(owner.login, number, values.get("title"), NEW_PROJECT_STATUSES)
+        if values.get("repositoryId"):
+            project.repositories.append(self.store.node(values["repositoryId"], "Repository"))
+        return Payload("CreateProjectV2Payload", projectV2=project, clientMutationId=values.get("clientMutationId"))
+
+    def field_linkProjectV2ToRepository(self, arguments, context):
+        values = arguments.get("input") or {}
+        project = self.store.node(values.get("projectId"), "ProjectV2")
+        repository = self.store.node(values.get("repositoryId"), "Repository")
+        if repository not in project.repositories:
+            project.repositories.append(repository)
+        return Payload("LinkProjectV2ToRepositoryPayload", repository=repository, clientMutationId=values.get("clientMutationId"))
+
+    def field_createProjectV2Field(self, arguments, context):
+        values = arguments.get("input") or {}
+        project = self.store.node(values.get("projectId"), "ProjectV2")
+        if any(field.name == values.get("name") for field in project.fields):
+            raise GraphQLError("Name has already been taken", "UNPROCESSABLE")
+        field = self.store.add_field(project, values.get("name"), values.get("dataType"), values.get("singleSelectOptions"))
+        return Payload("CreateProjectV2FieldPayload", projectV2Field=field, clientMutationId=values.get("clientMutationId"))
+
+    def field_updateProjectV2Field(self, arguments, context):
+        values = arguments.get("input") or {}
+        field = self.store.node(values.get("fieldId"), "ProjectV2FieldCommon")
+        if values.get("name"):
+            field.name = values["name"]
+        if values.get("singleSelectOptions") is not None:
+            # Like GitHub, the list replaces every option with a new ID, so each item's value on the field is cleared
+            field.options = [{"id": f"{self.store.rng.getrandbits(32):08x}", **option} for option in values["singleSelectOptions"]]
+            for project in (project for user in self.store.users.values() for project in user.projects if field in project.fields):
+                for item in project.items:
+                    item.values.pop(field.id, None)
+        return Payload("UpdateProjectV2FieldPayload", projectV2Field=field, clientMutationId=values.get("clientMutationId"))
+
+# --- Execution ----------------------------------------------------------------
+
+def directives_allow(directives, variables):
+    for name, arguments in directives:
+        condition = substitute(arguments.get("if"), variables)
+        if name == "include" and not condition:
+            return False
+        if name == "skip" and condition:
+            return False
+    return True
+
+def collect_fields(obj, selections, fragments, variables, collected):
+    for selection in selections:
+        if not directives_allow(selection["directives"], variables):
+            continue
+        if selection["kind"] == "field":
+            collected.setdefault(selection["alias"], []).append(selection)
+        elif selection["kind"] == "inline":
+            if obj.matches(selection["type"]):
+                collect_fields(obj, selection["selections"], fragments, variables, collected)
+        else:
+            fragment = fragments.get(selection["name"])
+            if fragment is None:
+                raise GraphQLError(f"Fragment {selection['name']} was used, but not defined", "undefinedFragment")
+            if obj.matches(fragment["type"]):
+                collect_fields(obj, fragment["selections"], fragments, variables, collected)
+    return collected
+
+def execute_selections(obj, selections, context, path):
+    result = {}
+    for alias, fields in collect_fields(obj, selections, context["fragments"], context["variables"], {}).items():
+        field = fields[0]
+        field_path = path + [alias]
+        if field["name"] == "__typename":
+            result[alias] = obj.typename
+            continue
+        subselections = [selection for entry in fields for selection in (entry["selections"] or [])]
+        try:
+            value = obj.resolve(field["name"], substitute(field["arguments"], context["variables"]), context)
+            result[alias] = complete_value(value, subselections, context, field_path)
+        except GraphQLError as e:
+            if e.error_type in ("undefinedField", "MISSING_PAGINATION_BOUNDARIES", "EXCESSIVE_PAGINATION"):
+                raise
+            e.path = e.path or field_path
+            context["errors"].append(e.to_dict())
+            result[alias] = None
+    return result
+
+def complete_value(value, selections, context, path):
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [complete_value(item, selections, context, path + [index]) for index, item in enumerate(value)]
+    if isinstance(value, MockObject):
+        if not selections:
+            raise GraphQLError(f"Field must have selections (field '{path[-1]}' returns {value.typename} but has no selections.)", "selectionMismatch")
+        return execute_selections(value, selections, context, path)
+    return value
+
+def estimate_cost(selections, fragments, variables, multiplier=1):
+    # GitHub's rule: one request per connection page, scaled by parent page sizes, divided by 100
+    requests = 0
+    for selection in selections:
+        if selection["kind"] == "spread":
+            nested = fragments.get(selection["name"], {}).get("selections", [])
+            requests += estimate_cost(nested, fragments, variables, multiplier)
+            continue
+        nested = selection["selections"] or []
+        arguments = substitute(selection.get("arguments", {}), variables)
+        size = arguments.get("first") or arguments.get("last")
+        if isinstance(size, int):
+            requests += multiplier
+            requests += estimate_cost(nested, fragments, variables, multiplier * size)
+        else:
+            requests += estimate_cost(nested, fragments, variables, multiplier)
+    return requests
+
+def execute_document(store, query, variables=None, operation_name=None):
+    variables = dict(variables or {})
+    try:
+        operations, fragments = Parser(query).parse_document()
+        if operation_name:
+            operation = next((op for op in operations if op["name"] == operation_name), None)
+        else:
+            operation = operations[0] if len(operations) == 1 else None
+        if operation is None:
+            raise GraphQLError("An operation name is required when the document has several operations", "PARSE_ERROR")
+        for definition in operation["variables"]:
+            if definition["name"] not in variables or variables[definition["name"]] is None:
+                if definition["default"] is not None:
+                    variables[definition["name"]] = definition["default"]
+                elif definition["type"].endswith("!"):
+                    raise GraphQLError(f"Variable ${definition['name']} of type {definition['type']} was provided invalid value", "INVALID_VARIABLE")
+        # Mutations are charged a flat point, like GitHub's primary limit
+        cost = 1 if operation["type"] == "mutation" else max(1, round(estimate_cost(operation["selections"], fragments, variables) / 100))
+        if not store.charge(cost):
+            return {"errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded for user ID 1. If you reach out to GitHub Support for help, please include the request ID."}]}, cost
+        context = {"fragments": fragments, "variables": variables, "errors": []}
+        with store.lock:
+            root = MutationRoot(store) if operation["type"] == "mutation" else QueryRoot(store, cost)
+            data = execute_selections(root, operation["selections"], context, [])
+        response = {"data": data}
+        if context["errors"]:
+            response["errors"] = context["errors"]
+        return response, cost
+    except GraphQLError as e:
+        return {"errors": [e.to_dict()]}, 0
+
+# --- Seeding ------------------------------------------------------------------
+
+def seed_store(store, items=50, seed=7, owner=USERNAME):
+    rng = random.Random(seed)
+    repositories = {}
+    for name in SEED_REPOSITORIES:
+        repository = store.add_repository(owner, name)
+        for label_name, color in zip(SECTION_LABELS, ["FF5733", "33FF57", "3357FF"]):
+            store.add_label(repository, label_name, color)
+        repositories[name] = repository
+    start = datetime(2025, 7, 22, tzinfo=timezone.utc)
+    for config in SEED_PROJECTS:
+        project = store.add_project(owner, config["number"], config["title"], config["statuses"], config["id"])
+        if config["number"] != 5:
+            continue
+        repository = repositories[config["repo"]]
+        status_field = project.fields[1]
+        custom_fields = [store.add_field(project, name, data_type, options) for name, data_type, options in SEED_FIELDS]
+        # Separate generator, so adding fields leaves the seeded titles, dates and statuses unchanged
+        field_rng = random.Random(seed + 1)
+        for index in range(items):
+            title, label = SEED_TITLES[index] if index < len(SEED_TITLES) else (f"Synthetic task {index}", rng.choice(SECTION_LABELS))
+            updated_at = (start + timedelta(minutes=rng.randrange(0, 60 * 24 * 90))).strftime("%Y-%m-%dT%H:%M:%SZ")
+            issue = store.add_issue(repository, title, f"Seeded task {index} for the mock board.", [label], updated_at)
+            item = store.add_item(project, issue)
+            item.values[status_field.id] = rng.choice(status_field.options)["id"]
+            for field in custom_fields:
+                if field_rng.random() < SEED_FIELD_RATE:
+                    item.values[field.id] = seed_value(field_rng, field, start, index)
+    return store
+
+def seed_value(rng, field, start, index):
+    if field.options:
+        return rng.choice(field.options)["id"]
+    if field.data_type == "NUMBER":
+        return float(rng.choice([1, 2, 3, 5, 8, 13]))
+    if field.data_type == "DATE":
+        return (start + timedelta(days=rng.randrange(0, 180))).strftime("%Y-%m-%d")
+    return f"Seeded note {index}"
+
+def load_items(store, items, project_number=5, owner=USERNAME):
+    # Accepts items in the dashboard query shape, as written by synthetic_board.py
+    project = next(project for project in store.users[owner].projects if project.number == project_number)
+    repo_name = next((config["repo"] for config in SEED_PROJECTS if config["number"] == project_number), SEED_REPOSITORIES[0])
+    repository = store.add_repository(owner, repo_name)
+    status_field = project.fields[1]
+    options = {option["name"]: option["id"] for option in status_field.options}
+    count = 0
+    with store.lock:
+        for item in items:
+            content = item["content"]
+            label_names = [label["name"] for label in content.get("labels", {}).get("nodes", [])]
+            known = {label.name for label in repository.labels}
+            for name in label_names:
+                if name not in known:
+                    store.add_label(repository, name)
+                    known.add(name)
+            issue = store.add_issue(repository, content["title"], content.get("body", ""), label_names, content.get("updatedAt"))
+            project_item = store.add_item(project, issue)
+            status = next((value["name"] for value in item.get("fieldValues", {}).get("nodes", []) if value.get("name") in options), None)
+            if status:
+                project_item.values[status_field.id] = options[status]
+            count += 1
+    return count
+
+# --- HTTP server --------------------------------------------------------------
+
+class MockGraphQLHandler(BaseHTTPRequestHandler):
+    server_version = "GitHub.com"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def rate_limit_headers(self, cost):
+        store = self.server.store
+        return {
+            "X-RateLimit-Limit": str(store.points_per_hour),
+            "X-RateLimit-Remaining": str(store.remaining),
+            "X-RateLimit-Used": str(cost),
+            "X-RateLimit-Reset": str(int(store.reset_at)),
+            "X-RateLimit-Resource": "graphql"
+        }
+
+    def load_posted_items(self):
+        # Newline-delimited items from synthetic_board.py --mock-url; batches keep each request small
+        query = parse_qs(urlparse(self.path).query)
+        lines = self.rfile.read(int(self.headers.get("Content-Length") or 0)).decode().splitlines()
+        try:
+            added = load_items(self.server.store, (json.loads(line) for line in lines if line.strip()), int(query.get("project", ["5"])[0]))
+        except (ValueError, KeyError, StopIteration) as e:
+            self.send_json(400, {"message": f"Could not load items: {e}"})
+            return
+        self.send_json(200, {"added": added})
+
+    def do_POST(self):
+        if urlparse(self.path).path == "/admin/items":
+            self.load_posted_items()
+            return
+        if self.path.rstrip("/") not in ("", "/graphql"):
+            self.send_json(404, {"message": "Not Found"})
+            return
+        if not self.headers.get("Authorization"):
+            self.send_json(401, {"message": "This endpoint requires you to be authenticated.", "documentation_url": "https://docs.github.com/graphql/guides/forming-calls-with-graphql#authenticating-with-graphql"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        except ValueError:
+            self.send_json(400, {"message": "Problems parsing JSON"})
+            return
+        server = self.server
+        delay = server.latency + server.rng.uniform(0, server.jitter)
+        if delay:
+            time.sleep(delay)
+        if server.secondary_error_rate and server.rng.random() < server.secondary_error_rate:
+            self.send_json(403, {"message": "You have exceeded a secondary rate limit. Please wait a few minutes before you try again.", "documentation_url": "https://docs.github.com/graphql/overview/rate-limits-and-node-limits-for-the-graphql-api#secondary-rate-limits"}, {"Retry-After": "60"})
+            return
+        response, cost = execute_document(server.store, payload.get("query") or "", payload.get("variables"), payload.get("operationName"))
+        self.send_json(200, response, self.rate_limit_headers(cost))
+
+def create_server(store=None, host=HOST, port=PORT, latency_ms=0, jitter_ms=0, secondary_error_rate=0.0, seed=7, verbose=False):
+    server = ThreadingHTTPServer((host, port), MockGraphQLHandler)
+    server.daemon_threads = True
+    server.store = store or seed_store(MockGitHub(), seed=seed)
+    server.latency = latency_ms / 1000.0
+    server.jitter = jitter_ms / 1000.0
+    server.secondary_error_rate = secondary_error_rate
+    server.rng = random.Random(seed)
+    server.verbose = verbose
+    return server
+
+def start_in_thread(**kwargs):
+    server = create_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{server.server_address[0]}:{server.server_address[1]}/graphql"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serve a local mock of the GitHub GraphQL API for the project board scripts")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--items", type=int, default=50, help="Seeded items on project 5 (the dashboard board)")
+    parser.add_argument("--items-file", help="Also load project 5 items from a synthetic_board.py JSON Lines file (.gz allowed)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for reproducible boards")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Fixed delay added to every request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra delay up to this value")
+    parser.add_argument("--points-per-hour", type=int, default=POINTS_PER_HOUR, help="Primary rate-limit budget")
+    parser.add_argument("--secondary-error-rate", type=float, default=0.0, help="Fraction of requests rejected with a 403 secondary rate limit")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    store = seed_store(MockGitHub(points_per_hour=args.points_per_hour), items=args.items, seed=args.seed)
+    if args.items_file:
+        print(f"Loaded {load_items(store, read_items(args.items_file))} items from {args.items_file}")
+    server = create_server(store, args.host, args.port, args.latency_ms, args.jitter_ms, args.secondary_error_rate, args.seed, args.verbose)
+    print(f"Mock GitHub GraphQL API listening on http://{args.host}:{args.port}/graphql with {args.items} seeded items")
+    print(f"Point scripts at it with: export GITHUB_API=http://{args.host}:{args.port}/graphql GITHUB_TOKEN=mock")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Mock server stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import os
+import json
+import threading
+from datetime import datetime
+
+# Metadata
+# File Name: mutation_journal.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Write-ahead journal of intended and completed GitHub mutations so interrupted task runs resume without repeating work
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial JSON Lines journal with fsync, torn-line recovery and atomic checkpoints
+
+# Configuration
+CHECKPOINT_EVERY = 25  # Acknowledged steps between journal compactions
+
+class MutationJournal:
+    def __init__(self, path, checkpoint_every=CHECKPOINT_EVERY):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.lock = threading.Lock()
+        self.completed = {}
+        self.pending = set()
+        self.acks_since_checkpoint = 0
+        torn = self.load()
+        self.file = open(self.path, "a")
+        if torn:
+            # Drop the torn tail before appending, otherwise new records would be glued onto it
+            self.checkpoint_locked()
+
+    def load(self):
+        torn = False
+        if not os.path.exists(self.path):
+            return torn
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A crash mid-write leaves a torn final line; everything before it is intact
+                    print(f"Ignoring torn journal record in {self.path}")
+                    torn = True
+                    break
+                if record["op"] == "intent":
+                    self.pending.add(record["step"])
+                elif record["op"] == "abort":
+                    self.pending.discard(record["step"])
+                elif record["op"] == "done":
+                    self.pending.discard(record["step"])
+                    self.completed[record["step"]] = record["result"]
+        if self.completed or self.pending:
+            print(f"Resuming from journal {self.path}: {len(self.completed)} completed, {len(self.pending)} unacknowledged steps")
+        return torn
+
+    def append(self, record):
+        record["at"] = datetime.now().strftime("%d-%m-%Y %H:%M:%S +07")
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def result(self, step):
+        with self.lock:
+            return self.completed.get(step)
+
+    def was_interrupted(self, step):
+        with self.lock:
+            return step in self.pending
+
+    def intend(self, step, **details):
+        with self.lock:
+            self.pending.add(step)
+            self.append({"op": "intent", "step": step, "details": details})
+
+    def ack(self, step, result=True):
+        with self.lock:
+            self.pending.discard(step)
+            self.completed[step] = result
+            self.append({"op": "done", "step": step, "result": result})
+            self.acks_since_checkpoint += 1
+            if self.acks_since_checkpoint >= self.checkpoint_every:
+                self.checkpoint_locked()
+
+    def abort(self, step):
+        # The API rejected the mutation, so it is safe to retry from scratch next time
+        with self.lock:
+            self.pending.discard(step)
+            self.append({"op": "abort", "step": step})
+
+    def checkpoint(self):
+        with self.lock:
+            self.checkpoint_locked()
+
+    def checkpoint_locked(self):
+        # Rewrite only the live state, then swap it in atomically so a crash never loses acknowledged steps
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            for step, result in self.completed.items():
+                f.write(json.dumps({"op": "done", "step": step, "result": result}) + "\n")
+            for step in self.pending:
+                f.write(json.dumps({"op": "intent", "step": step, "details": {}}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.file.close()
+        os.replace(temp_path, self.path)
+        self.file = open(self.path, "a")
+        self.acks_since_checkpoint = 0
+
+    def close(self, completed=False):
+        with self.lock:
+            self.file.close()
+            if completed and not self.pending:
+                # Nothing left to resume, so the next run starts clean
+                os.remove(self.path)
+            elif completed:
+                print(f"Keeping journal {self.path}: {len(self.pending)} steps were never acknowledged")
+
+def run_step(journal, step, action, **details):
+    if journal is None:
+        return action()
+    result = journal.result(step)
+    if result is not None:
+        return result
+    journal.intend(step, **details)
+    result = action()
+    if result:
+        journal.ack(step, result)
+    else:
+        journal.abort(step)
+    return result
@@ -0,0 +1,170 @@
+import os
+import sys
+import json
+import time
+import threading
+import functools
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs
+
+try:
+    from flask import request, has_request_context
+except ImportError:
+    # CLI scripts run without Flask; only the env var switch applies there
+    request = None
+    has_request_context = lambda: False
+
+# Metadata
+# File Name: profiling.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Opt-in sampling profiler for Dash callbacks and script main() functions, writing one speedscope file per profiled run
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial stack sampler enabled by X-Profile header, ?profile=1 or PROFILE=1
+
+# Configuration
+PROFILE_ENV = os.getenv("PROFILE") == "1"  # Profile every run of a script, not just flagged requests
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+MAX_PROFILES = int(os.getenv("PROFILE_MAX_FILES", "50"))  # Oldest files are deleted beyond this
+SAMPLE_INTERVAL = 0.005  # Seconds between stack samples
+PROFILE_HEADER = "X-Profile"
+PROFILE_PARAM = "profile"
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+class SamplingProfiler:
+    def __init__(self, thread_ids=None, interval=SAMPLE_INTERVAL):
+        # None samples every thread except the sampler itself
+        self.thread_ids = thread_ids
+        self.interval = interval
+        self.frames = []
+        self.frame_index = {}
+        self.stacks = {}
+        self.thread_names = {}
+        self.stopped = threading.Event()
+        self.sampler = threading.Thread(target=self.run, daemon=True)
+        self.started_at = None
+        self.elapsed = 0.0
+
+    def frame_id(self, code):
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        if key not in self.frame_index:
+            self.frame_index[key] = len(self.frames)
+            self.frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+        return self.frame_index[key]
+
+    def sample(self, weight):
+        own_id = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self.frame_id(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            # Identical stacks are merged with summed weights to keep files small
+            thread_stacks = self.stacks.setdefault(thread_id, {})
+            key = tuple(stack)
+            thread_stacks[key] = thread_stacks.get(key, 0.0) + weight
+
+    def run(self):
+        last = time.perf_counter()
+        while not self.stopped.wait(self.interval):
+            now = time.perf_counter()
+            self.sample(now - last)
+            last = now
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self.sampler.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.sampler.join()
+        self.elapsed = time.perf_counter() - self.started_at
+        self.thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+    def to_speedscope(self, name):
+        profiles = []
+        for thread_id, stacks in self.stacks.items():
+            weights = list(stacks.values())
+            profiles.append({
+                "type": "sampled",
+                "name": f"{name} ({self.thread_names.get(thread_id, thread_id)})",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": [list(stack) for stack in stacks],
+                "weights": weights
+            })
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": f"{name} {self.elapsed:.3f}s",
+            "exporter": "profiling.py",
+            "shared": {"frames": self.frames},
+            "profiles": profiles
+        }
+
+def prune_profiles(directory=PROFILE_DIR, max_files=MAX_PROFILES):
+    paths = sorted((os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".speedscope.json")), key=os.path.getmtime)
+    for path in paths[:max(0, len(paths) - max_files)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def write_profile(profiler, name, directory=PROFILE_DIR):
+    try:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}_{name}.speedscope.json")
+        with open(path, "w") as f:
+            json.dump(profiler.to_speedscope(name), f)
+        prune_profiles(directory)
+        print(f"Profile for {name} written to {path} ({profiler.elapsed:.3f}s)")
+        return path
+    except Exception as e:
+        print(f"Failed to write profile for {name}: {str(e)}")
+        return None
+
+def requested_in_flask():
+    if not has_request_context():
+        return False
+    if request.headers.get(PROFILE_HEADER) == "1" or request.args.get(PROFILE_PARAM) == "1":
+        return True
+    # Dash callbacks are POSTs to /_dash-update-component, so ?profile=1 on the page only shows up in the Referer
+    referer = request.headers.get("Referer")
+    return bool(referer) and parse_qs(urlparse(referer).query).get(PROFILE_PARAM) == ["1"]
+
+def profile_enabled():
+    return PROFILE_ENV or requested_in_flask()
+
+def run_profiled(name, func, args, kwargs, thread_ids):
+    profiler = SamplingProfiler(thread_ids)
+    profiler.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.stop()
+        write_profile(profiler, name)
+
+def profile_callback(name):
+    # Samples only the thread serving the request; other threads belong to other requests
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profile_enabled():
+                return func(*args, **kwargs)
+            return run_profiled(name, func, args, kwargs, {threading.get_ident()})
+        return wrapper
+    return decorator
+
+def profile_main(name):
+    # Samples every thread so worker pools show up as separate profiles
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILE_ENV:
+                return func(*args, **kwargs)
+            return run_profiled(name, func, args, kwargs, None)
+        return wrapper
+    return decorator
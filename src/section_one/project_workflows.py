@@ -0,0 +1,370 @@
+import time
+import threading
+from datetime import datetime
+from graphql_transport import RATE_LIMIT_FIELDS
+from mutation_journal import run_step
+
+# Metadata
+# File Name: project_workflows.py
+# Version: 1.2
+# Owner: Andrew John Holland
+# Purpose: Create and update PMBOK tasks for every configured SilicaStormSiam project board over a shared transport and ID cache
+# Change Log (Last 4):
+#   - Version 1.2, 19-10-2026: fetch_repository resolves the repository ID through the ID cache and lists issues from the cached node on later calls
+#   - Version 1.1, 19-10-2026: Journaled create, add and status mutations so interrupted runs resume cleanly
+#   - Version 1.0, 19-10-2026: Initial workflows for SSS, RATS and HHD ported from manage_project_board_v1.3.py, update_sss_tasks_v1.1.py, manage_rats_tasks_v1.0.py and manage_hhd_tasks_v1.1.py
+
+# Configuration
+log_file = "project_log.txt"
+log_lock = threading.Lock()
+
+# Project registry; "status" is the PMBOK process group, "status_aliases" maps it onto boards without PMBOK columns
+PROJECTS = {
+    "sss": {
+        "name": "SSS-Project Dashboard",
+        "repo": "silicastormsiam/project-dashboards",
+        "project_id": "PVT_kwHOCZq5ps4A-gWw",  # Verify for projects/2
+        "issue_body": "Created for SSS-Project Dashboard",
+        "tasks": [
+            {"title": "Install Python and dependencies on VPS", "status": "Executing"},
+            {"title": "Configure NGINX and SSL for cyberpunkmonk.com", "status": "Executing"},
+            {"title": "Set up cron job for sync_dashboard_v1.4.py", "status": "Executing"},
+            {"title": "Define dashboard requirements", "status": "Executing"},
+            {"title": "Develop Plotly Dash dashboard code", "status": "Executing"},
+            {"title": "Integrate GitHub API for data", "status": "Executing"},
+            {"title": "Deploy dashboard on cyberpunkmonk.com", "status": "Executing"},
+            {"title": "Define Section Three scope", "status": "Executing"},
+            {"title": "Configure /volume1/GitHub/ shared folder", "status": "Closing"},
+            {"title": "Add SSH deploy key to GitHub", "status": "Closing"},
+            {"title": "Install Git Server", "status": "Executing"},
+            {"title": "Set up Synology sync script", "status": "Executing"},
+            {"title": "Initialize Synology bare repository", "status": "Executing"},
+            {"title": "Create GitHub repository backup", "status": "Executing"},
+            {"title": "AIFU - Artificial Intelligence Future Uncovered YouTube Channel", "status": "Closing"},
+            {"title": "RATS - Recruitment Application Tracking System", "status": "Executing"},
+            {"title": "Homelab Hardware Development: Create internal inventory with IPs and ports", "status": "Initiating"},
+            {"title": "Homelab Hardware Development: Create public inventory without sensitive data", "status": "Initiating"},
+            {"title": "CPM - Chatbot Project Management", "status": "Planning"}
+        ]
+    },
+    "rats": {
+        "name": "RATS - Recruitment Application Tracking System",
+        "repo": "silicastormsiam/rats",
+        "project_id": "PVT_kwHOCZq5ps4A-gXy",  # Verify for projects/3
+        "issue_body": "Created for RATS project using PMBOK process groups",
+        "tasks": [
+            {"title": "Create/update profiles on 9 platforms", "status": "Executing"},
+            {"title": "Configure job alerts for IT roles", "status": "Executing"},
+            {"title": "Verify platform profiles and alerts", "status": "Monitoring and Controlling"},
+            {"title": "Set up email consolidation process", "status": "Executing"},
+            {"title": "Validate database fields", "status": "Monitoring and Controlling"},
+            {"title": "Create dashboard", "status": "Executing"},
+            {"title": "Process daily job alerts", "status": "Executing"},
+            {"title": "Deploy system and train user", "status": "Closing"},
+            {"title": "Create a Daily Checklist - RATS", "status": "Planning"}
+        ]
+    },
+    "hhd": {
+        "name": "Homelab Hardware Development",
+        "repo": "silicastormsiam/homelab-hardware",
+        "project_id": "PVT_kwHOCZq5ps4A-gXz",  # Verify this matches projects/4/views/1
+        "issue_body": "Task for Homelab Hardware Development (HHD) project, aligned with PMBOK {status} process. Daily Checklist Item.",
+        "status_aliases": {
+            "Initiating": "To Do",
+            "Planning": "In Progress",
+            "Executing": "In Progress",
+            "Monitoring and Controlling": "In Review",
+            "Closing": "Done"
+        },
+        "tasks": [
+            {"title": "Project Initiation - Define Homelab Inventory Project", "status": "Initiating"},
+            {"title": "Plan Inventory Management - Develop Homelab Inventory - Original", "status": "Planning"},
+            {"title": "Plan Inventory Management - Develop Homelab Inventory - Skeleton", "status": "Planning"},
+            {"title": "Implement Inventory - Update Homelab Inventory - Original", "status": "Executing"},
+            {"title": "Implement Inventory - Update Homelab Inventory - Skeleton", "status": "Executing"},
+            {"title": "Deploy Inventory to GitHub", "status": "Executing"},
+            {"title": "Monitor Inventory Updates - Audit Security and Accuracy", "status": "Monitoring and Controlling"},
+            {"title": "Control Changes - Track Inventory Revisions", "status": "Monitoring and Controlling"},
+            {"title": "Close Inventory Project - Finalize and Document", "status": "Closing"}
+        ]
+    }
+}
+
+REPOSITORY_QUERY = """
+query($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    id
+    issues(first: 100, states: OPEN, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        id
+        title
+      }
+    }
+  }
+%s}
+""" % RATE_LIMIT_FIELDS
+
+REPOSITORY_ISSUES_QUERY = """
+query($repositoryId: ID!, $after: String) {
+  node(id: $repositoryId) {
+    ... on Repository {
+      id
+      issues(first: 100, states: OPEN, after: $after) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          id
+          title
+        }
+      }
+    }
+  }
+%s}
+""" % RATE_LIMIT_FIELDS
+
+STATUS_FIELD_QUERY = """
+query($projectId: ID!) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      field(name: "Status") {
+        ... on ProjectV2SingleSelectField {
+          id
+          options {
+            id
+            name
+          }
+        }
+      }
+    }
+  }
+%s}
+""" % RATE_LIMIT_FIELDS
+
+PROJECT_ITEMS_QUERY = """
+query($projectId: ID!, $after: String) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      items(first: 100, after: $after) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          id
+          content {
+            ... on Issue {
+              id
+              title
+            }
+          }
+          fieldValueByName(name: "Status") {
+            ... on ProjectV2ItemFieldSingleSelectValue {
+              optionId
+            }
+          }
+        }
+      }
+    }
+  }
+%s}
+""" % RATE_LIMIT_FIELDS
+
+CREATE_ISSUE_MUTATION = """
+mutation($repositoryId: ID!, $title: String!, $body: String!) {
+  createIssue(input: {repositoryId: $repositoryId, title: $title, body: $body}) {
+    issue {
+      id
+      title
+    }
+  }
+}
+"""
+
+ADD_ITEM_MUTATION = """
+mutation($projectId: ID!, $contentId: ID!) {
+  addProjectV2ItemById(input: {projectId: $projectId, contentId: $contentId}) {
+    item {
+      id
+    }
+  }
+}
+"""
+
+UPDATE_STATUS_MUTATION = """
+mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $optionId: String!) {
+  updateProjectV2ItemFieldValue(input: {projectId: $projectId, itemId: $itemId, fieldId: $fieldId, value: {singleSelectOptionId: $optionId}}) {
+    projectV2Item {
+      id
+    }
+  }
+}
+"""
+
+def log_action(message):
+    with log_lock:
+        with open(log_file, "a") as f:
+            f.write(f"{message} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+
+def fetch_repository(transport, cache, repo_name):
+    owner, name = repo_name.split("/")
+    titles = {}
+    loaded = False
+
+    def list_issues(query, variables, repository_of):
+        # Returns the repository ID once every open issue is in titles, or None on error
+        after = None
+        while True:
+            result = transport.execute(query, {**variables, "after": after})
+            if "errors" in result:
+                print(f"Error fetching repository {repo_name}: {result['errors']}")
+                return None
+            repository = repository_of(result["data"])
+            for issue in repository["issues"]["nodes"]:
+                titles[issue["title"]] = issue["id"]
+            if not repository["issues"]["pageInfo"]["hasNextPage"]:
+                return repository["id"]
+            after = repository["issues"]["pageInfo"]["endCursor"]
+
+    def load():
+        nonlocal loaded
+        loaded = True
+        return list_issues(REPOSITORY_QUERY, {"owner": owner, "name": name}, lambda data: data["repository"])
+
+    repo_id = cache.get_or_load(("repository", repo_name), load)
+    if repo_id is None:
+        return None, {}
+    if not loaded:
+        # The ID is already resolved, so the issues are listed from the repository node
+        if list_issues(REPOSITORY_ISSUES_QUERY, {"repositoryId": repo_id}, lambda data: data["node"]) is None:
+            return None, {}
+    return repo_id, titles
+
+def get_status_field(transport, cache, project_id):
+    def load():
+        result = transport.execute(STATUS_FIELD_QUERY, {"projectId": project_id})
+        if "errors" in result:
+            print(f"Error fetching status field: {result['errors']}")
+            return None
+        field = ((result.get("data") or {}).get("node") or {}).get("field")
+        if not field:
+            print("Status field not found. Please ensure your board has a 'Status' field.")
+            return None
+        return field["id"], {option["name"]: option["id"] for option in field["options"]}
+    return cache.get_or_load(("status_field", project_id), load)
+
+def get_project_items(transport, project_id):
+    items = {}
+    after = None
+    while True:
+        result = transport.execute(PROJECT_ITEMS_QUERY, {"projectId": project_id, "after": after})
+        if "errors" in result:
+            print(f"Error fetching project items: {result['errors']}")
+            return items
+        page = result["data"]["node"]["items"]
+        for item in page["nodes"]:
+            content = item.get("content") or {}
+            if "title" in content:
+                items[content["title"]] = {"id": item["id"], "option_id": (item.get("fieldValueByName") or {}).get("optionId")}
+        if not page["pageInfo"]["hasNextPage"]:
+            return items
+        after = page["pageInfo"]["endCursor"]
+
+def resolve_status_option(config, status_options, status):
+    if status in status_options:
+        return status_options[status]
+    alias = config.get("status_aliases", {}).get(status)
+    if alias:
+        return next((option_id for name, option_id in status_options.items() if alias in name), None)
+    return None
+
+def create_task(transport, config, repo_id, task):
+    body = config["issue_body"].format(status=task["status"])
+    result = transport.execute(CREATE_ISSUE_MUTATION, {"repositoryId": repo_id, "title": task["title"], "body": body})
+    if "errors" in result:
+        print(f"Error creating issue {task['title']}: {result['errors']}")
+        return None
+    return result["data"]["createIssue"]["issue"]["id"]
+
+def add_to_project(transport, project_id, issue_id):
+    result = transport.execute(ADD_ITEM_MUTATION, {"projectId": project_id, "contentId": issue_id})
+    if "errors" in result:
+        print(f"Error adding issue to project: {result['errors']}")
+        return None
+    return result["data"]["addProjectV2ItemById"]["item"]["id"]
+
+def update_status(transport, project_id, item_id, field_id, option_id):
+    result = transport.execute(UPDATE_STATUS_MUTATION, {"projectId": project_id, "itemId": item_id, "fieldId": field_id, "optionId": option_id})
+    if "errors" in result:
+        print(f"Error updating status: {result['errors']}")
+        return False
+    return True
+
+def run_project(transport, cache, key, journal=None):
+    config = PROJECTS[key]
+    project_id = config["project_id"]
+    summary = {"project": key, "created": 0, "updated": 0, "skipped": 0, "errors": 0, "seconds": 0.0}
+    start = time.perf_counter()
+    try:
+        repo_id, existing = fetch_repository(transport, cache, config["repo"])
+        if not repo_id:
+            summary["errors"] += 1
+            return summary
+        status_field = get_status_field(transport, cache, project_id)
+        if not status_field:
+            summary["errors"] += 1
+            return summary
+        field_id, status_options = status_field
+        items = get_project_items(transport, project_id)
+
+        for task in config["tasks"]:
+            title = task["title"]
+            item = items.get(title)
+            if not item:
+                create_step = f"create_issue:{title}"
+                issue_id = existing.get(title) or (journal.result(create_step) if journal else None)
+                if issue_id and journal and journal.was_interrupted(create_step):
+                    journal.ack(create_step, issue_id)
+                if not issue_id:
+                    issue_id = run_step(journal, create_step, lambda: create_task(transport, config, repo_id, task), title=title)
+                    if not issue_id:
+                        summary["errors"] += 1
+                        continue
+                    summary["created"] += 1
+                # Issues left outside the board by an earlier run are added here as well
+                item_id = run_step(journal, f"add_to_project:{title}", lambda: add_to_project(transport, project_id, issue_id), issue_id=issue_id)
+                if not item_id:
+                    summary["errors"] += 1
+                    continue
+                log_action(f"[{key}] Created and assigned: {title}")
+                item = {"id": item_id, "option_id": None}
+
+            option_id = resolve_status_option(config, status_options, task["status"])
+            if not option_id:
+                print(f"[{key}] Status option not found: {task['status']} for {title}")
+                summary["errors"] += 1
+                continue
+            if item["option_id"] == option_id:
+                summary["skipped"] += 1
+                continue
+            if run_step(journal, f"update_status:{title}:{option_id}", lambda: update_status(transport, project_id, item["id"], field_id, option_id), item_id=item["id"]):
+                summary["updated"] += 1
+                log_action(f"[{key}] Updated status for {title} to {task['status']}")
+            else:
+                summary["errors"] += 1
+        if journal:
+            journal.close(completed=True)
+            journal = None
+    except Exception as e:
+        print(f"[{key}] Failed to run project workflow: {str(e)}")
+        summary["errors"] += 1
+    finally:
+        if journal:
+            journal.close()
+        summary["seconds"] = time.perf_counter() - start
+    return summary
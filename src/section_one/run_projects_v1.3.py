@@ -0,0 +1,63 @@
+import os
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+import metrics
+from profiling import profile_main
+from graphql_transport import GraphQLTransport, RateLimitBudget, IdCache, TOKEN, MAX_CONCURRENT_REQUESTS
+from project_workflows import PROJECTS, run_project, log_action
+from mutation_journal import MutationJournal
+
+# Metadata
+# File Name: run_projects_v1.3.py
+# Version: 1.3
+# Owner: Andrew John Holland
+# Purpose: Run the create/update task workflows for any set of configured projects concurrently over one transport, ID cache and rate-limit budget
+# Change Log (Last 4):
+#   - Version 1.3, 19-10-2026: Profiled main() across all worker threads when PROFILE=1
+#   - Version 1.2, 19-10-2026: Added --metrics-file to write GraphQL and ID cache metrics at exit
+#   - Version 1.1, 19-10-2026: Added per-project mutation journals so interrupted runs resume
+#   - Version 1.0, 19-10-2026: Initial parallel runner replacing sequential runs of manage_project_board_v1.3.py, manage_rats_tasks_v1.0.py and manage_hhd_tasks_v1.1.py
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create and update PMBOK tasks for several GitHub Project boards at once")
+    parser.add_argument("projects", nargs="*", metavar="PROJECT", help=f"Projects to run: {', '.join(sorted(PROJECTS))} (default: all)")
+    parser.add_argument("--workers", type=int, default=0, help="Projects run at the same time (default: one per project)")
+    parser.add_argument("--journal-dir", default=".", help="Directory for per-project mutation journals used to resume interrupted runs")
+    parser.add_argument("--max-requests", type=int, default=MAX_CONCURRENT_REQUESTS, help="GraphQL requests in flight across all projects")
+    parser.add_argument("--metrics-file", default=os.getenv("METRICS_FILE", "run_projects.prom"), help="Prometheus text file written at exit (empty to disable)")
+    args = parser.parse_args()
+    unknown = [key for key in args.projects if key not in PROJECTS]
+    if unknown:
+        parser.error(f"unknown project(s): {', '.join(unknown)}")
+    return args
+
+def print_summary(summaries, budget, cache, elapsed):
+    print(f"{'Project':<10}{'Created':>9}{'Updated':>9}{'Skipped':>9}{'Errors':>8}{'Seconds':>10}")
+    for summary in summaries:
+        print(f"{summary['project']:<10}{summary['created']:>9}{summary['updated']:>9}{summary['skipped']:>9}{summary['errors']:>8}{summary['seconds']:>10.2f}")
+    print(f"Total wall time: {elapsed:.2f}s, GraphQL requests: {budget.requests}, points used: {budget.points_used}, points remaining: {budget.remaining}")
+    print(f"ID cache hits: {cache.hits}, misses: {cache.misses}")
+
+@profile_main("run_projects")
+def main():
+    args = parse_args()
+    metrics.enable_metrics_file(args.metrics_file)
+    if not TOKEN:
+        print("Error: GITHUB_TOKEN is not set")
+        return
+    keys = args.projects or sorted(PROJECTS)
+    budget = RateLimitBudget(max_concurrent=args.max_requests)
+    transport = GraphQLTransport(budget=budget)
+    cache = IdCache()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers or len(keys)) as executor:
+        summaries = list(executor.map(lambda key: run_project(transport, cache, key, MutationJournal(os.path.join(args.journal_dir, f"run_projects_{key}.journal.jsonl"))), keys))
+    elapsed = time.perf_counter() - start
+
+    print_summary(summaries, budget, cache, elapsed)
+    log_action(f"run_projects_v1.3.py executed for {', '.join(keys)} in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
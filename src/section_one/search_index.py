@@ -0,0 +1,228 @@
+import os
+import re
+import gzip
+import json
+import math
+import heapq
+import threading
+from bisect import bisect_left
+
+# Metadata
+# File Name: search_index.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Local inverted index over task titles, bodies and labels with BM25 ranking, updated incrementally by the sync job and queried by the dashboard search box
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: The last query word always expands as a prefix, with prefix-only terms weighted below exact matches
+#   - Version 1.0, 19-10-2026: Initial incremental index with field weights, prefix matching on the last query term, score-sorted postings with early termination and atomic gzip JSON persistence
+
+# Configuration
+SEARCH_INDEX_FILE = os.getenv("SEARCH_INDEX_FILE", "search_index.json.gz")
+INDEX_VERSION = 1
+FIELD_WEIGHTS = {"title": 3.0, "labels": 2.0, "body": 1.0}  # A term in a title counts three times as much as one in a body
+K1 = 1.2  # BM25 term frequency saturation
+B = 0.75  # BM25 document length normalisation
+MAX_RESULTS = 20
+MAX_PREFIX_TERMS = 50  # Terms a partial last word may expand to, e.g. "dash" -> "dashboard", "dashboards"
+PREFIX_WEIGHT = 0.5  # A term the last word only starts counts half as much as the word itself, so exact matches rank first
+IMPACT_CACHE_TERMS = 5000  # Score-sorted posting lists kept between searches
+WARM_MIN_POSTINGS = 1000  # Lists at least this long are sorted when the index is loaded rather than on first search
+TOKEN_PATTERN = re.compile(r"\w+")
+
+loaded_indexes = {}  # path -> (mtime, SearchIndex), so dashboard workers only re-read the file after a sync
+loaded_lock = threading.Lock()
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+def weighted_terms(title, body, labels):
+    terms = {}
+    for field, tokens in (("title", tokenize(title)), ("body", tokenize(body)), ("labels", tokenize(" ".join(labels)))):
+        weight = FIELD_WEIGHTS[field]
+        for token in tokens:
+            terms[token] = terms.get(token, 0.0) + weight
+    return terms
+
+class SearchIndex:
+    def __init__(self):
+        self.docs = {}  # item ID -> (title, updatedAt, labels, weighted term frequencies)
+        self.postings = {}  # term -> {item ID: weighted term frequency}
+        self.lengths = {}
+        self.total_length = 0.0
+        # Derived from the above on the first search after a change
+        self.norms = None
+        self.vocabulary = None
+        self.impacts = {}
+
+    def __len__(self):
+        return len(self.docs)
+
+    def updated_at(self, item_id):
+        doc = self.docs.get(item_id)
+        return doc[1] if doc else None
+
+    def add(self, item_id, title, updated_at, labels, terms):
+        self.docs[item_id] = (title, updated_at, labels, terms)
+        for term, frequency in terms.items():
+            self.postings.setdefault(term, {})[item_id] = frequency
+        length = sum(terms.values())
+        self.lengths[item_id] = length
+        self.total_length += length
+        self.reset_derived()
+
+    def remove(self, item_id):
+        doc = self.docs.pop(item_id, None)
+        if doc is None:
+            return False
+        for term in doc[3]:
+            postings = self.postings[term]
+            del postings[item_id]
+            if not postings:
+                del self.postings[term]
+        self.total_length -= self.lengths.pop(item_id)
+        self.reset_derived()
+        return True
+
+    def upsert(self, item_id, title, body, labels, updated_at):
+        # Only the changed item's postings are touched, whatever the size of the index
+        self.remove(item_id)
+        self.add(item_id, title, updated_at, list(labels), weighted_terms(title, body, labels))
+
+    def retain(self, item_ids):
+        # Drops items that have left the board; returns how many were removed
+        stale = [item_id for item_id in self.docs if item_id not in item_ids]
+        for item_id in stale:
+            self.remove(item_id)
+        return len(stale)
+
+    def reset_derived(self):
+        self.norms = None
+        self.vocabulary = None
+        self.impacts = {}
+
+    def expand(self, prefix):
+        if self.vocabulary is None:
+            self.vocabulary = sorted(self.postings)
+        terms = []
+        position = bisect_left(self.vocabulary, prefix)
+        while position < len(self.vocabulary) and len(terms) < MAX_PREFIX_TERMS and self.vocabulary[position].startswith(prefix):
+            terms.append(self.vocabulary[position])
+            position += 1
+        return terms
+
+    def idf(self, term):
+        frequency = len(self.postings[term])
+        return math.log(1 + (len(self.docs) - frequency + 0.5) / (frequency + 0.5))
+
+    def prepare_norms(self):
+        if self.norms is None:
+            average = self.total_length / (len(self.docs) or 1) or 1.0
+            self.norms = {item_id: K1 * (1 - B + B * length / average) for item_id, length in self.lengths.items()}
+
+    def warm(self, min_postings=WARM_MIN_POSTINGS):
+        # Common words would otherwise cost a sort of their whole posting list on the first search that uses them
+        self.prepare_norms()
+        for term, postings in self.postings.items():
+            if len(postings) >= min_postings:
+                self.term_impacts(term, self.idf(term))
+        return self
+
+    def term_impacts(self, term, idf):
+        # BM25 contribution of term to each item, highest first
+        impacts = self.impacts.get(term)
+        if impacts is None:
+            norms = self.norms
+            impacts = sorted(((idf * frequency * (K1 + 1) / (frequency + norms[item_id]), item_id) for item_id, frequency in self.postings[term].items()), reverse=True)
+            if len(self.impacts) >= IMPACT_CACHE_TERMS:
+                self.impacts = {}
+            self.impacts[term] = impacts
+        return impacts
+
+    def score(self, item_id, weights):
+        norm = self.norms[item_id]
+        total = 0.0
+        for postings, weight in weights:
+            frequency = postings.get(item_id)
+            if frequency:
+                total += weight * frequency * (K1 + 1) / (frequency + norm)
+        return total
+
+    def search(self, query, limit=MAX_RESULTS):
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self.docs:
+            return []
+        self.prepare_norms()
+        terms = {}  # term -> share of its BM25 score that counts
+        for token in tokens:
+            if token in self.postings:
+                terms[token] = 1.0
+        # The last word may still be being typed, so it always matches as a prefix too
+        for term in self.expand(tokens[-1]):
+            terms.setdefault(term, PREFIX_WEIGHT)
+        idfs = {term: self.idf(term) for term in terms}
+        weights = [(self.postings[term], idfs[term] * share) for term, share in terms.items()]
+        # Scaling keeps a list's order, so the cached impacts serve both exact and prefix terms
+        lists = [(share, self.term_impacts(term, idfs[term])) for term, share in terms.items()]
+        # Threshold algorithm: walk the score-sorted lists in step and stop once no unseen item can beat the current top results
+        top = []
+        seen = set()
+        depth = 0
+        while True:
+            threshold = 0.0
+            advanced = False
+            for share, impacts in lists:
+                if depth < len(impacts):
+                    impact, item_id = impacts[depth]
+                    threshold += impact * share
+                    advanced = True
+                    if item_id not in seen:
+                        seen.add(item_id)
+                        entry = (self.score(item_id, weights), item_id)
+                        if len(top) < limit:
+                            heapq.heappush(top, entry)
+                        elif entry > top[0]:
+                            heapq.heapreplace(top, entry)
+            if not advanced or (len(top) >= limit and top[0][0] >= threshold):
+                break
+            depth += 1
+        results = []
+        for score, item_id in sorted(top, reverse=True):
+            title, updated_at, labels, _ = self.docs[item_id]
+            results.append({"id": item_id, "title": title, "labels": labels, "updatedAt": updated_at, "score": round(score, 3)})
+        return results
+
+    def save(self, path=SEARCH_INDEX_FILE):
+        # Atomic, so the dashboard never loads a half-written index
+        temp_path = f"{path}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "docs": self.docs}, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+def load_index(path=SEARCH_INDEX_FILE):
+    # Postings are rebuilt from the per-item terms rather than stored twice
+    index = SearchIndex()
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return index
+    except (OSError, ValueError) as e:
+        print(f"Failed to load search index {path}, starting empty: {str(e)}")
+        return index
+    if data.get("version") != INDEX_VERSION:
+        return index
+    for item_id, (title, updated_at, labels, terms) in data["docs"].items():
+        index.add(item_id, title, updated_at, labels, terms)
+    return index
+
+def shared_index(path=SEARCH_INDEX_FILE):
+    # Reloaded only when the sync job has replaced the file
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    with loaded_lock:
+        loaded = loaded_indexes.get(path)
+        if loaded is None or loaded[0] != mtime:
+            loaded = loaded_indexes[path] = (mtime, load_index(path).warm())
+        return loaded[1]
@@ -0,0 +1,216 @@
+import io
+import os
+import stat
+import time
+import atexit
+import tempfile
+import threading
+from contextlib import contextmanager
+import metrics
+
+try:
+    import fcntl
+except ImportError:
+    # Without flock (Windows), identical requests are shared between threads but not between processes
+    fcntl = None
+
+# Metadata
+# File Name: single_flight.py
+# Version: 1.3
+# Owner: Andrew John Holland
+# Purpose: Coalesce identical in-flight GitHub requests across threads and processes, so dashboard workers, browser tabs and the sync job share one request and its response
+# Change Log (Last 4):
+#   - Version 1.3, 19-10-2026: Processes only share through a directory owned by this user with mode 0700; bodies are created 0600; a flight only removes its own lock file
+#   - Version 1.2, 19-10-2026: A process exiting right after a fetch gives the processes that waited on it SHARED_BODY_GRACE to read the body before removing it
+#   - Version 1.1, 19-10-2026: Threads share the body in memory and the leader streams it as it arrives; files for other processes are removed with their lock and swept after SHARED_BODY_TTL
+#   - Version 1.0, 19-10-2026: Initial in-process flights and flock-guarded result files shared between processes
+
+# Configuration
+SINGLE_FLIGHT_DIR = os.getenv("SINGLE_FLIGHT_DIR", os.path.join(tempfile.gettempdir(), "graphql_single_flight"))
+SHARED_BODY_TTL = 30.0  # Seconds a body stays on disk for processes that waited on it; board data is private, so never longer
+SHARED_BODY_GRACE = 0.5  # Seconds a process exiting right after publishing waits for the processes woken by its lock to read the body
+
+class Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.body = None
+        self.error = None
+
+class TeeReader:
+    # Hands the response to the leader as it arrives and keeps a copy of the page for the callers sharing it
+    def __init__(self, body):
+        self.body = body
+        self.copy = io.BytesIO()
+
+    def read(self, size=-1):
+        data = self.body.read(size)
+        self.copy.write(data)
+        return data
+
+    def drain(self):
+        while self.read(65536):
+            pass
+        return self.copy.getvalue()
+
+@contextmanager
+def fetched(fetch):
+    yield io.BytesIO(fetch())
+
+def remove_lock(lock_file, lock_path):
+    # Only the file this caller holds; a later flight may already have created and locked a new one under the same name
+    try:
+        if os.stat(lock_path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+            os.remove(lock_path)
+    except FileNotFoundError:
+        pass
+
+class SingleFlight:
+    def __init__(self, directory=SINGLE_FLIGHT_DIR, ttl=SHARED_BODY_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.flights = {}  # key -> Flight led by one thread of this process
+        self.published = {}  # path -> when this process left the body for others; removed at exit
+        self.last_sweep = 0.0
+        self.directory_checked = None  # None until checked, then whether processes may share through the directory
+        atexit.register(self.remove_published)
+
+    def run(self, key, fetch):
+        # fetch() returns the response body as bytes; returns (body, whether another caller fetched it)
+        with self.stream(key, lambda: fetched(fetch)) as (body, shared):
+            return body.read(), shared
+
+    @contextmanager
+    def stream(self, key, open_body):
+        # open_body() is a context manager yielding the response as a file; yields (file, shared).
+        # The leader reads the response while it arrives; callers that share the request read the leader's copy.
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            metrics.graphql_coalesced.inc(scope="thread")
+            yield io.BytesIO(flight.body), True
+            return
+        try:
+            with self.process_lock(key) as (published, publish):
+                if published is not None:
+                    flight.body = published
+                    metrics.graphql_coalesced.inc(scope="process")
+                    yield io.BytesIO(published), True
+                else:
+                    with open_body() as response:
+                        tee = TeeReader(response)
+                        try:
+                            yield tee, False
+                        finally:
+                            # Callers sharing the request need the whole body, even if the leader stopped early
+                            flight.body = tee.drain()
+                    publish(flight.body)
+        except Exception as e:
+            # An error in the leader's own handling of a complete body is not passed on to the callers sharing it
+            if flight.body is None:
+                flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+
+    @contextmanager
+    def process_lock(self, key):
+        # Yields (body another process fetched while this one waited, or None; publish(body) for processes waiting here)
+        if fcntl is None:
+            yield None, lambda body: None
+            return
+        if not self.private_directory():
+            yield None, lambda body: None
+            return
+        path = os.path.join(self.directory, f"{key}.json")
+        lock_path = f"{path}.lock"
+        started = time.time_ns()
+        with os.fdopen(os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600), "a") as lock_file:
+            # Blocks while another process fetches the same key; released when the file closes
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            published = None
+            try:
+                # A body written since this call started came from the request it was waiting on
+                if os.stat(path).st_mtime_ns >= started:
+                    with open(path, "rb") as f:
+                        published = f.read()
+            except FileNotFoundError:
+                pass
+
+            def publish(body):
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as f:
+                    f.write(body)
+                # Atomic, so a waiter never reads half a body
+                os.replace(temp_path, path)
+                with self.lock:
+                    self.published[path] = time.monotonic()
+
+            try:
+                yield published, publish
+            finally:
+                # Processes already waiting hold the old lock file open; later ones start a new flight
+                remove_lock(lock_file, lock_path)
+        self.sweep()
+
+    def private_directory(self):
+        # Another local user who created the directory first could read or replace board responses, so only a directory of our own is used
+        if self.directory_checked is None:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            info = os.lstat(self.directory)
+            self.directory_checked = stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and stat.S_IMODE(info.st_mode) == 0o700
+            if not self.directory_checked:
+                print(f"Not sharing requests between processes: {self.directory} must be a directory owned by this user with mode 0700")
+        return self.directory_checked
+
+    def sweep(self):
+        # Bodies outlive their flight only long enough for the processes that waited on it to read them
+        now = time.time()
+        with self.lock:
+            if now - self.last_sweep < self.ttl:
+                return
+            self.last_sweep = now
+        if not self.private_directory():
+            return
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if name.endswith(".lock"):
+                # A lock is held for as long as its flight runs, so only unheld ones, e.g. left by a killed process, go
+                try:
+                    with os.fdopen(os.open(path, os.O_WRONLY), "a") as lock_file:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        remove_lock(lock_file, path)
+                except OSError:
+                    pass
+                continue
+            try:
+                if now - os.stat(path).st_mtime > self.ttl:
+                    os.remove(path)
+                    with self.lock:
+                        self.published.pop(path, None)
+            except OSError:
+                pass
+
+    def remove_published(self):
+        with self.lock:
+            paths, self.published = self.published, {}
+        if paths:
+            # Processes blocked on the lock wake as this one finishes, so a body published just now may not be read yet
+            time.sleep(max(0.0, SHARED_BODY_GRACE - (time.monotonic() - max(paths.values()))))
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
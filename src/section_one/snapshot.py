@@ -0,0 +1,109 @@
+import os
+import gzip
+import json
+import shutil
+import hashlib
+from datetime import datetime, timezone
+from board_model import FieldSchema, ItemTable
+
+# Metadata
+# File Name: snapshot.py
+# Version: 1.2
+# Owner: Andrew John Holland
+# Purpose: Local snapshot of the project board written by the sync job, read back row by row by the dashboard's export endpoints
+# Change Log (Last 4):
+#   - Version 1.2, 19-10-2026: Added open_snapshot so exports read the header and items from one open file
+#   - Version 1.1, 19-10-2026: Added load_table for the dashboard's offline fallback
+#   - Version 1.0, 19-10-2026: Initial gzip JSON Lines snapshot with a header holding the field schema, item count and content hash
+
+# Configuration
+SNAPSHOT_FILE = os.getenv("SNAPSHOT_FILE", "board_snapshot.jsonl.gz")
+SNAPSHOT_VERSION = 1
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# The file is two gzip members: a one-line header, then one item per line in the dashboard query shape.
+# gzip.open reads both as a single stream, and the header is known only after the items are hashed, so the members are written separately.
+
+def schema_header(schema):
+    return {"project_id": schema.project_id, "fields": list(schema.fields.values())}
+
+def read_header(path=SNAPSHOT_FILE):
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+    return header if header.get("version") == SNAPSHOT_VERSION else None
+
+def header_schema(header):
+    schema = header.get("schema")
+    return FieldSchema(schema["project_id"], schema["fields"]) if schema else None
+
+def open_snapshot(path=SNAPSHOT_FILE):
+    # Returns (header, file at the first item), or (None, None); the caller reads the items and closes the file.
+    # Both come from one open file, so a snapshot replaced in between cannot pair one header with another's items.
+    try:
+        f = gzip.open(path, "rt", encoding="utf-8")
+    except OSError:
+        return None, None
+    try:
+        header = json.loads(f.readline())
+    except (OSError, ValueError):
+        f.close()
+        return None, None
+    if header.get("version") != SNAPSHOT_VERSION:
+        f.close()
+        return None, None
+    return header, f
+
+def iter_items(f):
+    # One decoded item at a time from a file open_snapshot returned, whatever the board size
+    with f:
+        for line in f:
+            yield json.loads(line)
+
+def load_table(path=SNAPSHOT_FILE):
+    # Header and items come from one open file, so a concurrent replace cannot mix two snapshots
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != SNAPSHOT_VERSION:
+                return None, None
+            return header, ItemTable(header_schema(header)).extend(json.loads(line) for line in f)
+    except (OSError, ValueError) as e:
+        print(f"Failed to load snapshot {path}: {str(e)}")
+        return None, None
+
+def write_snapshot(items, schema=None, path=SNAPSHOT_FILE):
+    # Returns the header, and leaves an unchanged snapshot in place so its Last-Modified and ETag stay valid
+    digest = hashlib.sha256()
+    schema_json = json.dumps(schema_header(schema) if schema else None, sort_keys=True, separators=(",", ":"))
+    digest.update(schema_json.encode())
+    items_path = f"{path}.items.tmp"
+    count = 0
+    with gzip.open(items_path, "wb") as f:
+        for item in items:
+            line = (json.dumps(item, sort_keys=True, separators=(",", ":")) + "\n").encode()
+            digest.update(line)
+            f.write(line)
+            count += 1
+    previous = read_header(path)
+    if previous and previous.get("sha256") == digest.hexdigest():
+        os.remove(items_path)
+        return previous
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "generated_at": datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT),
+        "items": count,
+        "sha256": digest.hexdigest(),
+        "schema": json.loads(schema_json)
+    }
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(gzip.compress((json.dumps(header, separators=(",", ":")) + "\n").encode()))
+        with open(items_path, "rb") as items_file:
+            shutil.copyfileobj(items_file, f)
+    os.remove(items_path)
+    # Atomic, so readers see either the old snapshot or the new one
+    os.replace(temp_path, path)
+    return header
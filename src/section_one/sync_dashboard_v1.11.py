@@ -0,0 +1,241 @@
+import os
+import json
+import time
+import random
+import signal
+import argparse
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import metrics
+from profiling import profile_main
+from graphql_transport import GraphQLTransport
+from graphql_queries import items_query, items_variables, nodes_query, fields_query, fields_variables
+from board_model import ItemTable, parse_field_schema
+from board_arrow import write_arrow_snapshot, read_arrow_header, ARROW_SNAPSHOT_FILE, pa
+from search_index import load_index, SEARCH_INDEX_FILE
+from snapshot import read_header, write_snapshot, SNAPSHOT_FILE
+
+# Metadata
+# File Name: sync_dashboard_v1.11.py
+# Version: 1.11
+# Owner: Andrew Holland
+# Purpose: Synchronize GitHub Project board data with the dashboard, logging updates
+# Change Log (Last 4):
+#   - Version 1.11, 19-10-2026: Published the snapshot as an Arrow IPC file as well, for dashboard workers to memory-map, when pyarrow is installed
+#   - Version 1.10, 19-10-2026: Added --daemon, a resident sync loop that keeps its connection and search index warm, adapts its interval to board changes and the rate budget, and reports health in the sync status file and on SYNC_STATUS_PORT
+#   - Version 1.9, 19-10-2026: Wrote the local board snapshot (field schema and typed item values) that the dashboard exports are served from
+#   - Version 1.8, 19-10-2026: Fetched every page and updated the dashboard search index, requesting bodies only for items changed since the last sync
+
+# Configuration
+GITHUB_API = os.getenv("GITHUB_API", "https://api.github.com/graphql")
+USERNAME = "silicastormsiam"
+PROJECT_NUMBER = 5  # Project number for Project Dashboards on GitHub
+TOKEN = os.getenv("GITHUB_TOKEN")
+log_file = "project_log.txt"  # Adjusted for local execution; update to /var/www/dashboard on VPS
+SYNC_COLUMNS = ["id", "title", "labels", "updatedAt", "fields"]  # Bodies are fetched separately, for changed items only
+BODY_BATCH_SIZE = 100  # Item IDs per nodes() query, GitHub's maximum
+METRICS_FILE = os.getenv("METRICS_FILE", "sync_dashboard.prom")  # Point at the node_exporter textfile directory on the VPS
+MIN_INTERVAL = float(os.getenv("SYNC_MIN_INTERVAL", "60"))  # Daemon seconds between syncs while the board is changing
+MAX_INTERVAL = float(os.getenv("SYNC_MAX_INTERVAL", "1800"))  # Daemon seconds between syncs while it is idle
+JITTER = 0.1  # Each wait varies by up to 10% either way, so the daemon never polls in step with other clients
+RATE_RESERVE = 1000  # Points per rate-limit window left for the dashboard and the other scripts
+STATUS_PORT = int(os.getenv("SYNC_STATUS_PORT", "0"))  # Daemon status served as JSON on 127.0.0.1 when set
+
+def fetch_project_data(transport=None):
+    if not TOKEN:
+        error_msg = "Error: GITHUB_TOKEN is not set"
+        print(error_msg)
+        with open(log_file, "a") as f:
+            f.write(f"{error_msg} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+        return None
+    
+    transport = transport or GraphQLTransport(TOKEN, GITHUB_API)
+    
+    try:
+        schema_result = transport.execute(fields_query(), fields_variables(USERNAME, PROJECT_NUMBER))
+        if "errors" in schema_result:
+            error_msg = f"GraphQL errors: {schema_result['errors']}"
+            print(error_msg)
+            with open(log_file, "a") as f:
+                f.write(f"{error_msg} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+            return None
+        schema = parse_field_schema(schema_result)
+        data = []
+        after = None
+        while True:
+            result = transport.execute(items_query(SYNC_COLUMNS, rate_limit=True), items_variables(USERNAME, PROJECT_NUMBER, after=after))
+            if "errors" in result:
+                error_msg = f"GraphQL errors: {result['errors']}"
+                print(error_msg)
+                with open(log_file, "a") as f:
+                    f.write(f"{error_msg} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+                return None
+            items = result.get("data", {}).get("user", {}).get("projectV2", {}).get("items", {})
+            data.extend(items.get("nodes", []))
+            if not items.get("pageInfo", {}).get("hasNextPage"):
+                break
+            after = items["pageInfo"]["endCursor"]
+        if not data:
+            error_msg = "No project data returned"
+            print(error_msg)
+            with open(log_file, "a") as f:
+                f.write(f"{error_msg} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+            return None
+        return transport, schema, data
+    except Exception as e:
+        error_msg = f"Failed to fetch project data: {str(e)}"
+        print(error_msg)
+        with open(log_file, "a") as f:
+            f.write(f"{error_msg} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+        return None
+
+def fetch_bodies(transport, item_ids):
+    bodies = {}
+    for start in range(0, len(item_ids), BODY_BATCH_SIZE):
+        result = transport.execute(nodes_query(["id", "body"], rate_limit=True), {"ids": item_ids[start:start + BODY_BATCH_SIZE]})
+        if "errors" in result:
+            raise RuntimeError(f"GraphQL errors: {result['errors']}")
+        for node in result.get("data", {}).get("nodes") or []:
+            if node:
+                bodies[node["id"]] = (node.get("content") or {}).get("body") or ""
+    return bodies
+
+def update_search_index(transport, project_data, index=None):
+    # Unchanged items keep their postings; only new or edited issues are re-fetched and re-indexed
+    if index is None:
+        index = load_index(SEARCH_INDEX_FILE)
+    changed = [item for item in project_data if index.updated_at(item["id"]) != (item.get("content") or {}).get("updatedAt")]
+    bodies = fetch_bodies(transport, [item["id"] for item in changed])
+    for item in changed:
+        issue = item.get("content") or {}
+        labels = [label["name"] for label in (issue.get("labels") or {}).get("nodes", [])]
+        index.upsert(item["id"], issue.get("title", ""), bodies.get(item["id"], ""), labels, issue.get("updatedAt"))
+    removed = index.retain({item["id"] for item in project_data})
+    index.save(SEARCH_INDEX_FILE)
+    return len(changed), removed
+
+def record_sync():
+    now = time.time()
+    status = metrics.read_sync_status()
+    if status.get("last_success"):
+        metrics.sync_lag.observe(now - status["last_success"])
+    status["last_success"] = now
+    metrics.write_sync_status(status)
+
+def sync_once(transport=None, index=None):
+    # Returns whether the board changed since the last snapshot, or None if the sync failed
+    fetched = fetch_project_data(transport)
+    if not fetched:
+        print("Failed to sync project data")
+        return None
+    transport, schema, project_data = fetched
+    previous = read_header(SNAPSHOT_FILE)
+    try:
+        snapshot = write_snapshot(project_data, schema, SNAPSHOT_FILE)
+        if pa is not None and (read_arrow_header(ARROW_SNAPSHOT_FILE) or {}).get("sha256") != snapshot["sha256"]:
+            write_arrow_snapshot(ItemTable(schema).extend(project_data), snapshot, ARROW_SNAPSHOT_FILE)
+        changed, removed = update_search_index(transport, project_data, index)
+    except Exception as e:
+        error_msg = f"Failed to update snapshot or search index: {str(e)}"
+        print(error_msg)
+        with open(log_file, "a") as f:
+            f.write(f"{error_msg} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+        return None
+    record_sync()
+    
+    # Log successful sync
+    with open(log_file, "a") as f:
+        f.write(f"sync_dashboard_v1.11.py executed, synced {len(project_data)} items ({changed} re-indexed, {removed} removed, snapshot {snapshot['sha256'][:12]}) on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+    print("Successfully synced project data")
+    return previous is None or previous.get("sha256") != snapshot["sha256"]
+
+def next_interval(interval, changed, budget, cost):
+    # Faster while the board changes, slower while it is idle or GitHub is failing, and never faster than the rate budget allows
+    if changed:
+        interval = max(MIN_INTERVAL, interval / 2)
+    else:
+        interval = min(MAX_INTERVAL, interval * (2 if changed is None else 1.5))
+    if cost and budget.remaining is not None and budget.reset_at:
+        until_reset = max(budget.reset_at - time.time(), 1.0)
+        affordable = budget.remaining - RATE_RESERVE
+        interval = max(interval, until_reset * cost / affordable if affordable > cost else until_reset)
+    return interval
+
+def daemon_status():
+    status = metrics.read_sync_status()
+    daemon = status.get("daemon") or {}
+    if status.get("last_success"):
+        status["lag_seconds"] = time.time() - status["last_success"]
+    # Healthy while syncs keep landing within two of the daemon's own intervals
+    status["healthy"] = bool(daemon) and status.get("lag_seconds", float("inf")) <= 2 * max(daemon.get("interval", MIN_INTERVAL), MIN_INTERVAL) + 60
+    return status
+
+class StatusHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/metrics":
+            code, body, content_type = 200, metrics.render().encode(), "text/plain; version=0.0.4"
+        elif self.path in ("/", "/status"):
+            status = daemon_status()
+            code, body, content_type = 200 if status["healthy"] else 503, json.dumps(status).encode(), "application/json"
+        else:
+            code, body, content_type = 404, b"Not found", "text/plain"
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def run_daemon():
+    # One process for the life of the service: the transport's connections and rate budget and the in-memory search index carry over between syncs
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    if STATUS_PORT:
+        server = ThreadingHTTPServer(("127.0.0.1", STATUS_PORT), StatusHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    transport = GraphQLTransport(TOKEN, GITHUB_API)
+    index = load_index(SEARCH_INDEX_FILE)
+    daemon = {"pid": os.getpid(), "started": time.time(), "syncs": 0, "failures": 0}
+    interval = MIN_INTERVAL
+    while not stop.is_set():
+        points_used = transport.budget.points_used
+        started = time.time()
+        changed = sync_once(transport, index)
+        cost = transport.budget.points_used - points_used
+        interval = next_interval(interval, changed, transport.budget, cost)
+        wait = interval * random.uniform(1 - JITTER, 1 + JITTER)
+        daemon["syncs"] += 1
+        daemon["failures"] += changed is None
+        daemon.update({
+            "last_attempt": started,
+            "last_duration": time.time() - started,
+            "last_result": "failed" if changed is None else "changed" if changed else "unchanged",
+            "last_cost": cost,
+            "remaining_points": transport.budget.remaining,
+            "interval": interval,
+            "next_sync": time.time() + wait
+        })
+        status = metrics.read_sync_status()
+        status["daemon"] = daemon
+        metrics.write_sync_status(status)
+        metrics.write_metrics_file(METRICS_FILE)
+        stop.wait(wait)
+    with open(log_file, "a") as f:
+        f.write(f"sync_dashboard_v1.11.py daemon stopped after {daemon['syncs']} syncs on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+
+@profile_main("sync_dashboard")
+def main():
+    metrics.enable_metrics_file(METRICS_FILE)
+    sync_once()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync the GitHub Project board into the dashboard's snapshot and search index")
+    parser.add_argument("--daemon", action="store_true", help="Keep running and sync on an adaptive interval instead of once")
+    if parser.parse_args().daemon:
+        run_daemon()
+    else:
+        main()
@@ -0,0 +1,152 @@
+import sys
+import gzip
+import json
+import random
+import argparse
+from datetime import datetime, timedelta, timezone
+from urllib.request import Request, urlopen
+
+# Metadata
+# File Name: synthetic_board.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Stream synthetic ProjectV2 items shaped like the dashboard query results to JSON Lines files or the mock server, for load tests on boards of any size
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial generator with configurable section, status, body size and history distributions
+
+# Configuration
+OUTPUT_FILE = "synthetic_board.jsonl.gz"
+MOCK_ADMIN_URL = "http://127.0.0.1:8765/admin/items"
+PROJECT_NUMBER = 5
+BATCH_SIZE = 5000  # Items per POST when streaming to the mock
+SECTION_MIX = {"Section One": 0.4, "Section Two": 0.4, "Section Three": 0.15, "none": 0.05}
+STATUS_MIX = {"Initiating": 0.1, "Planning": 0.2, "Executing": 0.4, "Monitoring and Controlling": 0.2, "Closing": 0.1}
+EXTRA_LABELS = ["bug", "enhancement", "documentation", "priority: high", "blocked"]
+EXTRA_LABEL_RATE = 0.3  # Chance of each item carrying one or two labels besides its section
+KEYWORD_RATE = 0.2  # Chance of a title using the keywords the dashboard matches on instead of a label
+BODY_MIN = 50
+BODY_MAX = 2000
+HISTORY_DAYS = 365
+START_DATE = datetime(2025, 7, 22, tzinfo=timezone.utc)
+
+# Title keywords the dashboard classifies on when a section label is missing
+SECTION_KEYWORDS = {
+    "Section One": ["VPS", "Hostinger", "NGINX", "SSL"],
+    "Section Two": ["dashboard", "Plotly", "web"],
+    "Section Three": ["Section Three"]
+}
+TITLE_VERBS = ["Configure", "Review", "Document", "Deploy", "Test", "Plan", "Fix", "Migrate"]
+BODY_TEXT = ("Task generated for load testing the project dashboard. Tracks PMBOK process group progress, "
+             "dependencies, owners and acceptance criteria for this work item. ") * 40
+
+def parse_mix(text):
+    # "Section One=0.5,Section Two=0.5" -> {"Section One": 0.5, "Section Two": 0.5}
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.rpartition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+def generate_items(count, seed=7, section_mix=SECTION_MIX, status_mix=STATUS_MIX, body_min=BODY_MIN, body_max=BODY_MAX,
+                   history_days=HISTORY_DAYS, extra_label_rate=EXTRA_LABEL_RATE, keyword_rate=KEYWORD_RATE, start=START_DATE):
+    rng = random.Random(seed)
+    sections, section_weights = list(section_mix), list(section_mix.values())
+    statuses, status_weights = list(status_mix), list(status_mix.values())
+    body_text = BODY_TEXT * (body_max // len(BODY_TEXT) + 2)
+    history_minutes = max(1, history_days * 24 * 60)
+    for index in range(count):
+        section = rng.choices(sections, section_weights)[0]
+        labels = []
+        title = f"{rng.choice(TITLE_VERBS)} synthetic task {index}"
+        if section in SECTION_KEYWORDS:
+            if rng.random() < keyword_rate:
+                title = f"{title} ({rng.choice(SECTION_KEYWORDS[section])})"
+            else:
+                labels.append(section)
+        if rng.random() < extra_label_rate:
+            labels.extend(rng.sample(EXTRA_LABELS, rng.randint(1, 2)))
+        body_length = rng.randint(body_min, body_max)
+        offset = rng.randrange(0, len(BODY_TEXT))
+        updated_at = (start + timedelta(minutes=rng.randrange(history_minutes))).strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Same shape as the dashboard query: the Title field value matches no fragment and comes back empty
+        yield {
+            "content": {
+                "title": title,
+                "body": body_text[offset:offset + body_length],
+                "labels": {"nodes": [{"name": name} for name in labels]},
+                "updatedAt": updated_at
+            },
+            "fieldValues": {"nodes": [{}, {"name": rng.choices(statuses, status_weights)[0]}]}
+        }
+
+def open_output(path):
+    if path == "-":
+        return sys.stdout
+    return gzip.open(path, "wt", encoding="utf-8") if path.endswith(".gz") else open(path, "w")
+
+def write_items(items, path):
+    count = 0
+    f = open_output(path)
+    try:
+        for item in items:
+            f.write(json.dumps(item, separators=(",", ":")) + "\n")
+            count += 1
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    return count
+
+def read_items(path):
+    # Streams items back one line at a time, for loaders that must not hold the whole board
+    with (gzip.open(path, "rt", encoding="utf-8") if path.endswith(".gz") else open(path)) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def post_batch(url, project_number, lines):
+    request = Request(f"{url}?project={project_number}", data="".join(lines).encode(), method="POST",
+                      headers={"Content-Type": "application/x-ndjson", "Authorization": "Bearer mock"})
+    with urlopen(request) as response:
+        return json.loads(response.read())
+
+def post_items(items, url=MOCK_ADMIN_URL, project_number=PROJECT_NUMBER, batch_size=BATCH_SIZE):
+    count = 0
+    lines = []
+    for item in items:
+        lines.append(json.dumps(item, separators=(",", ":")) + "\n")
+        if len(lines) >= batch_size:
+            count += post_batch(url, project_number, lines)["added"]
+            lines = []
+    if lines:
+        count += post_batch(url, project_number, lines)["added"]
+    return count
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate a synthetic GitHub Project board shaped like the dashboard query results")
+    parser.add_argument("--items", type=int, default=10000, help="Number of project items")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="JSON Lines file to write (.gz compresses, - for stdout)")
+    parser.add_argument("--mock-url", help=f"Stream items to the mock server's admin endpoint instead, e.g. {MOCK_ADMIN_URL}")
+    parser.add_argument("--project", type=int, default=PROJECT_NUMBER, help="Mock project number that receives the items")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for reproducible boards")
+    parser.add_argument("--section-mix", type=parse_mix, default=SECTION_MIX, help="Section weights, e.g. 'Section One=0.5,Section Two=0.3,none=0.2'")
+    parser.add_argument("--status-mix", type=parse_mix, default=STATUS_MIX, help="PMBOK status weights, e.g. 'Executing=0.7,Closing=0.3'")
+    parser.add_argument("--body-min", type=int, default=BODY_MIN, help="Shortest issue body in characters")
+    parser.add_argument("--body-max", type=int, default=BODY_MAX, help="Longest issue body in characters")
+    parser.add_argument("--history-days", type=int, default=HISTORY_DAYS, help="Spread of updatedAt values from the start date")
+    parser.add_argument("--extra-label-rate", type=float, default=EXTRA_LABEL_RATE, help="Chance of non-section labels on an item")
+    parser.add_argument("--keyword-rate", type=float, default=KEYWORD_RATE, help="Chance of a section coming from a title keyword instead of a label")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    items = generate_items(args.items, args.seed, args.section_mix, args.status_mix, args.body_min, args.body_max,
+                           args.history_days, args.extra_label_rate, args.keyword_rate)
+    if args.mock_url:
+        count = post_items(items, args.mock_url, args.project)
+        print(f"Streamed {count} synthetic items to {args.mock_url} (project {args.project})", file=sys.stderr)
+    else:
+        count = write_items(items, args.output)
+        print(f"Wrote {count} synthetic items to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ import json
 from graphqlclient import GraphQLClient
 
 # Configuration
-GITHUB_API = "https://api.github.com/graphql"
+GITHUB_API = os.getenv("GITHUB_API", "https://api.github.com/graphql")  # Point at mock_github_graphql.py for offline runs
 USERNAME = "silicastormsiam"
 PROJECT_NUMBER = 5
 TOKEN = os.getenv("GITHUB_TOKEN")
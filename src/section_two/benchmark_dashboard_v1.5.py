@@ -0,0 +1,196 @@
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+from graphqlclient import GraphQLClient
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "section_one"))
+from synthetic_board import generate_items, post_items
+from graphql_transport import GraphQLTransport
+from board_model import ItemTable, parse_field_schema
+from graphql_queries import fields_query, fields_variables
+from dashboard_data import stream_items, fetch_pages, decode_page, classify_items, build_frames, build_section_figure, serialize_tasks
+
+# Metadata
+# File Name: benchmark_dashboard_v1.5.py
+# Version: 1.5
+# Owner: Andrew John Holland
+# Purpose: Time and measure peak memory of every dashboard pipeline stage on synthetic boards of increasing size, and fail on regressions against a saved baseline
+# Change Log (Last 4):
+#   - Version 1.5, 19-10-2026: Model and stream stages ingest typed field columns using the project's field schema
+#   - Version 1.4, 19-10-2026: Added a model stage encoding items into an ItemTable, which classify now reads
+#   - Version 1.3, 19-10-2026: Added a stream stage timing fetch and incremental decode together, as the dashboard now does
+#   - Version 1.2, 19-10-2026: Boards are generated by synthetic_board.py and streamed into the mock, so bodies, labels and statuses follow realistic mixes
+
+# Configuration
+SIZES = [100, 1000, 10000, 100000]
+USERNAME = "silicastormsiam"
+PROJECT_NUMBER = 5
+MOCK_SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "section_one", "mock_github_graphql.py")
+RESULTS_FILE = "benchmark_results.json"
+BASELINE_FILE = "benchmark_baseline.json"
+THRESHOLD = 0.25  # Allowed slowdown or memory growth before a stage counts as regressed
+MIN_SECONDS = 0.01  # Ignore time differences below this; they are timer noise
+MIN_BYTES = 1024 * 1024  # Ignore memory differences below this
+MOCK_STARTUP_TIMEOUT = 60
+log_file = "project_log.txt"
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_mock(items, seed):
+    # The mock runs in its own process so its allocations and CPU time stay out of the measurements
+    port = free_port()
+    process = subprocess.Popen([sys.executable, MOCK_SERVER, "--port", str(port), "--items", "0"], stdout=subprocess.DEVNULL)
+    deadline = time.time() + MOCK_STARTUP_TIMEOUT
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Mock server exited with code {process.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            break
+        except OSError:
+            time.sleep(0.2)
+    else:
+        process.kill()
+        raise RuntimeError(f"Mock server did not start within {MOCK_STARTUP_TIMEOUT}s")
+    post_items(generate_items(items, seed), f"http://127.0.0.1:{port}/admin/items", PROJECT_NUMBER)
+    return process, f"http://127.0.0.1:{port}/graphql"
+
+def measure(stages, stage, func, track_memory):
+    if track_memory:
+        tracemalloc.reset_peak()
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    value = func()
+    elapsed = time.perf_counter() - start
+    stages[stage] = {"seconds": round(elapsed, 6)}
+    if track_memory:
+        stages[stage]["peak_bytes"] = tracemalloc.get_traced_memory()[1] - baseline_bytes
+    return value
+
+def run_pipeline(url, track_memory):
+    client = GraphQLClient(url)
+    client.inject_token("Bearer benchmark")
+    stages = {}
+    # Read directly rather than through the dashboard's schema cache, since every size runs against a fresh mock
+    transport = GraphQLTransport("benchmark", url)
+    schema = parse_field_schema(transport.execute(fields_query(), fields_variables(USERNAME, PROJECT_NUMBER)))
+    raw_pages = measure(stages, "fetch", lambda: list(fetch_pages(client.execute, USERNAME, PROJECT_NUMBER)), track_memory)
+    stages["fetch"]["response_bytes"] = sum(len(raw) for raw in raw_pages)
+    items = measure(stages, "decode", lambda: [item for raw in raw_pages for item in decode_page(raw)[0]], track_memory)
+    del raw_pages
+    table = measure(stages, "model", lambda: ItemTable(schema).extend(items), track_memory)
+    stages["model"]["table_bytes"] = table.nbytes()
+    section_data, task_data = measure(stages, "classify", lambda: classify_items(table), track_memory)
+    section_df, task_df = measure(stages, "dataframe", lambda: build_frames(section_data, task_data), track_memory)
+    measure(stages, "figure", lambda: build_section_figure(section_df), track_memory)
+    measure(stages, "table", lambda: serialize_tasks(task_df), track_memory)
+    stages["items"] = len(items)
+    del items, table, section_data, task_data
+    measure(stages, "stream", lambda: ItemTable(schema).extend(stream_items(transport, USERNAME, PROJECT_NUMBER)), track_memory)
+    return stages
+
+def best_of(runs):
+    # Keep the fastest run per stage; slower runs only add scheduler noise
+    best = runs[0]
+    for run in runs[1:]:
+        for stage, values in run.items():
+            if isinstance(values, dict) and values["seconds"] < best[stage]["seconds"]:
+                best[stage] = values
+    return best
+
+def find_regressions(results, baseline, threshold):
+    regressions = []
+    for size, stages in results["sizes"].items():
+        old_stages = baseline.get("sizes", {}).get(size)
+        if not old_stages:
+            continue
+        for stage, values in stages.items():
+            old = old_stages.get(stage)
+            if not isinstance(values, dict) or not isinstance(old, dict):
+                continue
+            if values["seconds"] > old["seconds"] * (1 + threshold) and values["seconds"] - old["seconds"] > MIN_SECONDS:
+                regressions.append(f"{size} items, {stage}: {old['seconds']:.4f}s -> {values['seconds']:.4f}s")
+            if "peak_bytes" in values and "peak_bytes" in old and values["peak_bytes"] > old["peak_bytes"] * (1 + threshold) and values["peak_bytes"] - old["peak_bytes"] > MIN_BYTES:
+                regressions.append(f"{size} items, {stage}: peak {old['peak_bytes'] / 1e6:.1f} MB -> {values['peak_bytes'] / 1e6:.1f} MB")
+    return regressions
+
+def print_report(results):
+    print(f"{'Items':>8} {'Stage':<10}{'Seconds':>10}{'Peak MB':>10}")
+    for size, stages in results["sizes"].items():
+        for stage, values in stages.items():
+            if isinstance(values, dict):
+                peak = f"{values['peak_bytes'] / 1e6:.1f}" if "peak_bytes" in values else "-"
+                print(f"{size:>8} {stage:<10}{values['seconds']:>10.4f}{peak:>10}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard pipeline on synthetic boards")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Board sizes to benchmark")
+    parser.add_argument("--seed", type=int, default=7, help="Synthetic board seed; keep it fixed when comparing against a baseline")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per size; the fastest run per stage is kept")
+    parser.add_argument("--output", default=RESULTS_FILE, help="Where to write the results JSON")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline results to compare against, if the file exists")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Fractional slowdown that counts as a regression")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc, which slows every stage down")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    track_memory = not args.no_memory
+    results = {
+        "created": datetime.now().strftime("%d-%m-%Y %H:%M +07"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "memory_tracked": track_memory,
+        "seed": args.seed,
+        "sizes": {}
+    }
+    if track_memory:
+        tracemalloc.start()
+    for size in args.sizes:
+        process, url = start_mock(size, args.seed)
+        try:
+            print(f"Benchmarking {size} items...")
+            results["sizes"][str(size)] = best_of([run_pipeline(url, track_memory) for _ in range(args.repeat)])
+        finally:
+            process.terminate()
+            process.wait()
+    if track_memory:
+        tracemalloc.stop()
+
+    print_report(results)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+
+    with open(log_file, "a") as f:
+        f.write(f"benchmark_dashboard_v1.5.py benchmarked sizes {', '.join(str(size) for size in args.sizes)} on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("memory_tracked") != track_memory:
+            print("Baseline was recorded with a different --no-memory setting; timings are not comparable")
+        regressions = find_regressions(results, baseline, args.threshold)
+        if regressions:
+            print("Regressions against baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("No regressions against baseline")
+
+if __name__ == "__main__":
+    main()
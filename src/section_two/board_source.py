@@ -0,0 +1,129 @@
+import os
+import threading
+from datetime import datetime, timezone
+import metrics
+from snapshot import load_table, SNAPSHOT_FILE, TIMESTAMP_FORMAT
+from board_arrow import shared_table, ARROW_SNAPSHOT_FILE, pa
+
+# Metadata
+# File Name: board_source.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Give the dashboard live board data when GitHub answers in time and the last good data otherwise, retrying GitHub in the background until it recovers
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Served the memory-mapped Arrow snapshot, shared by all workers, while a sync has confirmed it within SNAPSHOT_MAX_AGE
+#   - Version 1.0, 19-10-2026: Initial fetch budget, background retry with backoff and fallback to the last live result or the sync snapshot
+
+# Configuration
+FETCH_BUDGET = float(os.getenv("FETCH_BUDGET", "20"))  # Seconds a refresh waits for GitHub before serving the last good data
+RETRY_MIN_DELAY = 5.0
+RETRY_MAX_DELAY = 300.0  # Backoff between background retries doubles up to this
+SNAPSHOT_MAX_AGE = float(os.getenv("SNAPSHOT_MAX_AGE", "900"))  # A snapshot confirmed by a sync this recently is served without asking GitHub; 0 always asks
+
+class BoardSource:
+    def __init__(self, load_live, snapshot_path=SNAPSHOT_FILE, budget=FETCH_BUDGET, arrow_path=ARROW_SNAPSHOT_FILE, max_age=SNAPSHOT_MAX_AGE):
+        self.load_live = load_live
+        self.snapshot_path = snapshot_path
+        self.arrow_path = arrow_path
+        self.budget = budget
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.in_flight = None
+        self.live_table = None
+        self.live_at = None
+        self.error = None
+        self.retry_delay = RETRY_MIN_DELAY
+        self.retry_timer = None
+        self.snapshot = (None, None, None)  # (mtime, table, header) of the JSON Lines snapshot
+
+    def fetch_live(self, done):
+        try:
+            table = self.load_live()
+        except Exception as e:
+            with self.lock:
+                self.error = str(e)
+                self.in_flight = None
+                self.schedule_retry()
+        else:
+            with self.lock:
+                self.live_table = table
+                self.live_at = datetime.now(timezone.utc)
+                self.error = None
+                self.retry_delay = RETRY_MIN_DELAY
+                self.in_flight = None
+        finally:
+            done.set()
+
+    def start_fetch(self):
+        # Called with the lock held; concurrent refreshes share one live load
+        if self.in_flight is None:
+            self.in_flight = threading.Event()
+            threading.Thread(target=self.fetch_live, args=(self.in_flight,), daemon=True).start()
+        return self.in_flight
+
+    def schedule_retry(self):
+        # Called with the lock held
+        if self.retry_timer is None:
+            self.retry_timer = threading.Timer(self.retry_delay, self.retry)
+            self.retry_timer.daemon = True
+            self.retry_timer.start()
+            self.retry_delay = min(self.retry_delay * 2, RETRY_MAX_DELAY)
+
+    def retry(self):
+        with self.lock:
+            self.retry_timer = None
+            self.start_fetch()
+
+    def load_snapshot(self):
+        table = None
+        if pa is not None:
+            try:
+                table = shared_table(self.arrow_path)
+            except Exception as e:
+                print(f"Failed to map snapshot {self.arrow_path}: {str(e)}")
+        if table is not None:
+            header = table.header
+        else:
+            # Without the Arrow file, this worker decodes its own copy, re-read only when the sync job has replaced the file
+            try:
+                mtime = os.stat(self.snapshot_path).st_mtime_ns
+            except OSError:
+                return None, None
+            cached_mtime, table, header = self.snapshot
+            if cached_mtime != mtime:
+                header, table = load_table(self.snapshot_path)
+                if header is None:
+                    return None, None
+                self.snapshot = (mtime, table, header)
+        as_of = datetime.strptime(header["generated_at"], TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+        # An unchanged snapshot keeps its old timestamp, but every successful sync since has confirmed it
+        last_success = metrics.read_sync_status().get("last_success")
+        if last_success:
+            as_of = max(as_of, datetime.fromtimestamp(last_success, timezone.utc))
+        return table, as_of
+
+    def current(self):
+        # Returns (table, status); status["live"] is False when the table is older data served in GitHub's place
+        if self.max_age > 0:
+            table, as_of = self.load_snapshot()
+            if table is not None and (datetime.now(timezone.utc) - as_of).total_seconds() <= self.max_age:
+                with self.lock:
+                    # Every worker shares the snapshot, so a private live copy is no longer worth keeping
+                    self.live_table = None
+                return table, {"live": True, "as_of": as_of, "error": None}
+        with self.lock:
+            done = self.start_fetch() if self.error is None else None
+        # While degraded, refreshes never wait on GitHub; the background retry restores live data
+        if done is not None and not done.wait(self.budget):
+            with self.lock:
+                if self.in_flight is done:
+                    # The slow load keeps running and counts as the retry
+                    self.error = f"GitHub did not answer within {self.budget:.0f}s"
+        with self.lock:
+            if self.error is None and self.live_table is not None:
+                return self.live_table, {"live": True, "as_of": self.live_at, "error": None}
+            live_table, live_at, error = self.live_table, self.live_at, self.error
+        table, as_of = self.load_snapshot()
+        if live_table is not None and (as_of is None or live_at >= as_of):
+            table, as_of = live_table, live_at
+        return table, {"live": False, "as_of": as_of, "error": error}
@@ -0,0 +1,181 @@
+import os
+import re
+import json
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from graphql_queries import items_query, items_variables, fields_query, fields_variables
+from graphql_transport import NodeStream, IdCache
+from board_model import ItemTable, parse_field_schema
+from section_rules import load_rules
+
+# Metadata
+# File Name: dashboard_data.py
+# Version: 1.11
+# Owner: Andrew John Holland
+# Purpose: Data pipeline behind the Project Dashboard (fetch, decode, section classification, DataFrames, figure and table), split into stages that can be timed on their own
+# Change Log (Last 4):
+#   - Version 1.11, 19-10-2026: Streamed item pages ask for rateLimit, so the transport charges them to the shared budget
+#   - Version 1.10, 19-10-2026: classify_items reads each table column once, so it runs on a memory-mapped board_arrow.py table as well as an ItemTable
+#   - Version 1.9, 19-10-2026: build_section_figure returns an empty chart with a notice when there is no board data, instead of failing in px.bar
+#   - Version 1.8, 19-10-2026: Sections assigned by the rules in section_rules.json with one combined keyword scan per title; counts follow the assigned section
+
+# Configuration
+PAGE_SIZE = 100
+STATUS_COLUMNS = ["Initiating", "Planning", "Executing", "Monitoring and Controlling", "Closing"]
+SECTION_COLUMNS = ["Section Name"] + STATUS_COLUMNS
+TASK_COLUMNS = ["Section Name", "Task Title", "Process Group", "Last Updated"]
+ITEM_COLUMNS = ["title", "labels", "updatedAt", "fields"]  # Item fields classify_items reads, plus every typed field value
+ITEMS_PATH = "data.user.projectV2.items"
+SECTION_RULES = load_rules()  # Section names, labels and title keywords, in precedence order
+SECTION_NAMES = SECTION_RULES.names
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"  # GitHub updatedAt
+DISPLAY_TZ = os.getenv("DISPLAY_TZ", "Asia/Bangkok")
+DISPLAY_FORMAT = "%d-%m-%Y %H:%M %Z"  # %Z renders as +07 for Asia/Bangkok
+DISPLAY_CACHE_LIMIT = 100000  # Distinct minutes kept formatted between refreshes
+display_cache = {}
+schema_cache = IdCache()  # FieldSchema per (username, project number)
+# pageInfo is selected before nodes, so it sits at the head of every response and can be read without a full decode
+PAGE_INFO_PATTERN = re.compile(r'"hasNextPage":\s*(true|false),\s*"endCursor":\s*(null|"[^"]*")')
+
+def fetch_pages(execute, username, project_number, page_size=PAGE_SIZE):
+    # Yields raw response bodies so fetching and decoding can be measured separately
+    query = items_query(ITEM_COLUMNS)
+    after = None
+    while True:
+        raw = execute(query, items_variables(username, project_number, page_size, after))
+        yield raw
+        match = PAGE_INFO_PATTERN.search(raw)
+        if not match or match.group(1) != "true":
+            return
+        after = json.loads(match.group(2))
+
+def decode_page(raw):
+    result = json.loads(raw)
+    if "errors" in result:
+        raise RuntimeError(f"GraphQL errors: {result['errors']}")
+    items = result.get("data", {}).get("user", {}).get("projectV2", {}).get("items", {})
+    return items.get("nodes", []), items.get("pageInfo", {})
+
+def stream_items(transport, username, project_number, page_size=PAGE_SIZE):
+    # Holds at most one decoded item per page in flight, never a whole response string or tree
+    query = items_query(ITEM_COLUMNS, rate_limit=True)
+    after = None
+    while True:
+        with transport.stream(query, items_variables(username, project_number, page_size, after)) as body:
+            nodes = NodeStream(body, ITEMS_PATH)
+            yield from nodes
+        if nodes.errors:
+            raise RuntimeError(f"GraphQL errors: {nodes.errors}")
+        if not nodes.page_info.get("hasNextPage"):
+            return
+        after = nodes.page_info.get("endCursor")
+
+def fetch_schema(transport, username, project_number):
+    # Field IDs and options rarely change, so they are read once per project and process
+    def load():
+        result = transport.execute(fields_query(), fields_variables(username, project_number))
+        if "errors" in result:
+            raise RuntimeError(f"GraphQL errors: {result['errors']}")
+        return parse_field_schema(result)
+    return schema_cache.get_or_load((username, int(project_number)), load)
+
+def load_table(transport, username, project_number, page_size=PAGE_SIZE):
+    return ItemTable(fetch_schema(transport, username, project_number)).extend(stream_items(transport, username, project_number, page_size))
+
+def fetch_items(execute, username, project_number, schema=None):
+    table = ItemTable(schema)
+    for raw in fetch_pages(execute, username, project_number):
+        table.extend(decode_page(raw)[0])
+    return table
+
+def classify_items(table, rules=SECTION_RULES):
+    # One pass over the ItemTable; a section label or title keyword assigns the item to the highest-ranked matching section
+    label_positions = rules.label_positions(table.labels.values)
+    status_positions = [STATUS_COLUMNS.index(status) if status in STATUS_COLUMNS else None for status in table.statuses.values]
+    counts = [[0] * len(STATUS_COLUMNS) for _ in rules.names]
+    section_tasks = [[] for _ in rules.names]
+    offsets = table.label_offsets
+    label_codes = table.label_codes
+    status_codes = table.status_codes
+    titles = table.titles
+
+    for index, title in enumerate(titles):
+        task_section = None
+        for code in label_codes[offsets[index]:offsets[index + 1]]:
+            position = label_positions[code]
+            if position is not None and (task_section is None or position < task_section):
+                task_section = position
+        if task_section != 0:
+            keyword_section = rules.match_title(title)
+            if keyword_section is not None and (task_section is None or keyword_section < task_section):
+                task_section = keyword_section
+        if task_section is None:
+            continue
+        section_tasks[task_section].append(index)
+
+        # Count tasks per status in the section they were assigned to
+        position = status_positions[status_codes[index]]
+        if position is not None:
+            counts[task_section][position] += 1
+
+    section_data = [[name] + section_counts for name, section_counts in zip(rules.names, counts)]
+    # Task columns stay as codes and raw timestamps; build_frames turns them into categoricals and datetime64
+    task_rows = [index for tasks in section_tasks for index in tasks]
+    updated_at = table.updated_at
+    task_data = {
+        "Section Name": [section for section, tasks in enumerate(section_tasks) for _ in tasks],
+        "Task Title": [titles[index] for index in task_rows],
+        "Process Group": [status_codes[index] - 1 for index in task_rows],  # -1 is an item without a status
+        "Process Group Names": table.statuses.values[1:],
+        "Last Updated": [updated_at[index] for index in task_rows]
+    }
+    return section_data, task_data
+
+def build_frames(section_data, task_data):
+    section_df = pd.DataFrame(section_data, columns=SECTION_COLUMNS).astype({"Section Name": pd.CategoricalDtype(SECTION_NAMES)})
+    task_df = pd.DataFrame({
+        "Section Name": pd.Categorical.from_codes(task_data["Section Name"], categories=SECTION_NAMES),
+        "Task Title": task_data["Task Title"],
+        "Process Group": pd.Categorical.from_codes(task_data["Process Group"], categories=task_data["Process Group Names"]),
+        "Last Updated": pd.to_datetime(pd.Series(task_data["Last Updated"], dtype=object), format=TIMESTAMP_FORMAT, errors="coerce", utc=True)
+    }, columns=TASK_COLUMNS)
+    return section_df, task_df
+
+def build_section_figure(section_df):
+    if section_df.empty:
+        # px.bar cannot resolve its columns on an empty frame
+        section_fig = go.Figure()
+        section_fig.update_layout(title="Task Counts by PMBOK Process Group per Section", font={"family": "Arial"},
+                                  xaxis={"visible": False}, yaxis={"visible": False},
+                                  annotations=[{"text": "No board data available yet", "showarrow": False, "font": {"size": 16}}])
+        return section_fig
+    section_fig = px.bar(section_df, x="Section Name", y=STATUS_COLUMNS,
+                         title="Task Counts by PMBOK Process Group per Section",
+                         barmode="group", color_discrete_sequence=px.colors.qualitative.D3)
+    section_fig.update_layout(xaxis_title="Section", yaxis_title="Task Count", font={"family": "Arial"})
+    return section_fig
+
+def format_timestamps(timestamps):
+    # GitHub times are UTC; each distinct minute is converted to DISPLAY_TZ and formatted once, then reused across refreshes
+    minutes = timestamps.to_numpy(dtype="datetime64[m]").astype("int64")
+    codes, uniques = pd.factorize(minutes)
+    codes[timestamps.isna().to_numpy()] = -1
+    missing = [minute for minute in uniques.tolist() if minute not in display_cache]
+    if missing:
+        if len(display_cache) + len(missing) > DISPLAY_CACHE_LIMIT:
+            display_cache.clear()
+        local = pd.to_datetime(np.array(missing, dtype="int64") * 60, unit="s", utc=True).tz_convert(DISPLAY_TZ)
+        display_cache.update(zip(missing, local.strftime(DISPLAY_FORMAT)))
+    # Missing timestamps have code -1, which picks the trailing empty string
+    labels = np.array([display_cache[minute] for minute in uniques.tolist()] + [""], dtype=object)
+    return labels[codes]
+
+def serialize_tasks(task_df):
+    # Formatting happens only here, for display; the frame keeps real datetimes and categories
+    if task_df.empty:
+        return []
+    display_df = task_df.astype({"Section Name": object, "Process Group": object})
+    display_df["Last Updated"] = format_timestamps(task_df["Last Updated"])
+    return display_df.fillna("").to_dict("records")
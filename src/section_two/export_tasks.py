@@ -0,0 +1,120 @@
+import io
+import csv
+import json
+import zlib
+from datetime import datetime, timezone
+from snapshot import header_schema, iter_items, TIMESTAMP_FORMAT
+from board_model import STATUS_FIELD
+
+try:
+    import pyarrow as pa
+except ImportError:
+    # Only the .arrow export needs pyarrow; CSV and JSON Lines work without it
+    pa = None
+
+# Metadata
+# File Name: export_tasks.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Stream the dashboard task list from the local snapshot as CSV, JSON Lines or Arrow, in fixed-size chunks so memory stays flat for any board size
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Exports read items from the snapshot file their header came from
+#   - Version 1.0, 19-10-2026: Initial CSV, JSON Lines and Arrow IPC stream encoders with optional gzip
+
+# Configuration
+EXPORT_COLUMNS = ["ID", "Section Name", "Task Title", "Process Group", "Labels", "Last Updated"]
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream"
+}
+CHUNK_SIZE = 64 * 1024  # Bytes buffered before a chunk is sent
+ARROW_BATCH_ROWS = 10000
+GZIP_LEVEL = 6
+
+def task_rows(header, rules, snapshot_file):
+    # The same tasks as the dashboard table: items a section rule matches, in snapshot order
+    schema = header_schema(header)
+    status_id = schema.field_id(STATUS_FIELD) if schema else None
+    for item in iter_items(snapshot_file):
+        issue = item.get("content") or {}
+        title = issue.get("title", "")
+        labels = [label["name"] for label in (issue.get("labels") or {}).get("nodes", [])]
+        section = rules.section_for(title, labels)
+        if section is None:
+            continue
+        status = next((value.get("name") for value in (item.get("typedValues") or {}).get("nodes", []) if (value.get("field") or {}).get("id") == status_id), None)
+        yield [item.get("id"), rules.names[section], title, status, labels, issue.get("updatedAt")]
+
+def csv_chunks(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        writer.writerow(row[:4] + ["; ".join(row[4]), row[5]])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+def jsonl_chunks(rows):
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(json.dumps(dict(zip(EXPORT_COLUMNS, row)), separators=(",", ":")) + "\n")
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+def arrow_schema():
+    return pa.schema([
+        ("ID", pa.string()),
+        ("Section Name", pa.dictionary(pa.int8(), pa.string())),
+        ("Task Title", pa.string()),
+        ("Process Group", pa.dictionary(pa.int8(), pa.string())),
+        ("Labels", pa.list_(pa.string())),
+        ("Last Updated", pa.timestamp("s", tz="UTC"))
+    ])
+
+def arrow_batch(schema, columns):
+    columns = list(columns)
+    columns[5] = [datetime.strptime(value, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc) if value else None for value in columns[5]]
+    arrays = [pa.array(values, type=field.type.value_type).dictionary_encode() if pa.types.is_dictionary(field.type) else pa.array(values, type=field.type)
+              for field, values in zip(schema, columns)]
+    return pa.record_batch(arrays, schema=schema)
+
+def arrow_chunks(rows):
+    # An IPC stream of record batches; each batch is sent as soon as it is encoded
+    schema = arrow_schema()
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+    columns = [[] for _ in EXPORT_COLUMNS]
+    for row in rows:
+        for column, value in zip(columns, row):
+            column.append(value)
+        if len(columns[0]) >= ARROW_BATCH_ROWS:
+            writer.write_batch(arrow_batch(schema, columns))
+            columns = [[] for _ in EXPORT_COLUMNS]
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+    if columns[0]:
+        writer.write_batch(arrow_batch(schema, columns))
+    writer.close()
+    yield sink.getvalue()
+
+def gzip_chunks(chunks, level=GZIP_LEVEL):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 writes a gzip header and trailer
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def export_chunks(export_format, header, rules, snapshot_file, gzip_output=False):
+    # snapshot_file is the open file header was read from, and is closed once its items are exported
+    encoders = {"csv": csv_chunks, "jsonl": jsonl_chunks, "arrow": arrow_chunks}
+    chunks = encoders[export_format](task_rows(header, rules, snapshot_file))
+    return gzip_chunks(chunks) if gzip_output else chunks
@@ -0,0 +1,83 @@
+import os
+import re
+import json
+
+# Metadata
+# File Name: section_rules.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Compile the dashboard's section rules from section_rules.json into one label map and one combined keyword regex, so each title is scanned once whatever the number of sections
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Added section_for to classify one item from its title and label names
+#   - Version 1.0, 19-10-2026: Initial rule engine replacing the hard-coded label and keyword checks in dashboard_data.py
+
+# Configuration
+TITLE_CACHE_LIMIT = 200000  # Titles whose keyword section is remembered between refreshes
+SECTION_RULES_FILE = os.getenv("SECTION_RULES_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "section_rules.json"))
+
+class SectionRules:
+    # Sections are listed in precedence order; an item matching several goes to the first
+    def __init__(self, sections):
+        self.names = [section["name"] for section in sections]
+        self.labels = {}
+        self.keywords = {}
+        self.keywords_ignore_case = {}  # Lowercased
+        self.title_sections = {}
+        alternatives = []
+        for position, section in enumerate(sections):
+            for label in section.get("labels", []):
+                self.labels.setdefault(label, position)
+            for keyword in section.get("keywords", []):
+                self.keywords.setdefault(keyword, position)
+            for keyword in section.get("keywords_ignore_case", []):
+                self.keywords_ignore_case.setdefault(keyword.lower(), position)
+            # Longest keywords first, so a keyword that prefixes another never hides it
+            keywords = "|".join(re.escape(keyword) for keyword in sorted(section.get("keywords", []), key=len, reverse=True))
+            ignore_case = "|".join(re.escape(keyword) for keyword in sorted(section.get("keywords_ignore_case", []), key=len, reverse=True))
+            alternatives.extend(part for part in (keywords, f"(?i:{ignore_case})" if ignore_case else "") if part)
+        # A lookahead captures the keyword at every position, overlapping ones included, in a single scan
+        self.pattern = re.compile(f"(?=({'|'.join(alternatives)}))") if alternatives else None
+
+    def label_positions(self, labels):
+        # Section of each label in a StringPool's values, None for labels no rule names
+        return [self.labels.get(label) for label in labels]
+
+    def scan_title(self, title):
+        best = None
+        for text in self.pattern.findall(title):
+            position = self.keywords.get(text)
+            lower_position = self.keywords_ignore_case.get(text.lower())
+            if position is None or (lower_position is not None and lower_position < position):
+                position = lower_position
+            if position is not None and (best is None or position < best):
+                best = position
+        return best
+
+    def match_title(self, title):
+        # Highest-ranked section a keyword in title names, or None; titles rarely change, so results are cached
+        if self.pattern is None:
+            return None
+        try:
+            return self.title_sections[title]
+        except KeyError:
+            pass
+        if len(self.title_sections) >= TITLE_CACHE_LIMIT:
+            self.title_sections.clear()
+        position = self.title_sections[title] = self.scan_title(title)
+        return position
+
+    def section_for(self, title, labels):
+        # Same precedence as dashboard_data.classify_items, for callers holding one item at a time
+        section = min((self.labels[label] for label in labels if label in self.labels), default=None)
+        if section != 0:
+            keyword_section = self.match_title(title)
+            if keyword_section is not None and (section is None or keyword_section < section):
+                section = keyword_section
+        return section
+
+def load_rules(path=SECTION_RULES_FILE):
+    with open(path) as f:
+        config = json.load(f)
+    if not config.get("sections"):
+        raise RuntimeError(f"No sections defined in {path}")
+    return SectionRules(config["sections"])
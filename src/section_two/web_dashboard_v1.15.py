@@ -0,0 +1,244 @@
+import dash
+from dash import dcc, html, dash_table
+from dash.dependencies import Input, Output
+import pandas as pd
+from flask import Response, request
+import os
+import sys
+import json
+import time
+import threading
+from datetime import datetime, timezone
+# Shared modules live in section_one here; on the VPS both folders are deployed side by side
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "section_one"))
+import metrics
+from profiling import profile_callback
+from graphql_transport import GraphQLTransport
+from search_index import shared_index
+from board_source import BoardSource
+from snapshot import open_snapshot, SNAPSHOT_FILE, TIMESTAMP_FORMAT
+from export_tasks import export_chunks, EXPORT_FORMATS, pa
+from dashboard_data import load_table, classify_items, build_frames, build_section_figure, serialize_tasks, schema_cache, DISPLAY_TZ, DISPLAY_FORMAT, SECTION_RULES
+
+# Metadata
+# File Name: web_dashboard_v1.15.py
+# Version: 1.15
+# Owner: Andrew Holland
+# Purpose: Dynamic web dashboard for Project Dashboards on GitHub, deployed on Hostinger KVM 2 VPS at cyberpunkmonk.com, displaying section-based project data
+# Change Log (Last 4):
+#   - Version 1.15, 19-10-2026: /export/tasks reads the header and items from one open snapshot file, so a sync in between cannot mix two snapshots
+#   - Version 1.14, 19-10-2026: Each worker preloads board data, rendered outputs, the field schema and the search index at startup, with /ready and a request gate until it finishes
+#   - Version 1.13, 19-10-2026: Falls back to the last good data with a "data as of" banner when the token is missing or GitHub is slow or failing, retrying in the background
+#   - Version 1.12, 19-10-2026: Added /export/tasks.csv, .jsonl and .arrow, streamed from the sync snapshot with gzip, ETag and Last-Modified
+
+# Initialize Dash app
+app = dash.Dash(__name__, title="Andrew Holland's Project Dashboard")
+
+# GitHub API configuration
+GITHUB_API = os.getenv("GITHUB_API", "https://api.github.com/graphql")
+USERNAME = "silicastormsiam"
+PROJECT_NUMBER = "5"  # Project number for Project Dashboards on GitHub
+TOKEN = os.getenv("GITHUB_TOKEN")
+log_file = "project_log.txt"  # Adjusted for local execution; update to /var/www/dashboard on VPS
+
+BANNER_STYLE = {"textAlign": "center", "backgroundColor": "#fff3cd", "color": "#664d03", "padding": "8px", "fontFamily": "Arial"}
+READY_WAIT = float(os.getenv("READY_WAIT", "10"))  # Seconds a request waits for a warming worker before it is turned away with 503
+RETRY_AFTER = 5  # Seconds a turned-away client is told to wait
+UNGATED_PATHS = ("/ready", "/metrics")
+
+def load_live_table():
+    if not TOKEN:
+        raise RuntimeError("GITHUB_TOKEN is not set")
+    return load_table(GraphQLTransport(TOKEN, GITHUB_API), USERNAME, PROJECT_NUMBER)
+
+# Shared by every refresh in this worker, so a GitHub outage costs one budget wait rather than one per refresh
+board_source = BoardSource(load_live_table)
+
+rendered_lock = threading.Lock()
+rendered = (None, None)  # (table, (figure, task rows)); the table is held so its id cannot be reused by another
+ready = threading.Event()
+warm_start_status = {"seconds": None, "items": None, "live": None, "error": None}
+
+def render_board(table):
+    # The board source hands out the same table until the board changes, so the chart and rows are built once per table
+    global rendered
+    with rendered_lock:
+        cached_table, outputs = rendered
+    if table is not None and cached_table is table:
+        metrics.record_cache("render", True)
+        return outputs
+    metrics.record_cache("render", False)
+    section_df, task_df = pd.DataFrame(), pd.DataFrame()
+    if table is not None:
+        try:
+            section_data, task_data = classify_items(table)
+            section_df, task_df = build_frames(section_data, task_data)
+        except Exception as e:
+            print(f"Failed to build frames: {str(e)}")
+            table = None
+    outputs = (build_section_figure(section_df), serialize_tasks(task_df))
+    if table is not None:
+        with rendered_lock:
+            rendered = (table, outputs)
+    return outputs
+
+def warm_start():
+    # Pays the first refresh's costs before this worker serves it: board data, chart and rows, field schema and search index
+    start = time.perf_counter()
+    try:
+        table, status = board_source.current()
+        render_board(table)
+        if table is not None and status["live"] and table.schema is not None:
+            # A snapshot a sync confirmed recently carries the current schema, so a later live load skips that query
+            schema_cache.get_or_load((USERNAME, int(PROJECT_NUMBER)), lambda: table.schema)
+        shared_index()
+        warm_start_status.update(items=len(table) if table is not None else 0, live=status["live"], error=status["error"])
+    except Exception as e:
+        print(f"Warm start failed, serving cold: {str(e)}")
+        warm_start_status["error"] = str(e)
+    seconds = time.perf_counter() - start
+    warm_start_status["seconds"] = round(seconds, 3)
+    metrics.warm_start_seconds.set(seconds)
+    ready.set()
+    print(f"Warm start finished in {seconds:.2f}s with {warm_start_status['items']} items")
+    with open(log_file, "a") as f:
+        f.write(f"web_dashboard_v1.15.py warm start finished in {seconds:.2f}s with {warm_start_status['items']} items on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+
+def data_banner(status):
+    if status["live"]:
+        return "", {"display": "none"}
+    if status["as_of"] is None:
+        return f"GitHub is unavailable ({status['error']}) and no snapshot exists yet", BANNER_STYLE
+    as_of = pd.Timestamp(status["as_of"]).tz_convert(DISPLAY_TZ).strftime(DISPLAY_FORMAT)
+    return f"Showing data as of {as_of}; GitHub is unavailable ({status['error']})", BANNER_STYLE
+
+# Layout with professional styling
+app.layout = html.Div([
+    html.H1("Andrew Holland's Project Management Dashboard", style={"textAlign": "center", "color": "#003087", "fontFamily": "Arial"}),
+    html.P(f"Last Updated: {pd.Timestamp.now(tz=DISPLAY_TZ).strftime(DISPLAY_FORMAT)}", style={"textAlign": "center", "color": "#555"}),
+    html.Div(id="data-banner", style={"display": "none"}),
+    html.H2("Section Summary", style={"color": "#003087", "fontFamily": "Arial"}),
+    dcc.Graph(id="section-summary"),
+    html.H2("Task Details", style={"color": "#003087", "fontFamily": "Arial"}),
+    dash_table.DataTable(
+        id="task-table",
+        columns=[
+            {"name": "Section Name", "id": "Section Name"},
+            {"name": "Task Title", "id": "Task Title"},
+            {"name": "Process Group", "id": "Process Group"},
+            {"name": "Last Updated", "id": "Last Updated"}
+        ],
+        style_table={"overflowX": "auto"},
+        style_cell={"textAlign": "left", "fontFamily": "Arial", "padding": "5px"},
+        style_header={"backgroundColor": "#003087", "color": "white", "fontWeight": "bold"}
+    ),
+    html.H2("Search Tasks", style={"color": "#003087", "fontFamily": "Arial"}),
+    dcc.Input(id="task-search", type="search", debounce=True, placeholder="Search titles, descriptions and labels",
+              style={"width": "100%", "padding": "5px", "fontFamily": "Arial"}),
+    dash_table.DataTable(
+        id="search-results",
+        columns=[
+            {"name": "Task Title", "id": "title"},
+            {"name": "Labels", "id": "labels"},
+            {"name": "Score", "id": "score"}
+        ],
+        style_table={"overflowX": "auto"},
+        style_cell={"textAlign": "left", "fontFamily": "Arial", "padding": "5px"},
+        style_header={"backgroundColor": "#003087", "color": "white", "fontWeight": "bold"}
+    ),
+    html.Footer(
+        html.P("Developed by Andrew Holland | Contact: andrew@andrewholland.com | Hosted on cyberpunkmonk.com",
+               style={"textAlign": "center", "color": "#555", "marginTop": "20px"})
+    )
+], style={"padding": "20px", "maxWidth": "1200px", "margin": "auto"})
+
+# Until its warm start finishes, a worker answers only the probes; other requests wait briefly, then get 503 so NGINX or the browser retries
+@app.server.before_request
+def wait_until_ready():
+    if request.path in UNGATED_PATHS or ready.wait(READY_WAIT):
+        return None
+    return Response("Dashboard is starting; retry shortly", status=503, mimetype="text/plain", headers={"Retry-After": str(RETRY_AFTER)})
+
+# Readiness probe for deploy scripts and load balancers; 200 once this worker has warmed up
+@app.server.route("/ready")
+def serve_ready():
+    body = json.dumps({"ready": ready.is_set(), **warm_start_status})
+    return Response(body, status=200 if ready.is_set() else 503, mimetype="application/json")
+
+# Prometheus scrape endpoint; each gunicorn worker keeps its own registry
+@app.server.route("/metrics")
+def serve_metrics():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+# Task exports for spreadsheets, the portfolio site and BI tools; served from the snapshot sync_dashboard.py writes, never from GitHub
+@app.server.route("/export/tasks.<export_format>")
+def export_tasks(export_format):
+    if export_format not in EXPORT_FORMATS:
+        return Response(f"Unknown export format: {export_format}", status=404, mimetype="text/plain")
+    if export_format == "arrow" and pa is None:
+        return Response("Arrow export needs pyarrow installed", status=501, mimetype="text/plain")
+    # The header and the exported items come from one open file, so a sync replacing the snapshot cannot mix two versions
+    header, snapshot_file = open_snapshot(SNAPSHOT_FILE)
+    if header is None:
+        return Response("No snapshot yet; run sync_dashboard.py first", status=503, mimetype="text/plain")
+    gzip_output = "gzip" in request.headers.get("Accept-Encoding", "")
+    # Each format and encoding is a different representation, so each gets its own ETag
+    etag = f"{header['sha256'][:32]}-{export_format}{'-gzip' if gzip_output else ''}"
+    last_modified = datetime.strptime(header["generated_at"], TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains(etag)
+    else:
+        not_modified = request.if_modified_since is not None and request.if_modified_since >= last_modified
+    if not_modified:
+        snapshot_file.close()
+        response = Response(status=304)
+    else:
+        response = Response(export_chunks(export_format, header, SECTION_RULES, snapshot_file, gzip_output), mimetype=EXPORT_FORMATS[export_format])
+        response.call_on_close(snapshot_file.close)  # Also closed when the client disconnects before the last chunk
+        response.headers["Content-Disposition"] = f'attachment; filename="tasks.{export_format}"'
+        if gzip_output:
+            response.headers["Content-Encoding"] = "gzip"
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "no-cache"  # Clients may keep a copy but must revalidate, which costs a 304
+    return response
+
+# Callback for updating dashboard
+@app.callback(
+    [Output("section-summary", "figure"), Output("task-table", "data"), Output("data-banner", "children"), Output("data-banner", "style")],
+    [Input("interval-component", "n_intervals")]
+)
+@profile_callback("update_dashboard")
+def update_dashboard(n):
+    start = time.perf_counter()
+    table, status = board_source.current()
+    if status["error"]:
+        print(f"Failed to fetch data, serving last good data: {status['error']}")
+    
+    section_fig, task_data = render_board(table)
+    banner_text, banner_style = data_banner(status)
+    metrics.callback_latency.observe(time.perf_counter() - start, callback="update_dashboard")
+    
+    with open(log_file, "a") as f:
+        f.write(f"web_dashboard_v1.15.py updated dashboard with section data on {datetime.now().strftime('%d-%m-%Y %H:%M +07')}\n")
+    
+    return section_fig, task_data, banner_text, banner_style
+
+# Callback for the search box; answered from the local index, never the GitHub search API
+@app.callback(
+    Output("search-results", "data"),
+    [Input("task-search", "value")]
+)
+@profile_callback("search_tasks")
+def search_tasks(query):
+    start = time.perf_counter()
+    results = shared_index().search(query or "")
+    metrics.callback_latency.observe(time.perf_counter() - start, callback="search_tasks")
+    return [{"title": result["title"], "labels": ", ".join(result["labels"]), "score": result["score"]} for result in results]
+
+# Started at import, so every gunicorn worker warms its own caches while its first requests wait at the gate
+threading.Thread(target=warm_start, name="warm-start", daemon=True).start()
+
+if __name__ == "__main__":
+    app.run_server(debug=True, host="0.0.0.0", port=8050)
@@ -0,0 +1,52 @@
+import os
+import sys
+import pytest
+
+# Metadata
+# File Name: conftest.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Shared pytest setup: puts the section modules on the path and serves a seeded mock GitHub GraphQL API per test
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: board_items fixture with the mock board's field schema and items in the snapshot shape
+#   - Version 1.0, 19-10-2026: Initial module paths and mock_github and transport fixtures
+
+# Configuration
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_TOKEN = "test-token"
+BOARD_NUMBER = 5  # The seeded board with every field type
+SNAPSHOT_COLUMNS = ["id", "title", "labels", "updatedAt", "fields"]  # What sync_dashboard.py writes to the snapshot
+os.environ["GRAPHQL_CASSETTE_MODE"] = ""  # Tests always talk to the mock, never to a recorded session
+
+sys.path[:0] = [os.path.join(ROOT, "src", "section_one"), os.path.join(ROOT, "src", "section_two")]
+
+from mock_github_graphql import MockGitHub, seed_store, start_in_thread, USERNAME
+from graphql_transport import GraphQLTransport, RateLimitBudget
+from graphql_queries import items_query, items_variables, fields_query, fields_variables
+from board_model import parse_field_schema
+
+@pytest.fixture
+def mock_github():
+    # Yields (store, url); the budget is large enough that no test waits for a reset
+    store = seed_store(MockGitHub(points_per_hour=10**7))
+    server, url = start_in_thread(port=0, store=store)
+    yield store, url
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def transport(mock_github):
+    return GraphQLTransport(TEST_TOKEN, mock_github[1], RateLimitBudget(mutation_interval=0))
+
+@pytest.fixture
+def board_items(transport):
+    # (field schema, items) of the mock board, read the way sync_dashboard.py reads them for the snapshot
+    schema = parse_field_schema(transport.execute(fields_query(), fields_variables(USERNAME, BOARD_NUMBER)))
+    items = []
+    after = None
+    while True:
+        page = transport.execute(items_query(SNAPSHOT_COLUMNS), items_variables(USERNAME, BOARD_NUMBER, 100, after))["data"]["user"]["projectV2"]["items"]
+        items.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            return schema, items
+        after = page["pageInfo"]["endCursor"]
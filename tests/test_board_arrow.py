@@ -0,0 +1,102 @@
+import os
+import time
+import pytest
+from snapshot import schema_header
+from test_board_model import SCHEMA, item
+
+pa = pytest.importorskip("pyarrow")
+import board_arrow
+from board_arrow import MappedItemTable, write_arrow_snapshot, read_arrow_header, shared_table
+from board_model import ItemTable
+
+# Metadata
+# File Name: test_board_arrow.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Check that a memory-mapped Arrow snapshot reads back as the ItemTable it was written from and is only remapped after a sync publishes a new file
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Titles and timestamps read from the mapped file without a list per access; files without schema metadata
+#   - Version 1.0, 19-10-2026: Initial round trip, header, read-only and hot-swap tests; skipped without pyarrow
+
+# Configuration
+HEADER = {"version": 1, "itemCount": 4, "schema": schema_header(SCHEMA)}
+
+@pytest.fixture
+def table():
+    return ItemTable(SCHEMA).extend([
+        item("Plan VPS", ["Section One"], F_status={"optionId": "o1", "name": "Planning"}, F_estimate={"number": 3}, F_due={"date": "2026-11-01"}, F_sprint={"iterationId": "i1", "title": "Sprint 1"}),
+        item("Close dashboard", ["Section Two", "Section One"], F_status={"optionId": "o2", "name": "Closing"}, F_estimate={"number": 8}, F_notes={"text": "done"}),
+        item("Unplanned"),
+        item("Review", F_status={"optionId": "o3", "name": "In Review"}, F_due={"date": "2026-12-24"})
+    ])
+
+@pytest.fixture
+def arrow_path(tmp_path, table):
+    path = str(tmp_path / "board_snapshot.arrow")
+    write_arrow_snapshot(table, HEADER, path)
+    return path
+
+def test_mapped_table_reads_back_the_item_table(table, arrow_path):
+    mapped = MappedItemTable(arrow_path)
+    assert len(mapped) == len(table)
+    assert list(mapped.titles) == table.titles
+    assert list(mapped.updated_at) == table.updated_at
+    for row in range(len(table)):
+        assert mapped.status(row) == table.status(row)
+        assert mapped.item_labels(row) == table.item_labels(row)
+        for field in ("Status", "Estimate", "Due", "Notes", "Sprint"):
+            assert mapped.field_value(row, field) == table.field_value(row, field)
+    assert list(mapped.rows_where("Status", "Closing")) == list(table.rows_where("Status", "Closing"))
+    assert list(mapped.rows_where("Status", "In Review")) == [3]  # Option added after the schema was read
+    assert list(mapped.rows_between("Estimate", 2, 5)) == [0]
+    assert list(mapped.rows_where("Notes", "done")) == [1]
+
+def test_titles_are_read_from_the_mapped_file(table, arrow_path):
+    mapped = MappedItemTable(arrow_path)
+    # One sequence per table over the mapped bytes, not a new list per access
+    assert mapped.titles is mapped.titles
+    assert not isinstance(mapped.titles, list)
+    assert mapped.titles[1] == "Close dashboard"
+    assert mapped.titles[-1] == "Review"
+    assert mapped.titles[1:3] == table.titles[1:3]
+    assert len(mapped.updated_at) == 4 and mapped.updated_at[0] == table.updated_at[0]
+    with pytest.raises(IndexError):
+        mapped.titles[4]
+
+def test_header_is_read_without_the_items(arrow_path, tmp_path):
+    assert read_arrow_header(arrow_path) == HEADER
+    assert MappedItemTable(arrow_path).header == HEADER
+    assert read_arrow_header(str(tmp_path / "missing.arrow")) is None
+    # Written by another tool, with no schema metadata at all
+    bare_path = str(tmp_path / "bare.arrow")
+    batch = pa.record_batch([pa.array(["Task"])], names=["title"])
+    with pa.OSFile(bare_path, "wb") as sink:
+        with pa.ipc.new_file(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+    assert read_arrow_header(bare_path) is None
+
+def test_mapped_table_is_read_only(arrow_path):
+    with pytest.raises(TypeError):
+        MappedItemTable(arrow_path).append(item("New task"))
+
+def test_empty_board(tmp_path):
+    path = str(tmp_path / "empty.arrow")
+    write_arrow_snapshot(ItemTable(SCHEMA), dict(HEADER, itemCount=0), path)
+    mapped = MappedItemTable(path)
+    assert len(mapped) == 0
+    assert list(mapped.rows_where("Status", "Planning")) == []
+
+def test_shared_table_remaps_only_after_a_new_file(table, arrow_path, monkeypatch):
+    monkeypatch.setattr(board_arrow, "mapped_tables", {})
+    first = shared_table(arrow_path)
+    assert shared_table(arrow_path) is first
+    table.append(item("Added by sync"))
+    write_arrow_snapshot(table, dict(HEADER, itemCount=5), arrow_path)
+    # Same inode numbers can be reused, so make sure the new file's mtime differs too
+    os.utime(arrow_path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+    second = shared_table(arrow_path)
+    assert second is not first
+    assert len(second) == 5 and second.titles[-1] == "Added by sync"
+    # Readers holding the old table keep the board they mapped
+    assert len(first) == 4 and first.titles[-1] == "Review"
+    assert shared_table(str(arrow_path) + ".missing") is None
@@ -0,0 +1,113 @@
+import sys
+import math
+import pytest
+from board_model import ItemTable, StringPool, FieldSchema, parse_field_schema
+from graphql_queries import fields_query, fields_variables, items_query, items_variables
+from graphql_transport import NodeStream
+from mock_github_graphql import USERNAME
+
+# Metadata
+# File Name: test_board_model.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Check ItemTable's dictionary-encoded statuses and labels and its typed field columns, on hand-built items and on the mock board
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Range filters on fields that are not numbers or dates
+#   - Version 1.0, 19-10-2026: Initial StringPool, label, typed column, filter and mock board tests
+
+# Configuration
+ITEM_COLUMNS = ["title", "labels", "updatedAt", "fields"]
+ITEMS_PATH = "data.user.projectV2.items"
+SCHEMA = FieldSchema("PVT_1", [
+    {"id": "F_title", "name": "Title", "dataType": "TITLE"},
+    {"id": "F_status", "name": "Status", "dataType": "SINGLE_SELECT", "options": [{"id": "o1", "name": "Planning"}, {"id": "o2", "name": "Closing"}]},
+    {"id": "F_estimate", "name": "Estimate", "dataType": "NUMBER"},
+    {"id": "F_due", "name": "Due", "dataType": "DATE"},
+    {"id": "F_notes", "name": "Notes", "dataType": "TEXT"},
+    {"id": "F_sprint", "name": "Sprint", "dataType": "ITERATION", "configuration": {"iterations": [{"id": "i1", "title": "Sprint 1", "startDate": "2026-10-01"}], "completedIterations": []}}
+])
+
+def item(title, labels=(), **values):
+    nodes = [dict(value, field={"id": field_id}) for field_id, value in values.items()]
+    return {"content": {"title": title, "updatedAt": "2026-10-19T00:00:00Z", "labels": {"nodes": [{"name": label} for label in labels]}}, "typedValues": {"nodes": nodes}}
+
+@pytest.fixture
+def table():
+    return ItemTable(SCHEMA).extend([
+        item("Plan VPS", ["Section One"], F_status={"optionId": "o1", "name": "Planning"}, F_estimate={"number": 3}, F_due={"date": "2026-11-01"}, F_sprint={"iterationId": "i1", "title": "Sprint 1"}),
+        item("Close dashboard", ["Section Two", "Section One"], F_status={"optionId": "o2", "name": "Closing"}, F_estimate={"number": 8}, F_notes={"text": "done"}),
+        item("Unplanned"),
+        item("Review", F_status={"optionId": "o3", "name": "In Review"}, F_due={"date": "2026-12-24"})
+    ])
+
+def test_string_pool_stores_each_value_once():
+    pool = StringPool([""])
+    codes = [pool.code(value) for value in ("Section One", "Section Two", "Section One")]
+    assert codes == [1, 2, 1]
+    assert len(pool) == 3
+    assert pool[1] is sys.intern("Section One")
+
+def test_labels_are_shared_between_items(table):
+    assert table.item_labels(1) == ["Section Two", "Section One"]
+    assert table.item_labels(2) == []
+    assert table.labels.values == ["Section One", "Section Two"]
+    assert list(table.label_offsets) == [0, 1, 3, 3, 3]
+
+def test_status_comes_from_the_status_field(table):
+    assert [table.status(row) for row in range(len(table))] == ["Planning", "Closing", "", "In Review"]
+
+def test_typed_values_and_missing_values(table):
+    assert table.field_value(0, "Estimate") == 3.0
+    assert table.field_value(2, "Estimate") is None
+    assert table.field_value(0, "Due") == "2026-11-01"
+    assert table.field_value(1, "Notes") == "done"
+    assert table.field_value(0, "Sprint") == "Sprint 1"
+    assert table.field_value(3, "F_status") == "In Review"  # Option added after the schema was read
+
+def test_filters(table):
+    assert list(table.rows_where("Status", "Closing")) == [1]
+    assert list(table.rows_where("Status", None)) == [2]
+    assert list(table.rows_where("Status", "Unknown")) == []
+    assert list(table.rows_between("Estimate", 2, 5)) == [0]
+    assert list(table.rows_between("Due", "2026-12-01")) == [3]
+    assert list(table.rows_where("Estimate", None)) == [2, 3]
+    assert list(table.rows_where("Notes", "done")) == [1]
+    with pytest.raises(KeyError):
+        table.column("Priority")
+    for field in ("Status", "Notes", "Sprint"):
+        with pytest.raises(TypeError):
+            table.rows_between(field, "a", "z")
+
+def test_filter_indexes_follow_appends(table):
+    assert list(table.rows_where("Status", "Planning")) == [0]
+    table.append(item("Plan more", F_status={"optionId": "o1", "name": "Planning"}))
+    assert list(table.rows_where("Status", "Planning")) == [0, 4]
+
+def test_without_a_schema_the_status_comes_from_field_values():
+    table = ItemTable().extend([{"content": {"title": "Task"}, "fieldValues": {"nodes": [{}, {"name": "Executing"}]}}])
+    assert table.status(0) == "Executing"
+    assert table.fields == {}
+
+def test_mock_board_round_trips(mock_github, transport):
+    store = mock_github[0]
+    schema = parse_field_schema(transport.execute(fields_query(), fields_variables(USERNAME, 5)))
+    table = ItemTable(schema)
+    after = None
+    while True:
+        with transport.stream(items_query(ITEM_COLUMNS), items_variables(USERNAME, 5, 100, after)) as body:
+            nodes = NodeStream(body, ITEMS_PATH)
+            table.extend(nodes)
+        if not nodes.page_info.get("hasNextPage"):
+            break
+        after = nodes.page_info["endCursor"]
+    project = next(project for project in store.users[USERNAME].projects if project.number == 5)
+    assert len(table) == len(project.items)
+    for row, board_item in enumerate(project.items):
+        assert table.titles[row] == board_item.content.title
+        assert table.item_labels(row) == [label.name for label in board_item.content.labels]
+        for field in project.fields[1:]:
+            stored = board_item.values.get(field.id)
+            if field.options:
+                stored = next((option.get("name") or option.get("title") for option in field.options if option["id"] == stored), None)
+            value = table.field_value(row, field.id)
+            assert value == stored or (isinstance(stored, float) and math.isclose(value, stored))
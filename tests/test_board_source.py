@@ -0,0 +1,122 @@
+import time
+import threading
+from datetime import datetime, timezone
+import pytest
+import metrics
+from board_source import BoardSource
+from snapshot import write_snapshot, TIMESTAMP_FORMAT
+
+# Metadata
+# File Name: test_board_source.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Check that the dashboard's board source serves live data when GitHub answers, the last good data when it does not, and says so when there is none
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial no token, snapshot fallback, fetch budget, recovery and fresh snapshot tests
+
+# Configuration
+NO_TOKEN = "GITHUB_TOKEN is not set"
+
+@pytest.fixture
+def make_source(tmp_path, monkeypatch):
+    # The sync status file is relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    sources = []
+
+    def make(load_live, budget=5.0, max_age=0):
+        source = BoardSource(load_live, str(tmp_path / "board_snapshot.jsonl.gz"), budget, str(tmp_path / "board_snapshot.arrow"), max_age)
+        sources.append(source)
+        return source
+
+    yield make
+    for source in sources:
+        with source.lock:
+            if source.retry_timer is not None:
+                source.retry_timer.cancel()
+
+def no_token():
+    raise RuntimeError(NO_TOKEN)
+
+def write_board(tmp_path, board_items, count=None):
+    schema, items = board_items
+    return write_snapshot(items[:count], schema, str(tmp_path / "board_snapshot.jsonl.gz"))
+
+def test_no_token_and_no_snapshot_serves_nothing_and_says_why(make_source):
+    calls = []
+    source = make_source(lambda: calls.append(1) or no_token())
+    table, status = source.current()
+    assert table is None
+    assert status == {"live": False, "as_of": None, "error": NO_TOKEN}
+    # While degraded, refreshes do not ask GitHub again; the background retry does
+    source.current()
+    assert len(calls) == 1
+    assert source.retry_timer is not None
+
+def test_no_token_serves_the_snapshot_with_its_age(make_source, tmp_path, board_items):
+    header = write_board(tmp_path, board_items)
+    table, status = make_source(no_token).current()
+    assert len(table) == header["items"]
+    assert status["live"] is False
+    assert status["error"] == NO_TOKEN
+    assert status["as_of"] == datetime.strptime(header["generated_at"], TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+def test_a_recent_sync_confirms_an_old_snapshot(make_source, tmp_path, board_items):
+    write_board(tmp_path, board_items)
+    confirmed = time.time() + 60
+    metrics.write_sync_status({"last_success": confirmed})
+    _, status = make_source(no_token).current()
+    assert status["as_of"] == datetime.fromtimestamp(confirmed, timezone.utc)
+
+def test_a_fresh_snapshot_is_served_without_asking_github(make_source, tmp_path, board_items):
+    header = write_board(tmp_path, board_items)
+    calls = []
+    table, status = make_source(lambda: calls.append(1), max_age=900).current()
+    assert len(table) == header["items"]
+    assert status["live"] is True
+    assert calls == []
+
+def test_live_data_is_served_when_github_answers(make_source):
+    live = object()
+    source = make_source(lambda: live)
+    assert source.current() == (live, {"live": True, "as_of": source.live_at, "error": None})
+    assert source.live_at is not None
+
+def test_a_slow_github_is_answered_from_the_snapshot_until_it_recovers(make_source, tmp_path, board_items):
+    write_board(tmp_path, board_items, 5)
+    release = threading.Event()
+    live = object()
+
+    def slow():
+        release.wait(5)
+        return live
+
+    source = make_source(slow, budget=0.1)
+    table, status = source.current()
+    assert len(table) == 5
+    assert status["live"] is False
+    assert "did not answer within" in status["error"]
+    # The slow load keeps running and counts as the retry
+    done = source.in_flight
+    release.set()
+    assert done.wait(5)
+    table, status = source.current()
+    assert table is live
+    assert status["live"] is True
+
+def test_the_last_live_data_outranks_an_older_snapshot(make_source, tmp_path, board_items):
+    write_board(tmp_path, board_items, 5)
+    responses = [object()]
+
+    def flaky():
+        if responses:
+            return responses.pop()
+        raise ConnectionError("GitHub unreachable")
+
+    source = make_source(flaky)
+    live, _ = source.current()
+    with source.lock:
+        done = source.start_fetch()
+    assert done.wait(5)
+    table, status = source.current()
+    assert table is live
+    assert status == {"live": False, "as_of": source.live_at, "error": "GitHub unreachable"}
@@ -0,0 +1,84 @@
+import os
+import sys
+import importlib.util
+import pytest
+from project_workflows import PROJECTS
+from mock_github_graphql import USERNAME, PMBOK_STATUSES, BOARD_STATUSES
+from conftest import ROOT, TEST_TOKEN
+
+# Metadata
+# File Name: test_bootstrap_project.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Run the bootstrap steps against the mock to check that a new board is set up once and that an existing board's Status options are never rewritten
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial new board, rerun, existing board and exit status tests
+
+# Configuration
+BOOTSTRAP_SCRIPT = os.path.join(ROOT, "src", "section_one", "bootstrap_project_v1.1.py")
+NEW_TITLE = "Bootstrap Test Board"
+EXISTING_TITLE = "Homelab Hardware Development"  # Seeded with To Do, In Progress, In Review and Done
+
+@pytest.fixture
+def bootstrap(tmp_path, monkeypatch):
+    # The versioned file name is not importable by name; actions are logged to project_log.txt in the working directory
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location("bootstrap_project", BOOTSTRAP_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def board_state(name, title):
+    return {"owner": USERNAME, "name": name, "title": title, "tasks": PROJECTS["sss"], "visibility": "PRIVATE"}
+
+def project_titled(store, title):
+    return next(project for project in store.users[USERNAME].projects if project.title == title)
+
+def test_new_board_is_set_up_once(bootstrap, mock_github, transport):
+    store = mock_github[0]
+    results = bootstrap.run_steps(transport, board_state("bootstrap-test", NEW_TITLE), 4)
+    assert {name: result["status"] for name, result in results.items()} == dict.fromkeys(bootstrap.STEPS, "done")
+    assert results["status_field"]["detail"] == "PMBOK options set on new board"
+    project = project_titled(store, NEW_TITLE)
+    status_field = project.fields[1]
+    assert [option["name"] for option in status_field.options] == PMBOK_STATUSES
+    assert len(project.items) == len(PROJECTS["sss"]["tasks"])
+    option_ids = [option["id"] for option in status_field.options]
+    values = [item.values.get(status_field.id) for item in project.items]
+    assert None not in values
+
+    results = bootstrap.run_steps(transport, board_state("bootstrap-test", NEW_TITLE), 4)
+    assert all(result["status"] == "done" for result in results.values())
+    assert results["status_field"]["detail"] == "PMBOK options present"
+    assert results["tasks"]["detail"].startswith("0 created, 0 labelled, 0 added, 0 updated")
+    assert [option["id"] for option in status_field.options] == option_ids
+    assert [item.values.get(status_field.id) for item in project.items] == values
+
+def test_existing_board_options_are_never_rewritten(bootstrap, mock_github, transport):
+    store = mock_github[0]
+    project = project_titled(store, EXISTING_TITLE)
+    status_field = project.fields[1]
+    options = [dict(option) for option in status_field.options]
+    assert [option["name"] for option in options] == BOARD_STATUSES
+    results = bootstrap.run_steps(transport, board_state("homelab-hardware", EXISTING_TITLE), 4)
+    assert results["status_field"]["status"] == "failed"
+    assert "Settings > Status" in results["status_field"]["detail"]
+    assert results["tasks"]["status"] == "skipped"
+    assert status_field.options == options
+
+def test_main_exits_with_an_error_when_steps_fail(bootstrap, transport, monkeypatch):
+    monkeypatch.setattr(bootstrap, "TOKEN", TEST_TOKEN)
+    monkeypatch.setattr(bootstrap, "GraphQLTransport", lambda: transport)
+    monkeypatch.setattr(sys, "argv", ["bootstrap_project_v1.1.py", "homelab-hardware", EXISTING_TITLE])
+    with pytest.raises(SystemExit) as exit_info:
+        bootstrap.main()
+    assert exit_info.value.code == 1
+    with open("project_log.txt") as f:
+        assert "incomplete: status_field, tasks" in f.read()
+
+def test_main_exits_with_an_error_without_a_token(bootstrap, monkeypatch):
+    monkeypatch.setattr(bootstrap, "TOKEN", None)
+    monkeypatch.setattr(sys, "argv", ["bootstrap_project_v1.1.py", "bootstrap-test", NEW_TITLE])
+    with pytest.raises(SystemExit) as exit_info:
+        bootstrap.main()
+    assert exit_info.value.code == 1
@@ -0,0 +1,86 @@
+import io
+import csv
+import gzip
+import json
+import pytest
+import export_tasks
+from export_tasks import export_chunks, task_rows, EXPORT_COLUMNS
+from section_rules import load_rules
+from snapshot import open_snapshot, write_snapshot
+
+# Metadata
+# File Name: test_export_tasks.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Export the mock board's snapshot in every format, plain and gzipped, and check the rows match the snapshot whatever the chunk size
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial CSV, JSON Lines, Arrow, gzip, chunking and replaced-snapshot tests
+
+# Configuration
+RULES = load_rules()
+
+@pytest.fixture
+def snapshot_path(tmp_path, board_items):
+    path = str(tmp_path / "board_snapshot.jsonl.gz")
+    write_snapshot(board_items[1], board_items[0], path)
+    return path
+
+def export(path, export_format, gzip_output=False):
+    header, snapshot_file = open_snapshot(path)
+    data = b"".join(export_chunks(export_format, header, RULES, snapshot_file, gzip_output))
+    assert snapshot_file.closed
+    return gzip.decompress(data) if gzip_output else data
+
+def expected_rows(path):
+    header, snapshot_file = open_snapshot(path)
+    return list(task_rows(header, RULES, snapshot_file))
+
+def test_rows_follow_the_section_rules(snapshot_path, board_items):
+    rows = expected_rows(snapshot_path)
+    assert 0 < len(rows) <= len(board_items[1])
+    for row in rows:
+        assert RULES.names.index(row[1]) == RULES.section_for(row[2], row[4])
+    # The Status field's option name, or None for an item without one
+    assert {row[3] for row in rows} <= {"Initiating", "Planning", "Executing", "Monitoring and Controlling", "Closing", None}
+
+def test_csv_export(snapshot_path):
+    rows = list(csv.reader(io.StringIO(export(snapshot_path, "csv").decode())))
+    assert rows[0] == EXPORT_COLUMNS
+    expected = expected_rows(snapshot_path)
+    assert [row[0] for row in rows[1:]] == [row[0] for row in expected]
+    assert rows[1][4] == "; ".join(expected[0][4])
+
+def test_jsonl_export(snapshot_path):
+    lines = export(snapshot_path, "jsonl").decode().splitlines()
+    assert [json.loads(line) for line in lines] == [dict(zip(EXPORT_COLUMNS, row)) for row in expected_rows(snapshot_path)]
+
+def test_arrow_export(snapshot_path):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.ipc.open_stream(export(snapshot_path, "arrow")).read_all()
+    expected = expected_rows(snapshot_path)
+    assert table.column_names == EXPORT_COLUMNS
+    assert table.num_rows == len(expected)
+    assert table.column("Task Title").to_pylist() == [row[2] for row in expected]
+    assert table.column("Process Group").to_pylist() == [row[3] for row in expected]
+
+@pytest.mark.parametrize("export_format", ["csv", "jsonl", "arrow"])
+def test_gzip_exports_decompress_to_the_plain_export(snapshot_path, export_format):
+    if export_format == "arrow":
+        pytest.importorskip("pyarrow")
+    assert export(snapshot_path, export_format, gzip_output=True) == export(snapshot_path, export_format)
+
+def test_small_chunks_give_the_same_export(snapshot_path, monkeypatch):
+    whole = export(snapshot_path, "jsonl")
+    monkeypatch.setattr(export_tasks, "CHUNK_SIZE", 64)
+    header, snapshot_file = open_snapshot(snapshot_path)
+    chunks = list(export_chunks("jsonl", header, RULES, snapshot_file))
+    assert len(chunks) > 10
+    assert b"".join(chunks) == whole
+
+def test_an_open_export_keeps_its_snapshot_when_a_sync_replaces_it(snapshot_path, board_items):
+    before = export(snapshot_path, "jsonl")
+    header, snapshot_file = open_snapshot(snapshot_path)
+    items = board_items[1][:3]
+    write_snapshot(items, board_items[0], snapshot_path)
+    assert b"".join(export_chunks("jsonl", header, RULES, snapshot_file)) == before
+    assert export(snapshot_path, "jsonl") != before
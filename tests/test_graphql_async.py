@@ -0,0 +1,138 @@
+import time
+import json
+import socket
+import pytest
+import metrics
+from urllib.error import HTTPError, URLError
+from graphql_async import CircuitBreaker, CircuitOpenError, SyncGraphQLClient, server_fault
+from mock_github_graphql import MockGitHub, seed_store, start_in_thread, USERNAME
+from conftest import TEST_TOKEN
+
+# Metadata
+# File Name: test_graphql_async.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Check the circuit breaker's state transitions and the async client's deadlines, hedging and error classification against the mock server
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial breaker, fault classification, deadline and hedging tests
+
+# Configuration
+LOGIN_QUERY = "query($login: String!) { user(login: $login) { login } }"
+
+def http_error(code):
+    return HTTPError("https://api.github.com/graphql", code, "error", {}, None)
+
+def closed_port_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/graphql"
+
+@pytest.fixture
+def slow_github():
+    server, url = start_in_thread(port=0, store=seed_store(MockGitHub(points_per_hour=10**7)), latency_ms=300)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+def test_faults_that_count_against_github():
+    assert server_fault(URLError("connection refused"))
+    assert server_fault(TimeoutError("slow"))
+    assert server_fault(http_error(502))
+    assert server_fault(http_error(429))
+    assert not server_fault(http_error(401))
+    assert not server_fault(http_error(404))
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.allow()
+        breaker.record(http_error(502))
+    breaker.allow()
+    breaker.record(http_error(502))
+    rejections = metrics.graphql_circuit_rejections.value()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    assert metrics.graphql_circuit_rejections.value() == rejections + 1
+
+def test_success_and_client_errors_reset_the_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record(http_error(502))
+    breaker.record()
+    breaker.record(http_error(502))
+    breaker.record(http_error(404))
+    breaker.record(http_error(502))
+    breaker.allow()
+    assert breaker.failures == 1
+
+def test_half_open_breaker_lets_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record(http_error(503))
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    time.sleep(0.06)
+    breaker.allow()
+    # Other callers are refused while the trial is in flight
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    breaker.record()
+    breaker.allow()
+    breaker.allow()
+
+def test_failed_trial_reopens_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record(http_error(503))
+    time.sleep(0.06)
+    breaker.allow()
+    breaker.record(http_error(503))
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    time.sleep(0.06)
+    breaker.allow()
+
+def test_unreachable_github_opens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    client = SyncGraphQLClient(closed_port_url(), deadline=5, breaker=breaker)
+    client.inject_token(f"Bearer {TEST_TOKEN}")
+    for _ in range(2):
+        with pytest.raises(Exception) as error:
+            client.execute(LOGIN_QUERY, {"login": USERNAME})
+        assert not isinstance(error.value, CircuitOpenError)
+    with pytest.raises(CircuitOpenError):
+        client.execute(LOGIN_QUERY, {"login": USERNAME})
+
+def test_rejected_requests_do_not_open_the_circuit(mock_github):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    client = SyncGraphQLClient(mock_github[1], breaker=breaker)  # No token, so the mock answers 401
+    for _ in range(3):
+        with pytest.raises(Exception) as error:
+            client.execute(LOGIN_QUERY, {"login": USERNAME})
+        assert not isinstance(error.value, CircuitOpenError)
+    assert breaker.opened_at is None
+
+def test_answers_match_the_mock(mock_github):
+    client = SyncGraphQLClient(mock_github[1], breaker=CircuitBreaker())
+    client.inject_token(f"Bearer {TEST_TOKEN}")
+    assert json.loads(client.execute(LOGIN_QUERY, {"login": USERNAME}))["data"]["user"]["login"] == USERNAME
+
+def test_deadline_fails_slow_requests(slow_github):
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    client = SyncGraphQLClient(slow_github, deadline=0.1, breaker=breaker)
+    client.inject_token(f"Bearer {TEST_TOKEN}")
+    with pytest.raises(TimeoutError):
+        client.execute(LOGIN_QUERY, {"login": USERNAME})
+    assert breaker.failures == 1
+
+def test_slow_queries_are_hedged(slow_github):
+    client = SyncGraphQLClient(slow_github, deadline=5, hedge_delay=0.05, breaker=CircuitBreaker())
+    client.inject_token(f"Bearer {TEST_TOKEN}")
+    hedges = metrics.graphql_hedges.value()
+    assert json.loads(client.execute(LOGIN_QUERY, {"login": USERNAME}))["data"]["user"]["login"] == USERNAME
+    assert metrics.graphql_hedges.value() == hedges + 1
+
+def test_mutations_are_never_hedged(slow_github):
+    client = SyncGraphQLClient(slow_github, deadline=5, hedge_delay=0.05, breaker=CircuitBreaker())
+    client.inject_token(f"Bearer {TEST_TOKEN}")
+    hedges = metrics.graphql_hedges.value()
+    client.execute("mutation { addProjectV2ItemById(input: {projectId: \"none\", contentId: \"none\"}) { item { id } } }")
+    assert metrics.graphql_hedges.value() == hedges
@@ -0,0 +1,124 @@
+import os
+import sys
+import json
+import gzip
+import subprocess
+import pytest
+from graphql_async import SyncGraphQLClient
+from graphql_cassette import CassetteWriter, CassetteRecorder, CassettePlayer, CassetteMiss, cassette_client, scrub, SCRUBBED
+from mock_github_graphql import USERNAME
+from conftest import ROOT
+
+# Metadata
+# File Name: test_graphql_cassette.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Record traffic from the mock server to a cassette and check it replays offline, in order and with tokens scrubbed
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Killed recorders and several processes recording to one cassette
+#   - Version 1.0, 19-10-2026: Initial record, replay, ordering, miss and scrubbing tests
+
+# Configuration
+TOKEN = "ghp_" + "a1B2c3D4e5" * 4
+LOGIN_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    login
+    projectV2(number: 5) {
+      title
+    }
+  }
+}
+"""
+# Records one exchange per login given, then dies without running atexit handlers or closing the file
+KILLED_RECORDER_SCRIPT = """
+import os, sys
+from graphql_cassette import CassetteWriter, CassetteRecorder
+
+class EchoClient:
+    def execute(self, query, variables=None):
+        return "response for " + variables["login"]
+
+recorder = CassetteRecorder(EchoClient(), CassetteWriter(sys.argv[1]))
+for login in sys.argv[2:]:
+    recorder.execute("query($login: String!) { user(login: $login) { login } }", {"login": login})
+os._exit(0)
+"""
+KILLED_QUERY = "query($login: String!) { user(login: $login) { login } }"
+
+class EchoClient:
+    # Stands in for GitHub when a response must contain something to scrub
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def execute(self, query, variables=None):
+        return self.responses.pop(0)
+
+def record(path, client, exchanges, token=None):
+    writer = CassetteWriter(path)
+    recorder = CassetteRecorder(client, writer, token)
+    responses = [recorder.execute(query, variables) for query, variables in exchanges]
+    writer.close()
+    return responses
+
+def test_recorded_traffic_replays_from_the_file(tmp_path, mock_github):
+    client = SyncGraphQLClient(mock_github[1])
+    client.inject_token(f"Bearer {TOKEN}")
+    path = str(tmp_path / "cassette.jsonl.gz")
+    recorded = record(path, client, [(LOGIN_QUERY, {"login": USERNAME})], TOKEN)
+    assert json.loads(recorded[0])["data"]["user"]["login"] == USERNAME
+    player = CassettePlayer(path, latency_scale=0)
+    # Whitespace differences between script versions still match
+    assert player.execute("  ".join(LOGIN_QUERY.split()), {"login": USERNAME}) == recorded[0]
+
+def test_repeated_requests_replay_in_recorded_order(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    record(path, EchoClient(["before", "after"]), [(LOGIN_QUERY, {"login": USERNAME})] * 2)
+    player = CassettePlayer(path, latency_scale=0)
+    assert [player.execute(LOGIN_QUERY, {"login": USERNAME}) for _ in range(3)] == ["before", "after", "after"]
+
+def test_unrecorded_requests_raise(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    record(path, EchoClient(["{}"]), [(LOGIN_QUERY, {"login": USERNAME})])
+    player = CassettePlayer(path, latency_scale=0)
+    with pytest.raises(CassetteMiss):
+        player.execute(LOGIN_QUERY, {"login": "someone-else"})
+
+def test_tokens_never_reach_the_cassette(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    other = "github_pat_" + "Z9y8X7w6V5" * 3
+    record(path, EchoClient([f"echo {TOKEN} {other}"]), [(LOGIN_QUERY, {"token": TOKEN})], TOKEN)
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        text = f.read()
+    assert TOKEN not in text and other not in text
+    assert json.loads(text)["response"] == f"echo {SCRUBBED} {SCRUBBED}"
+
+def test_scrub_replaces_the_given_token():
+    assert scrub("Bearer secret-value", "secret-value") == f"Bearer {SCRUBBED}"
+
+def test_live_mode_uses_the_client_directly():
+    client = EchoClient([])
+    assert cassette_client(client, mode="") is client
+
+def run_killed_recorder(path, logins):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(ROOT, "src", "section_one"), os.environ.get("PYTHONPATH", "")]))
+    subprocess.run([sys.executable, "-c", KILLED_RECORDER_SCRIPT, path] + logins, env=env, check=True, timeout=30)
+
+def test_a_killed_recorder_leaves_a_replayable_cassette(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    run_killed_recorder(path, ["first", "second"])
+    # A process killed in the middle of a write leaves part of its last exchange
+    with open(path, "ab") as f:
+        f.write(gzip.compress(b'{"key": "cut off"}\n')[:15])
+    player = CassettePlayer(path, latency_scale=0)
+    assert player.execute(KILLED_QUERY, {"login": "first"}) == "response for first"
+    assert player.execute(KILLED_QUERY, {"login": "second"}) == "response for second"
+    assert sum(len(records) for records in player.exchanges.values()) == 2
+
+def test_processes_recording_to_one_cassette_keep_each_others_exchanges(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    run_killed_recorder(path, ["first"])
+    run_killed_recorder(path, ["second"])
+    player = CassettePlayer(path, latency_scale=0)
+    assert player.execute(KILLED_QUERY, {"login": "first"}) == "response for first"
+    assert player.execute(KILLED_QUERY, {"login": "second"}) == "response for second"
@@ -0,0 +1,120 @@
+import time
+import threading
+import pytest
+import graphql_transport
+from graphql_transport import NodeStream, IdCache, RATE_LIMIT_FIELDS
+from graphql_queries import items_query, items_variables
+from mock_github_graphql import USERNAME
+from project_workflows import fetch_repository
+
+# Metadata
+# File Name: test_graphql_transport.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Exercise the shared GraphQL transport against the mock server: budget accounting, streamed page decoding and the ID cache
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Streamed queries update the budget from the rateLimit they read
+#   - Version 1.0, 19-10-2026: Initial execute, stream, NodeStream and IdCache tests
+
+# Configuration
+ITEMS_PATH = "data.user.projectV2.items"
+VIEWER_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    login
+  }
+%s}
+""" % RATE_LIMIT_FIELDS
+
+def stream_titles(transport, page_size):
+    # The dashboard's stream_items loop, without its pandas dependency
+    titles = []
+    after = None
+    while True:
+        with transport.stream(items_query(["title"]), items_variables(USERNAME, 5, page_size, after)) as body:
+            nodes = NodeStream(body, ITEMS_PATH)
+            titles.extend(node["content"]["title"] for node in nodes)
+        assert not nodes.errors
+        if not nodes.page_info.get("hasNextPage"):
+            return titles
+        after = nodes.page_info["endCursor"]
+
+@pytest.fixture(params=["ijson", "json"])
+def decoder(request, monkeypatch):
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(graphql_transport, "ijson", None)
+    return request.param
+
+def test_execute_records_points_in_the_budget(mock_github, transport):
+    store = mock_github[0]
+    result = transport.execute(VIEWER_QUERY, {"login": USERNAME})
+    assert result["data"]["user"]["login"] == USERNAME
+    assert transport.budget.requests == 1
+    assert transport.budget.points_used == result["data"]["rateLimit"]["cost"]
+    assert transport.budget.remaining == store.remaining
+
+def test_streamed_pages_match_the_board(mock_github, transport, decoder):
+    store = mock_github[0]
+    project = next(project for project in store.users[USERNAME].projects if project.number == 5)
+    assert stream_titles(transport, 20) == [item.content.title for item in project.items]
+
+def test_streamed_queries_record_points_in_the_budget(mock_github, transport, decoder):
+    store = mock_github[0]
+    costs = []
+    after = None
+    while True:
+        with transport.stream(items_query(["title"], rate_limit=True), items_variables(USERNAME, 5, 20, after)) as body:
+            nodes = NodeStream(body, ITEMS_PATH)
+            list(nodes)
+        costs.append(nodes.rate_limit["cost"])
+        if not nodes.page_info.get("hasNextPage"):
+            break
+        after = nodes.page_info["endCursor"]
+    assert transport.budget.requests == len(costs) > 1
+    assert transport.budget.points_used == sum(costs)
+    assert transport.budget.remaining == store.remaining
+    assert transport.budget.reset_at is not None
+
+def test_node_stream_collects_errors(transport, decoder):
+    with transport.stream(items_query(["title"]), items_variables("nobody-here", 5)) as body:
+        nodes = NodeStream(body, ITEMS_PATH)
+        assert list(nodes) == []
+    assert nodes.errors
+
+def test_id_cache_loads_each_key_once():
+    cache = IdCache()
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return "PVT_1"
+
+    threads = [threading.Thread(target=cache.get_or_load, args=(("project", 1), load)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (7, 1)
+
+def test_id_cache_does_not_keep_failed_loads():
+    cache = IdCache()
+    assert cache.get_or_load("key", lambda: None) is None
+    assert cache.get_or_load("key", lambda: "value") == "value"
+    assert cache.misses == 2
+
+def test_repository_id_is_resolved_once(mock_github, transport):
+    store = mock_github[0]
+    repository = store.repositories[f"{USERNAME}/homelab-hardware"]
+    for index in range(150):
+        store.add_issue(repository, f"Task {index}")
+    cache = IdCache()
+    first = fetch_repository(transport, cache, f"{USERNAME}/homelab-hardware")
+    second = fetch_repository(transport, cache, f"{USERNAME}/homelab-hardware")
+    assert first == second
+    assert first[0] == repository.id
+    assert len(first[1]) == 150
+    assert (cache.hits, cache.misses) == (1, 1)
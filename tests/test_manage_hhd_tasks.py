@@ -0,0 +1,129 @@
+import os
+import json
+import importlib.util
+import pytest
+from mutation_journal import MutationJournal
+from mock_github_graphql import USERNAME
+from conftest import ROOT, TEST_TOKEN
+
+graphqlclient = pytest.importorskip("graphqlclient")
+
+# Metadata
+# File Name: test_manage_hhd_tasks.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Run manage_hhd_tasks against the mock to check that interrupted runs resume from the journal without duplicate issues or repeated status updates
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial fresh run, rerun, crash recovery, resume, closed issue, failed lookup and quoted title tests; skipped without graphqlclient
+
+# Configuration
+HHD_SCRIPT = os.path.join(ROOT, "manage_hhd_tasks_v1.4.py")
+HHD_PROJECT_ID = "PVT_kwHOCZq5ps4A-gXz"
+
+@pytest.fixture
+def hhd(tmp_path, monkeypatch, mock_github):
+    # The versioned file name is not importable by name; the journal and log are written to the working directory
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location("manage_hhd_tasks", HHD_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "GITHUB_API", mock_github[1])
+    monkeypatch.setattr(module, "TOKEN", TEST_TOKEN)
+    return module
+
+def repository(store):
+    return store.add_repository(USERNAME, "homelab-hardware")
+
+def issue_titles(store):
+    return [issue.title for issue in repository(store).issues]
+
+def board(store):
+    project = store.nodes[HHD_PROJECT_ID]
+    status_field = project.fields[1]
+    names = {option["id"]: option["name"] for option in status_field.options}
+    return {item.content.title: names.get(item.values.get(status_field.id)) for item in project.items}
+
+def test_a_fresh_run_creates_every_task_once(hhd, mock_github, tmp_path):
+    store = mock_github[0]
+    hhd.main()
+    titles = [task["title"] for task in hhd.tasks]
+    assert issue_titles(store) == titles
+    statuses = board(store)
+    assert statuses[titles[0]] == "To Do"
+    assert statuses[titles[-1]] == "Done"
+    assert not (tmp_path / hhd.JOURNAL_FILE).exists()
+    hhd.main()
+    assert issue_titles(store) == titles
+    assert len(board(store)) == len(titles)
+
+def test_an_issue_created_before_a_crash_is_recovered(hhd, mock_github, tmp_path, capsys):
+    store = mock_github[0]
+    title = hhd.tasks[0]["title"]
+    # The previous run sent createIssue and died before acknowledging it
+    journal = MutationJournal(str(tmp_path / hhd.JOURNAL_FILE))
+    journal.intend(f"create_issue:{title}", title=title)
+    journal.close()
+    store.add_issue(repository(store), title)
+    hhd.main()
+    assert "Recovered issue created by interrupted run" in capsys.readouterr().out
+    assert issue_titles(store).count(title) == 1
+    assert title in board(store)
+
+def test_an_interrupted_run_resumes_where_it_stopped(hhd, mock_github, tmp_path, monkeypatch, capsys):
+    store = mock_github[0]
+    update_task_status = hhd.update_task_status
+    updates = []
+
+    def dies_on_third_update(*args):
+        if len(updates) == 2:
+            raise KeyboardInterrupt
+        updates.append(args[-1])
+        return update_task_status(*args)
+
+    monkeypatch.setattr(hhd, "update_task_status", dies_on_third_update)
+    with pytest.raises(KeyboardInterrupt):
+        hhd.main()
+    assert (tmp_path / hhd.JOURNAL_FILE).exists()
+    monkeypatch.setattr(hhd, "update_task_status", update_task_status)
+    capsys.readouterr()
+    hhd.main()
+    output = capsys.readouterr().out
+    assert output.count("Skipping status already updated before interruption") == 2
+    assert "Created and added" not in output
+    assert issue_titles(store) == [task["title"] for task in hhd.tasks]
+    assert None not in board(store).values()
+    assert not (tmp_path / hhd.JOURNAL_FILE).exists()
+
+def test_closed_issues_are_not_created_again(hhd, mock_github):
+    store = mock_github[0]
+    hhd.main()
+    for issue in repository(store).issues:
+        issue.state = "CLOSED"
+    hhd.main()
+    assert len(issue_titles(store)) == len(hhd.tasks)
+
+def test_a_failed_issue_lookup_stops_the_run(hhd, mock_github, monkeypatch, capsys):
+    store = mock_github[0]
+
+    class FailingIssuesClient(graphqlclient.GraphQLClient):
+        # The second page of issues fails, after the first one found issues
+        def execute(self, query, variables=None):
+            if "issues(first: 100" in query and (variables or {}).get("after"):
+                return json.dumps({"errors": [{"message": "Something went wrong"}]})
+            return super().execute(query, variables)
+
+    for index in range(120):
+        store.add_issue(repository(store), f"Existing issue {index}")
+    monkeypatch.setattr(hhd, "GraphQLClient", FailingIssuesClient)
+    hhd.main()
+    assert "Cannot proceed" in capsys.readouterr().out
+    assert len(issue_titles(store)) == 120
+    assert board(store) == {}
+
+def test_titles_with_quotes_are_sent_intact(hhd, mock_github, monkeypatch):
+    store = mock_github[0]
+    title = 'Audit "rack 2" cabling \\ power'
+    monkeypatch.setattr(hhd, "tasks", [{"title": title, "pmbok_group": "Executing"}])
+    hhd.main()
+    assert issue_titles(store) == [title]
+    assert board(store) == {title: "In Progress"}
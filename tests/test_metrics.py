@@ -0,0 +1,74 @@
+import os
+import metrics
+from metrics import Counter, Gauge, Histogram, Registry
+from graphql_queries import items_query, items_variables
+
+# Metadata
+# File Name: test_metrics.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Check the Prometheus text exposition of counters, gauges and histograms, the cache hit ratio gauge and the metrics files
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial exposition, hit ratio, metrics file and transport error counter tests
+
+def test_counter_series_are_labelled_and_sorted():
+    counter = Counter("requests_total", "Requests", ["operation"])
+    counter.inc(operation="query")
+    counter.inc(2, operation="mutation")
+    counter.inc(operation="query")
+    assert counter.value(operation="query") == 2
+    assert counter.render() == [
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{operation="mutation"} 2',
+        'requests_total{operation="query"} 2'
+    ]
+
+def test_label_values_are_escaped():
+    counter = Counter("escaped_total", "Escaping", ["path"])
+    counter.inc(path='C:\\"board"')
+    assert counter.render()[-1] == 'escaped_total{path="C:\\\\\\"board\\""} 1'
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latency", buckets=[0.1, 1])
+    for value in (0.05, 0.5, 0.7, 5):
+        histogram.observe(value)
+    assert histogram.render()[2:] == [
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 6.25",
+        "latency_seconds_count 4"
+    ]
+
+def test_gauge_function_is_read_at_scrape_time():
+    values = {(): 1.5}
+    gauge = Gauge("lag_seconds", "Lag", function=lambda: values)
+    assert gauge.render()[-1] == "lag_seconds 1.5"
+    values[()] = 3.0
+    assert gauge.render()[-1] == "lag_seconds 3.0"
+
+def test_cache_hit_ratio_follows_recorded_lookups():
+    for hit in (True, True, False):
+        metrics.record_cache("test_cache", hit)
+    assert metrics.current_cache_hit_ratios()[("test_cache",)] == 2 / 3
+    assert 'cache_hit_ratio{cache="test_cache"} 0.6666666666666666' in metrics.render().splitlines()
+
+def test_metrics_file_holds_the_registry(tmp_path):
+    path = str(tmp_path / "metrics.prom")
+    metrics.write_metrics_file(path)
+    with open(path) as f:
+        assert f.read() == metrics.render()
+    assert os.listdir(tmp_path) == ["metrics.prom"]
+
+def test_registry_renders_every_metric():
+    registry = Registry()
+    registry.register(Counter("a_total", "A")).inc()
+    registry.register(Gauge("b", "B")).set(2)
+    assert registry.render() == "# HELP a_total A\n# TYPE a_total counter\na_total 1\n# HELP b B\n# TYPE b gauge\nb 2\n"
+
+def test_graphql_errors_are_counted(transport):
+    before = metrics.graphql_errors.value(operation="query")
+    result = transport.execute(items_query(["title"]), items_variables("nobody-here", 5))
+    assert "errors" in result
+    assert metrics.graphql_errors.value(operation="query") == before + 1
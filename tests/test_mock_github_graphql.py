@@ -0,0 +1,127 @@
+import json
+import pytest
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from conftest import TEST_TOKEN
+from mock_github_graphql import USERNAME
+
+# Metadata
+# File Name: test_mock_github_graphql.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Check that the mock GitHub GraphQL API behaves like GitHub where the scripts depend on it: authentication, pagination, point costs and field updates
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial authentication, pagination, rate-limit, add_user and updateProjectV2Field tests
+
+# Configuration
+ITEMS_QUERY = """
+query($login: String!, $after: String) {
+  user(login: $login) {
+    projectV2(number: 5) {
+      items(first: 20, after: $after) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          id
+        }
+      }
+    }
+  }
+  rateLimit {
+    cost
+    remaining
+  }
+}
+"""
+
+STATUS_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    projectV2(number: 5) {
+      field(name: "Status") {
+        ... on ProjectV2SingleSelectField {
+          id
+          options {
+            id
+            name
+          }
+        }
+      }
+      items(first: 100) {
+        nodes {
+          fieldValueByName(name: "Status") {
+            ... on ProjectV2ItemFieldSingleSelectValue {
+              optionId
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+UPDATE_FIELD_MUTATION = """
+mutation($fieldId: ID!, $options: [ProjectV2SingleSelectFieldOptionInput!]) {
+  updateProjectV2Field(input: {fieldId: $fieldId, singleSelectOptions: $options}) {
+    projectV2Field {
+      ... on ProjectV2SingleSelectField {
+        id
+      }
+    }
+  }
+}
+"""
+
+def post(url, query, variables=None, token=TEST_TOKEN):
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    with urlopen(Request(url, json.dumps({"query": query, "variables": variables}).encode(), headers)) as response:
+        return json.load(response)
+
+def test_requests_without_a_token_are_rejected(mock_github):
+    with pytest.raises(HTTPError) as error:
+        post(mock_github[1], ITEMS_QUERY, {"login": USERNAME}, token=None)
+    assert error.value.code == 401
+
+def test_items_paginate_without_gaps_or_repeats(mock_github):
+    store, url = mock_github
+    ids = []
+    after = None
+    while True:
+        items = post(url, ITEMS_QUERY, {"login": USERNAME, "after": after})["data"]["user"]["projectV2"]["items"]
+        ids.extend(node["id"] for node in items["nodes"])
+        if not items["pageInfo"]["hasNextPage"]:
+            break
+        after = items["pageInfo"]["endCursor"]
+    project = next(project for project in store.users[USERNAME].projects if project.number == 5)
+    assert ids == [item.id for item in project.items]
+
+def test_points_are_charged_per_request(mock_github):
+    store, url = mock_github
+    first = post(url, ITEMS_QUERY, {"login": USERNAME})["data"]["rateLimit"]
+    second = post(url, ITEMS_QUERY, {"login": USERNAME})["data"]["rateLimit"]
+    assert first["cost"] >= 1
+    assert second["remaining"] == first["remaining"] - second["cost"]
+    assert store.remaining == second["remaining"]
+
+def test_add_user_returns_the_existing_user(mock_github):
+    store = mock_github[0]
+    nodes = len(store.nodes)
+    assert store.add_user(USERNAME) is store.users[USERNAME]
+    assert len(store.nodes) == nodes
+
+def test_replacing_status_options_clears_item_values(mock_github):
+    # GitHub gives every option in the list a new ID, so the Status of every item is lost
+    url = mock_github[1]
+    project = post(url, STATUS_QUERY, {"login": USERNAME})["data"]["user"]["projectV2"]
+    assert any(item["fieldValueByName"] for item in project["items"]["nodes"])
+    options = [{"name": option["name"], "color": "GRAY", "description": ""} for option in project["field"]["options"]]
+    post(url, UPDATE_FIELD_MUTATION, {"fieldId": project["field"]["id"], "options": options})
+    updated = post(url, STATUS_QUERY, {"login": USERNAME})["data"]["user"]["projectV2"]
+    assert [option["name"] for option in updated["field"]["options"]] == [option["name"] for option in options]
+    assert not {option["id"] for option in updated["field"]["options"]} & {option["id"] for option in project["field"]["options"]}
+    assert not any(item["fieldValueByName"] for item in updated["items"]["nodes"])
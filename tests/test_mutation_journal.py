@@ -0,0 +1,91 @@
+import json
+from mutation_journal import MutationJournal, run_step
+
+# Metadata
+# File Name: test_mutation_journal.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Check that the write-ahead journal replays acknowledged and interrupted steps after a crash, survives a torn last record and compacts on checkpoint
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial replay, torn record, abort, checkpoint and completion tests
+
+# Configuration
+STEP = "create_issue:Deploy Inventory to GitHub"
+
+def read_records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+def test_acknowledged_steps_are_not_run_again(tmp_path):
+    path = str(tmp_path / "run.journal.jsonl")
+    journal = MutationJournal(path)
+    assert run_step(journal, STEP, lambda: "I_1", title="Deploy") == "I_1"
+    # The process dies here; the next run replays the journal
+    journal.file.close()
+    calls = []
+    resumed = MutationJournal(path)
+    assert run_step(resumed, STEP, lambda: calls.append(1) or "I_2") == "I_1"
+    assert calls == []
+
+def test_unacknowledged_steps_are_reported_as_interrupted(tmp_path):
+    path = str(tmp_path / "run.journal.jsonl")
+    journal = MutationJournal(path)
+    journal.intend(STEP, title="Deploy")
+    journal.file.close()
+    resumed = MutationJournal(path)
+    assert resumed.was_interrupted(STEP)
+    assert resumed.result(STEP) is None
+    resumed.ack(STEP, "I_1")
+    assert not resumed.was_interrupted(STEP)
+
+def test_a_rejected_mutation_is_retried_next_time(tmp_path):
+    path = str(tmp_path / "run.journal.jsonl")
+    journal = MutationJournal(path)
+    assert run_step(journal, STEP, lambda: None) is None
+    journal.file.close()
+    resumed = MutationJournal(path)
+    assert not resumed.was_interrupted(STEP)
+    assert run_step(resumed, STEP, lambda: "I_1") == "I_1"
+
+def test_a_torn_last_record_is_dropped(tmp_path, capsys):
+    path = str(tmp_path / "run.journal.jsonl")
+    journal = MutationJournal(path)
+    journal.ack("first", "I_1")
+    journal.file.close()
+    with open(path, "a") as f:
+        f.write('{"op": "done", "step": "sec')
+    resumed = MutationJournal(path)
+    assert "Ignoring torn journal record" in capsys.readouterr().out
+    assert resumed.result("first") == "I_1"
+    resumed.ack("second", "I_2")
+    resumed.file.close()
+    # New records start on a line of their own
+    assert [record["step"] for record in read_records(path)] == ["first", "second"]
+
+def test_checkpoint_keeps_only_live_state(tmp_path):
+    path = str(tmp_path / "run.journal.jsonl")
+    journal = MutationJournal(path, checkpoint_every=3)
+    for index in range(3):
+        run_step(journal, f"step:{index}", lambda: f"I_{index}")
+    journal.intend("pending")
+    journal.file.close()
+    records = read_records(path)
+    # Three intents and three acks were compacted to the three results, then the new intent was appended
+    assert [record["op"] for record in records] == ["done", "done", "done", "intent"]
+    resumed = MutationJournal(path)
+    assert resumed.result("step:2") == "I_2"
+    assert resumed.was_interrupted("pending")
+
+def test_a_completed_run_removes_its_journal(tmp_path):
+    path = tmp_path / "run.journal.jsonl"
+    journal = MutationJournal(str(path))
+    run_step(journal, STEP, lambda: "I_1")
+    journal.close(completed=True)
+    assert not path.exists()
+
+def test_a_run_with_unacknowledged_steps_keeps_its_journal(tmp_path):
+    path = tmp_path / "run.journal.jsonl"
+    journal = MutationJournal(str(path))
+    journal.intend(STEP)
+    journal.close(completed=True)
+    assert path.exists()
@@ -0,0 +1,107 @@
+import os
+import random
+from search_index import SearchIndex, load_index, shared_index, tokenize
+
+# Metadata
+# File Name: test_search_index.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Check BM25 ranking, field weights, prefix matching, early termination and incremental updates of the task search index
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial ranking, prefix, threshold, update and persistence tests
+
+# Configuration
+WORDS = ["vps", "nginx", "dashboard", "dash", "plotly", "sync", "deploy", "ssl", "cron", "backup", "review", "inventory"]
+
+def build(docs):
+    index = SearchIndex()
+    for item_id, (title, body, labels) in docs.items():
+        index.upsert(item_id, title, body, labels, f"2026-10-{len(index) + 1:02d}T00:00:00Z")
+    return index
+
+def ids(results):
+    return [result["id"] for result in results]
+
+def test_title_matches_outrank_body_matches():
+    index = build({
+        "body": ("Server setup", "configure nginx here", []),
+        "title": ("Configure nginx", "server setup here", [])
+    })
+    assert ids(index.search("nginx")) == ["title", "body"]
+
+def test_rare_terms_count_for_more():
+    index = build({
+        "common": ("Deploy task", "", []),
+        "rare": ("Backup task", "", []),
+        "other": ("Deploy review", "", [])
+    })
+    # "task" is in two items and "backup" in one, so the item with both wins
+    assert ids(index.search("task backup"))[0] == "rare"
+
+def test_shorter_items_win_ties():
+    index = build({
+        "long": ("Sync board with many other words in the title", "", []),
+        "short": ("Sync board", "", [])
+    })
+    assert ids(index.search("sync")) == ["short", "long"]
+
+def test_last_word_matches_as_prefix_with_exact_matches_first():
+    index = build({
+        "exact": ("Build dash app", "", []),
+        "longer": ("Deploy dashboard", "", []),
+        "plural": ("Dashboards overview", "", []),
+        "none": ("Unrelated task", "", [])
+    })
+    results = index.search("dash")
+    assert ids(results)[0] == "exact"
+    assert set(ids(results)) == {"exact", "longer", "plural"}
+    assert results[0]["score"] > results[1]["score"]
+
+def test_only_the_last_word_expands():
+    index = build({"one": ("Deploy dashboard", "", []), "two": ("Dash deploy", "", [])})
+    assert ids(index.search("dash deploy")) == ["two", "one"]
+    assert ids(index.search("dash nothing")) == ["two"]
+
+def test_labels_are_searchable():
+    index = build({"labelled": ("Task", "", ["Section Three"]), "plain": ("Task", "", [])})
+    assert ids(index.search("three")) == ["labelled"]
+
+def test_early_termination_matches_a_full_ranking():
+    rng = random.Random(11)
+    docs = {f"I{n}": (" ".join(rng.choices(WORDS, k=rng.randint(2, 6))), " ".join(rng.choices(WORDS, k=rng.randint(0, 20))), []) for n in range(400)}
+    index = build(docs)
+    for query in ("dash", "vps nginx", "sync deploy backup", "inv"):
+        full = index.search(query, limit=len(docs))
+        assert [result["score"] for result in index.search(query, limit=10)] == [result["score"] for result in full[:10]]
+
+def test_updates_touch_only_the_changed_item():
+    index = build({"a": ("Configure nginx", "", []), "b": ("Deploy nginx", "", [])})
+    index.upsert("a", "Configure cron", "", [], "2026-10-20T00:00:00Z")
+    assert ids(index.search("nginx")) == ["b"]
+    assert ids(index.search("cron")) == ["a"]
+    assert index.updated_at("a") == "2026-10-20T00:00:00Z"
+    assert index.retain({"a"}) == 1
+    assert index.search("nginx") == []
+    assert "nginx" not in index.postings
+
+def test_empty_queries_and_indexes():
+    assert SearchIndex().search("nginx") == []
+    assert build({"a": ("Configure nginx", "", [])}).search("  ") == []
+    assert tokenize("Set-up NGINX, v1.14") == ["set", "up", "nginx", "v1", "14"]
+
+def test_saved_index_loads_and_reloads_after_a_sync(tmp_path):
+    path = str(tmp_path / "search_index.json.gz")
+    index = build({"a": ("Configure nginx", "body text", ["Section One"])})
+    index.save(path)
+    loaded = load_index(path)
+    assert loaded.search("nginx") == index.search("nginx")
+    assert shared_index(path) is shared_index(path)
+    first = shared_index(path)
+    index.upsert("b", "Deploy nginx", "", [], None)
+    index.save(path)
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1))
+    assert shared_index(path) is not first
+    assert len(shared_index(path)) == 2
+
+def test_missing_index_file_starts_empty(tmp_path):
+    assert len(load_index(str(tmp_path / "missing.json.gz"))) == 0
@@ -0,0 +1,94 @@
+import json
+import pytest
+import section_rules
+from section_rules import SectionRules, load_rules
+from board_model import ItemTable
+
+# Metadata
+# File Name: test_section_rules.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Check section rule precedence between labels and title keywords, keyword matching and the shipped section_rules.json
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial precedence, keyword, cache, config and classify_items agreement tests
+
+# Configuration
+SECTIONS = [
+    {"name": "One", "labels": ["Section One"], "keywords": ["VPS", "NGINX"]},
+    {"name": "Two", "labels": ["Section Two"], "keywords": ["Plotly"], "keywords_ignore_case": ["dashboard", "web"]},
+    {"name": "Three", "labels": ["Section Three"], "keywords": ["Section Three", "VPS"]}
+]
+
+@pytest.fixture
+def rules():
+    return SectionRules(SECTIONS)
+
+def test_highest_ranked_label_wins(rules):
+    assert rules.section_for("Task", ["Section Three", "Section Two"]) == 1
+    assert rules.section_for("Task", ["Section Three"]) == 2
+
+def test_higher_ranked_keyword_beats_a_label(rules):
+    assert rules.section_for("Harden the VPS", ["Section Two"]) == 0
+
+def test_higher_ranked_label_beats_a_keyword(rules):
+    assert rules.section_for("Plotly charts", ["Section One"]) == 0
+    assert rules.section_for("Section Three web page", ["Section Two"]) == 1
+
+def test_keywords_alone_assign_a_section(rules):
+    assert rules.section_for("Plotly charts", []) == 1
+    assert rules.section_for("Section Three planning and NGINX", []) == 0
+    assert rules.section_for("Nothing to see", ["Unknown label"]) is None
+
+def test_keyword_case(rules):
+    assert rules.section_for("set up vps", []) is None
+    assert rules.section_for("New DashBoard layout", []) == 1
+    assert rules.section_for("WEB server", []) == 1
+
+def test_keyword_shared_by_sections_goes_to_the_first(rules):
+    assert rules.keywords["VPS"] == 0
+    assert rules.match_title("VPS") == 0
+
+def test_overlapping_keywords_are_all_seen():
+    rules = SectionRules([
+        {"name": "Boards", "keywords": ["Dashboard"]},
+        {"name": "Dash", "keywords": ["Dash"]},
+        {"name": "Sync", "keywords": ["Dashboard sync"]}
+    ])
+    assert rules.match_title("Dashboard sync") == 0
+    assert rules.match_title("Dash sync") == 1
+
+def test_rules_without_keywords_match_labels_only():
+    rules = SectionRules([{"name": "Only", "labels": ["Only"]}])
+    assert rules.match_title("Anything") is None
+    assert rules.section_for("Anything", ["Only"]) == 0
+
+def test_title_cache_is_bounded(rules, monkeypatch):
+    monkeypatch.setattr(section_rules, "TITLE_CACHE_LIMIT", 2)
+    for title in ("VPS", "Plotly", "web", "none"):
+        rules.match_title(title)
+    assert len(rules.title_sections) <= 2
+
+def test_shipped_rules_load():
+    rules = load_rules()
+    assert rules.names == ["Section One: VPS Configuration", "Section Two: Dashboard Creation", "Section Three: TBD"]
+    assert rules.section_for("Configure NGINX and SSL for cyberpunkmonk.com", []) == 0
+
+def test_rules_file_needs_sections(tmp_path):
+    path = tmp_path / "section_rules.json"
+    path.write_text(json.dumps({"sections": []}))
+    with pytest.raises(RuntimeError):
+        load_rules(str(path))
+
+def test_classify_items_agrees_with_section_for(rules):
+    dashboard_data = pytest.importorskip("dashboard_data")
+    items = [
+        ("Harden the VPS", ["Section Two"]),
+        ("Plotly charts", ["Section One"]),
+        ("Section Three web page", []),
+        ("Nothing", ["Unknown"]),
+        ("Write docs", ["Section Three", "Section Two"])
+    ]
+    table = ItemTable().extend({"content": {"title": title, "labels": {"nodes": [{"name": label} for label in labels]}}} for title, labels in items)
+    _, task_data = dashboard_data.classify_items(table, rules)
+    expected = sorted((rules.section_for(title, labels), title) for title, labels in items if rules.section_for(title, labels) is not None)
+    assert sorted(zip(task_data["Section Name"], task_data["Task Title"])) == expected
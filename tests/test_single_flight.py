@@ -0,0 +1,227 @@
+import io
+import os
+import sys
+import stat
+import time
+import threading
+import subprocess
+import pytest
+import metrics
+import graphql_transport
+from contextlib import contextmanager
+from single_flight import SingleFlight, fcntl, remove_lock
+from graphql_transport import GraphQLTransport, RateLimitBudget, RATE_LIMIT_FIELDS
+from mock_github_graphql import MockGitHub, seed_store, start_in_thread, USERNAME
+from conftest import ROOT, TEST_TOKEN
+
+# Metadata
+# File Name: test_single_flight.py
+# Version: 1.1
+# Owner: Andrew John Holland
+# Purpose: Check that identical in-flight requests are coalesced between threads and processes, that errors reach every waiter and that no board data is left on disk
+# Change Log (Last 4):
+#   - Version 1.1, 19-10-2026: Directory ownership and mode checks, private body files and lock files replaced by a later flight
+#   - Version 1.0, 19-10-2026: Initial thread, stream, error, process, sweep and transport coalescing tests
+
+# Configuration
+WAITERS = 6
+LOGIN_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    login
+  }
+%s}
+""" % RATE_LIMIT_FIELDS
+# Each process waits for a shared start time after interpreter startup, so all of them ask while the first fetch is in flight
+PROCESS_SCRIPT = """
+import sys, time
+from single_flight import SingleFlight
+def fetch():
+    with open(sys.argv[2], "a") as f:
+        f.write("fetch\\n")
+    time.sleep(2.0)
+    return b"board"
+while time.time() < float(sys.argv[3]):
+    time.sleep(0.005)
+body, shared = SingleFlight(sys.argv[1]).run("board", fetch)
+print(body.decode(), shared)
+"""
+
+def run_together(count, target):
+    # target(position) runs in count threads released at once; returns each result or exception by position
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(position):
+        barrier.wait()
+        try:
+            results[position] = target(position)
+        except Exception as e:
+            results[position] = e
+
+    threads = [threading.Thread(target=worker, args=(position,)) for position in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    return results
+
+def slow_fetch(calls, body=b"page", delay=0.2):
+    def fetch():
+        calls.append(1)
+        time.sleep(delay)
+        return body
+    return fetch
+
+@contextmanager
+def opened(body):
+    yield body
+
+def test_threads_share_one_fetch(tmp_path):
+    flights = SingleFlight(str(tmp_path))
+    calls = []
+    coalesced = metrics.graphql_coalesced.value(scope="thread")
+    results = run_together(WAITERS, lambda position: flights.run("key", slow_fetch(calls)))
+    assert len(calls) == 1
+    assert sorted(results) == [(b"page", False)] + [(b"page", True)] * (WAITERS - 1)
+    assert metrics.graphql_coalesced.value(scope="thread") == coalesced + WAITERS - 1
+
+def test_different_keys_are_not_shared(tmp_path):
+    flights = SingleFlight(str(tmp_path))
+    calls = []
+    results = run_together(2, lambda position: flights.run(f"key-{position}", slow_fetch(calls)))
+    assert len(calls) == 2
+    assert results == [(b"page", False)] * 2
+
+def test_errors_reach_every_waiter_and_are_not_kept(tmp_path):
+    flights = SingleFlight(str(tmp_path))
+
+    def failing():
+        time.sleep(0.2)
+        raise ConnectionError("GitHub unreachable")
+
+    results = run_together(WAITERS, lambda position: flights.run("key", failing))
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert flights.run("key", lambda: b"page") == (b"page", False)
+
+def test_stream_leader_reads_as_the_response_arrives(tmp_path):
+    flights = SingleFlight(str(tmp_path))
+    leader_read = threading.Event()
+    chunks = iter([b'{"a":', b"1}"])
+
+    class Response(io.RawIOBase):
+        def read(self, size=-1):
+            return next(chunks, b"")
+
+    def leader():
+        with flights.stream("key", lambda: opened(Response())) as (body, shared):
+            first = body.read(5)
+            leader_read.set()
+            time.sleep(0.1)
+            # Stops early; the callers sharing the request still get the whole page
+            return first, shared
+
+    def follower():
+        leader_read.wait(5)
+        with flights.stream("key", lambda: opened(io.BytesIO(b"refetched"))) as (body, shared):
+            return body.read(), shared
+
+    assert run_together(2, lambda position: follower() if position else leader()) == [(b'{"a":', False), (b'{"a":1}', True)]
+
+def test_followers_get_the_body_when_the_leader_fails_after_reading_it(tmp_path):
+    flights = SingleFlight(str(tmp_path))
+    leader_read = threading.Event()
+
+    def leader():
+        with flights.stream("key", lambda: opened(io.BytesIO(b"page"))) as (body, _):
+            body.read()
+            leader_read.set()
+            time.sleep(0.2)
+            raise ValueError("leader could not use the page")
+
+    def follower():
+        leader_read.wait(5)
+        return flights.run("key", lambda: b"refetched")
+
+    results = run_together(2, lambda position: follower() if position else leader())
+    assert isinstance(results[0], ValueError)
+    assert results[1] == (b"page", True)
+
+@pytest.mark.skipif(fcntl is None, reason="processes only share requests where flock is available")
+def test_processes_share_one_fetch_and_leave_nothing_behind(tmp_path):
+    directory = str(tmp_path / "flights")
+    log = str(tmp_path / "fetches.log")
+    start_at = str(time.time() + 3.0)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(ROOT, "src", "section_one"), os.environ.get("PYTHONPATH", "")]))
+    processes = [subprocess.Popen([sys.executable, "-c", PROCESS_SCRIPT, directory, log, start_at], stdout=subprocess.PIPE, env=env, text=True) for _ in range(3)]
+    outputs = sorted(process.communicate(timeout=30)[0].strip() for process in processes)
+    assert outputs == ["board False", "board True", "board True"]
+    with open(log) as f:
+        assert f.read().count("fetch") == 1
+    assert os.listdir(directory) == []
+
+@pytest.mark.skipif(fcntl is None, reason="bodies are only written where flock is available")
+def test_sweep_removes_old_bodies_and_abandoned_locks(tmp_path):
+    flights = SingleFlight(str(tmp_path), ttl=30)
+    old = tmp_path / "old.json"
+    fresh = tmp_path / "fresh.json"
+    lock = tmp_path / "abandoned.json.lock"
+    for path in (old, fresh, lock):
+        path.write_bytes(b"{}")
+    os.utime(old, (time.time() - 60, time.time() - 60))
+    flights.sweep()
+    assert sorted(os.listdir(tmp_path)) == ["fresh.json"]
+
+@pytest.mark.skipif(fcntl is None, reason="bodies are only written where flock is available")
+def test_bodies_are_private_to_this_user(tmp_path):
+    directory = tmp_path / "flights"
+    flights = SingleFlight(str(directory))
+    with flights.process_lock("key") as (_, publish):
+        publish(b"board")
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(directory / "key.json").st_mode) == 0o600
+
+@pytest.mark.skipif(fcntl is None, reason="processes only share requests where flock is available")
+def test_a_directory_others_can_use_is_refused(tmp_path, capsys):
+    directory = tmp_path / "flights"
+    directory.mkdir(mode=0o755)
+    os.chmod(directory, 0o755)
+    flights = SingleFlight(str(directory))
+    assert flights.run("key", lambda: b"board") == (b"board", False)
+    assert os.listdir(directory) == []
+    assert "must be a directory owned by this user with mode 0700" in capsys.readouterr().out
+
+@pytest.mark.skipif(fcntl is None, reason="processes only share requests where flock is available")
+def test_a_symlinked_directory_is_refused(tmp_path):
+    target = tmp_path / "elsewhere"
+    target.mkdir(mode=0o700)
+    (tmp_path / "flights").symlink_to(target)
+    assert SingleFlight(str(tmp_path / "flights")).run("key", lambda: b"board") == (b"board", False)
+    assert os.listdir(target) == []
+
+@pytest.mark.skipif(fcntl is None, reason="processes only share requests where flock is available")
+def test_a_lock_file_created_by_a_later_flight_is_kept(tmp_path):
+    lock_path = str(tmp_path / "key.json.lock")
+    with open(lock_path, "a") as old_lock:
+        # The flight this process waited on removed the old file, and a later flight has created its own
+        os.remove(lock_path)
+        with open(lock_path, "a") as new_lock:
+            fcntl.flock(new_lock, fcntl.LOCK_EX)
+            remove_lock(old_lock, lock_path)
+            assert os.path.exists(lock_path)
+            remove_lock(new_lock, lock_path)
+    assert not os.path.exists(lock_path)
+
+def test_transport_charges_coalesced_queries_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(graphql_transport, "single_flight", SingleFlight(str(tmp_path)))
+    store = seed_store(MockGitHub(points_per_hour=10**7))
+    server, url = start_in_thread(port=0, store=store, latency_ms=200)
+    try:
+        transport = GraphQLTransport(TEST_TOKEN, url, RateLimitBudget(max_concurrent=WAITERS))
+        results = run_together(WAITERS, lambda position: transport.execute(LOGIN_QUERY, {"login": USERNAME}))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert all(result["data"]["user"]["login"] == USERNAME for result in results)
+    assert transport.budget.requests == 1
+    assert store.points_per_hour - store.remaining == results[0]["data"]["rateLimit"]["cost"]
@@ -0,0 +1,72 @@
+import os
+import time
+import importlib.util
+import pytest
+from graphql_transport import RateLimitBudget
+from mock_github_graphql import USERNAME
+from conftest import ROOT, TEST_TOKEN
+
+# Metadata
+# File Name: test_sync_dashboard.py
+# Version: 1.0
+# Owner: Andrew John Holland
+# Purpose: Check that the sync daemon speeds up while the board changes, backs off while it is idle or failing, never outruns the rate budget, and reports changes from a sync against the mock
+# Change Log (Last 4):
+#   - Version 1.0, 19-10-2026: Initial next_interval and sync_once tests
+
+# Configuration
+SYNC_SCRIPT = os.path.join(ROOT, "src", "section_one", "sync_dashboard_v1.11.py")
+BOARD_PROJECT_ID = "PVT_kwHOCZq5ps4A-gX5"
+
+@pytest.fixture
+def sync(tmp_path, monkeypatch):
+    # The versioned file name is not importable by name; the snapshot, search index, sync status and log are written to the working directory
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location("sync_dashboard", SYNC_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def budget(remaining=None, reset_in=None):
+    budget = RateLimitBudget()
+    budget.remaining = remaining
+    budget.reset_at = time.time() + reset_in if reset_in is not None else None
+    return budget
+
+def test_a_changing_board_halves_the_interval_down_to_the_minimum(sync):
+    assert sync.next_interval(4 * sync.MIN_INTERVAL, True, budget(), 10) == 2 * sync.MIN_INTERVAL
+    assert sync.next_interval(1.5 * sync.MIN_INTERVAL, True, budget(), 10) == sync.MIN_INTERVAL
+
+def test_an_idle_or_failing_board_backs_off_up_to_the_maximum(sync):
+    assert sync.next_interval(sync.MIN_INTERVAL, False, budget(), 10) == 1.5 * sync.MIN_INTERVAL
+    assert sync.next_interval(sync.MIN_INTERVAL, None, budget(), 0) == 2 * sync.MIN_INTERVAL
+    assert sync.next_interval(0.9 * sync.MAX_INTERVAL, False, budget(), 10) == sync.MAX_INTERVAL
+    assert sync.next_interval(0.9 * sync.MAX_INTERVAL, None, budget(), 10) == sync.MAX_INTERVAL
+
+def test_the_rate_budget_sets_a_floor(sync):
+    # 100 points to spare over the reserve and 50 per sync: two syncs fit before the reset
+    interval = sync.next_interval(sync.MIN_INTERVAL, True, budget(sync.RATE_RESERVE + 100, 1000), 50)
+    assert interval == pytest.approx(500, rel=0.01)
+    # A budget with room to spare leaves the interval alone
+    assert sync.next_interval(2 * sync.MIN_INTERVAL, True, budget(sync.RATE_RESERVE + 10**6, 1000), 50) == sync.MIN_INTERVAL
+
+def test_an_exhausted_budget_waits_for_the_reset(sync):
+    # Past the maximum interval too: no sync fits before the window resets
+    interval = sync.next_interval(sync.MIN_INTERVAL, False, budget(sync.RATE_RESERVE + 10, 2 * sync.MAX_INTERVAL), 50)
+    assert interval == pytest.approx(2 * sync.MAX_INTERVAL, rel=0.01)
+    assert sync.next_interval(sync.MIN_INTERVAL, False, budget(sync.RATE_RESERVE - 500, 2 * sync.MAX_INTERVAL), 50) == pytest.approx(2 * sync.MAX_INTERVAL, rel=0.01)
+
+def test_an_unknown_budget_or_a_free_sync_is_not_limited(sync):
+    assert sync.next_interval(sync.MIN_INTERVAL, False, budget(sync.RATE_RESERVE + 10), 50) == 1.5 * sync.MIN_INTERVAL
+    assert sync.next_interval(sync.MIN_INTERVAL, False, budget(sync.RATE_RESERVE + 10, 1000), 0) == 1.5 * sync.MIN_INTERVAL
+
+def test_sync_once_reports_whether_the_board_changed(sync, mock_github, transport, monkeypatch):
+    store = mock_github[0]
+    monkeypatch.setattr(sync, "TOKEN", TEST_TOKEN)
+    assert sync.sync_once(transport) is True
+    assert transport.budget.remaining is not None and transport.budget.reset_at
+    assert sync.sync_once(transport) is False
+    store.add_item(store.nodes[BOARD_PROJECT_ID], store.add_issue(store.add_repository(USERNAME, "project-dashboards"), "Added after the last sync"))
+    assert sync.sync_once(transport) is True
+    monkeypatch.setattr(sync, "TOKEN", None)
+    assert sync.sync_once() is None
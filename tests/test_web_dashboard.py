@@ -0,0 +1,163 @@
+import os
+import csv
+import gzip
+import threading
+import importlib.util
+import pytest
+import search_index
+from snapshot import write_snapshot
+from conftest import ROOT
+
+pytest.importorskip("pandas")
+pytest.importorskip("dash")
+
+# Metadata
+# File Name: test_web_dashboard.py
+# Version: 1.2
+# Owner: Andrew John Holland
+# Purpose: Request the dashboard's Flask routes through a test client to check task exports revalidate with ETag and Last-Modified and are gzipped on request, that a warming worker turns requests away, and that the dashboard says so when it has no live data
+# Change Log (Last 4):
+#   - Version 1.2, 19-10-2026: /ready and request gate tests during a slow warm start
+#   - Version 1.1, 19-10-2026: Degraded mode tests with no token, with and without a snapshot
+#   - Version 1.0, 19-10-2026: Initial export format, ETag, Last-Modified, gzip and missing snapshot tests; skipped without pandas or dash
+
+# Configuration
+DASHBOARD_SCRIPT = os.path.join(ROOT, "src", "section_two", "web_dashboard_v1.15.py")
+SNAPSHOT_NAME = "board_snapshot.jsonl.gz"
+NO_TOKEN = "GITHUB_TOKEN is not set"
+
+@pytest.fixture
+def load_dashboard(tmp_path, monkeypatch):
+    # Snapshots, the search index and the log are relative to the working directory; the token and gate wait are read at import
+    def load(ready_wait="10"):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setenv("READY_WAIT", ready_wait)
+        spec = importlib.util.spec_from_file_location("web_dashboard", DASHBOARD_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        monkeypatch.setattr(module, "SNAPSHOT_FILE", str(tmp_path / SNAPSHOT_NAME))
+        return module
+    return load
+
+@pytest.fixture
+def dashboard(load_dashboard):
+    module = load_dashboard()
+    assert module.ready.wait(10)
+    return module
+
+@pytest.fixture
+def client(dashboard):
+    return dashboard.app.server.test_client()
+
+@pytest.fixture
+def snapshot(tmp_path, board_items):
+    return write_snapshot(board_items[1], board_items[0], str(tmp_path / SNAPSHOT_NAME))
+
+def test_exports_carry_validators(client, snapshot):
+    response = client.get("/export/tasks.csv")
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert response.headers["ETag"] == f'"{snapshot["sha256"][:32]}-csv"'
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.last_modified is not None
+    rows = list(csv.reader(response.get_data(as_text=True).splitlines()))
+    assert rows[0][:3] == ["ID", "Section Name", "Task Title"]
+    assert len(rows) > 1
+
+def test_a_matching_etag_gets_304(client, snapshot):
+    etag = client.get("/export/tasks.jsonl").headers["ETag"]
+    response = client.get("/export/tasks.jsonl", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert response.headers["ETag"] == etag
+    # Each format is its own representation
+    assert client.get("/export/tasks.csv", headers={"If-None-Match": etag}).status_code == 200
+
+def test_an_unchanged_last_modified_gets_304(client, snapshot):
+    last_modified = client.get("/export/tasks.csv").headers["Last-Modified"]
+    assert client.get("/export/tasks.csv", headers={"If-Modified-Since": last_modified}).status_code == 304
+    # If-None-Match takes precedence when both are sent
+    assert client.get("/export/tasks.csv", headers={"If-Modified-Since": last_modified, "If-None-Match": '"stale"'}).status_code == 200
+
+def test_a_new_snapshot_changes_the_etag(client, snapshot, board_items, tmp_path):
+    etag = client.get("/export/tasks.csv").headers["ETag"]
+    write_snapshot(board_items[1][:5], board_items[0], str(tmp_path / SNAPSHOT_NAME))
+    response = client.get("/export/tasks.csv", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+def test_gzip_exports(client, snapshot):
+    plain = client.get("/export/tasks.jsonl")
+    response = client.get("/export/tasks.jsonl", headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+    assert gzip.decompress(response.get_data()) == plain.get_data()
+    assert client.get("/export/tasks.jsonl", headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]}).status_code == 304
+
+def test_arrow_export(client, snapshot):
+    pa = pytest.importorskip("pyarrow")
+    response = client.get("/export/tasks.arrow")
+    assert response.status_code == 200
+    assert pa.ipc.open_stream(response.get_data()).read_all().num_rows == len(client.get("/export/tasks.jsonl").get_data().splitlines())
+
+def test_unknown_formats_and_missing_snapshots(client):
+    assert client.get("/export/tasks.xlsx").status_code == 404
+    response = client.get("/export/tasks.csv")
+    assert response.status_code == 503
+    assert "No snapshot yet" in response.get_data(as_text=True)
+
+def test_no_token_and_no_snapshot_shows_an_empty_board_and_says_why(dashboard, client):
+    status = client.get("/ready").get_json()
+    assert status["ready"] is True
+    assert status["live"] is False and status["items"] == 0 and status["error"] == NO_TOKEN
+    figure, rows, banner, style = dashboard.update_dashboard(0)
+    assert banner == f"GitHub is unavailable ({NO_TOKEN}) and no snapshot exists yet"
+    assert style == dashboard.BANNER_STYLE
+    assert rows == []
+
+def test_no_token_shows_the_snapshot_with_its_age(dashboard, snapshot, monkeypatch):
+    # A snapshot no sync has confirmed within SNAPSHOT_MAX_AGE is served as old data
+    monkeypatch.setattr(dashboard.board_source, "max_age", 0)
+    figure, rows, banner, style = dashboard.update_dashboard(0)
+    assert banner.startswith("Showing data as of ")
+    assert banner.endswith(f"GitHub is unavailable ({NO_TOKEN})")
+    assert style == dashboard.BANNER_STYLE
+    assert len(rows) > 0
+
+def test_a_fresh_snapshot_needs_no_banner(dashboard, snapshot):
+    figure, rows, banner, style = dashboard.update_dashboard(0)
+    assert banner == ""
+    assert style == {"display": "none"}
+    assert len(rows) > 0
+
+def test_requests_are_gated_until_the_warm_start_finishes(load_dashboard, monkeypatch):
+    # The search index is the warm start's last step; hold it until the gate has been checked
+    release = threading.Event()
+    index = search_index.shared_index
+
+    def slow_index(*args, **kwargs):
+        release.wait(10)
+        return index(*args, **kwargs)
+
+    monkeypatch.setattr(search_index, "shared_index", slow_index)
+    module = load_dashboard(ready_wait="0.2")
+    client = module.app.server.test_client()
+    try:
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.get_json()["ready"] is False
+        response = client.get("/")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(module.RETRY_AFTER)
+        # The probes are never gated
+        assert client.get("/metrics").status_code == 200
+    finally:
+        release.set()
+    assert module.ready.wait(10)
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.get_json()["ready"] is True
+    assert response.get_json()["seconds"] is not None
+    assert client.get("/").status_code == 200